@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Record hashing and ledger encoding on large nested content_deltas.
+
+Compares the original hash_record (json.dumps of {"obj", "prev"} per call) and
+the original two-serialization Ledger encode against the canonical fast path.
+
+    python -m benchmarks.bench_hash --records 2000 --width 40 --depth 3
+"""
+import argparse, hashlib, json, os, random, tempfile, time
+from logos_engine.types import hash_record
+from logos_engine.store import Ledger
+
+
+def original_hash(obj, prev):
+    payload = json.dumps({"obj": obj, "prev": prev}, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def original_encode(obj, prev, seq):
+    h = original_hash(obj, prev)
+    rec = {"ts": time.time(), "seq": seq, "hash": h, "prev": prev, "obj": obj}
+    return h, (json.dumps(rec) + "\n").encode("utf-8")
+
+
+def nested(rnd, width, depth):
+    if depth == 0:
+        return rnd.choice([rnd.random(), rnd.randrange(10**6), "text-%d ✓" % rnd.randrange(1000), None, True])
+    return {f"k{rnd.randrange(10**4)}": nested(rnd, width, depth - 1) for _ in range(width)}
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark canonical record hashing")
+    ap.add_argument("--records", type=int, default=2000)
+    ap.add_argument("--width", type=int, default=20)
+    ap.add_argument("--depth", type=int, default=2)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    rnd = random.Random(0)
+    objs = [{"id": f"A-{i}", "parent_ids": ["R-1"], "content_delta": nested(rnd, args.width, args.depth)}
+            for i in range(args.records)]
+    prevs = [None] + [hashlib.sha256(str(i).encode()).hexdigest() for i in range(args.records - 1)]
+    assert all(original_hash(o, p) == hash_record(o, p) for o, p in zip(objs, prevs)), "hashes differ"
+
+    with tempfile.TemporaryDirectory() as d:
+        ledger = Ledger(os.path.join(d, "ledger.jsonl"))
+        rows = [
+            ("hash_record (original)", lambda: [original_hash(o, p) for o, p in zip(objs, prevs)]),
+            ("hash_record (canonical)", lambda: [hash_record(o, p) for o, p in zip(objs, prevs)]),
+            ("encode (original)", lambda: [original_encode(o, p, i) for i, (o, p) in enumerate(zip(objs, prevs))]),
+            ("encode (canonical)", lambda: [ledger._encode(o, p, i) for i, (o, p) in enumerate(zip(objs, prevs))]),
+        ]
+        for label, fn in rows:
+            dt = best_of(fn, args.repeat)
+            print(f"{label:<24} {args.records / dt:>10,.0f} rec/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Intent extraction on multi-KB completions: original if/elif extractor vs the compiled lexicon.
+
+    python -m benchmarks.bench_intent --kb 8 --docs 200
+"""
+import argparse, hashlib, random, time
+from llm_adapter.postprocess import _extract_naive_intent
+
+WORDS = ["the", "amendment", "rule", "ledger", "Summary", "label", "roadmap", "extract", "plan",
+         "gate", "coherence", "\tparent", "status\n", "facts", "pull", "out", "ok."]
+
+
+def original(text):
+    # The extractor as it was before the lexicon: one `in` per keyword, split(), separate encode.
+    t = text.strip().lower()
+    args = {}
+    if "summarize" in t or "summary" in t:
+        intent = "summarize"
+    elif "classify" in t or "label" in t:
+        intent = "classify"
+    elif "extract" in t or "pull out" in t:
+        intent = "extract"
+    elif "plan" in t or "roadmap" in t:
+        intent = "plan"
+    else:
+        intent = "unknown"
+    args["tokens"] = len(t.split())
+    args["hash"] = hashlib.sha256(t.encode("utf-8")).hexdigest()[:12]
+    return {"intent": intent, "arguments": args}
+
+
+def make_docs(n, kb, seed=0):
+    rnd = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        parts, size = [], 0
+        while size < kb * 1024:
+            w = rnd.choice(WORDS)
+            parts.append(w)
+            size += len(w) + 1
+        docs.append(" ".join(parts))
+    return docs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark _extract_naive_intent")
+    ap.add_argument("--docs", type=int, default=200)
+    ap.add_argument("--kb", type=float, default=8.0)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    docs = make_docs(args.docs, args.kb)
+    assert all(original(d) == _extract_naive_intent(d) for d in docs), "extractors disagree"
+
+    for label, fn in (("original", original), ("lexicon", _extract_naive_intent)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            for d in docs:
+                fn(d)
+            best = min(best, time.perf_counter() - t0)
+        mb = args.docs * args.kb / 1024
+        print(f"{label:<9} {best / args.docs * 1e6:>8.1f} us/doc  {mb / best:>7.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
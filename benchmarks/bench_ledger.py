@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Ledger write throughput under each durability policy, chain verification and audit lookups.
+
+    python -m benchmarks.bench_ledger --records 20000 --batch 500
+"""
+import argparse, os, tempfile, time
+from logos_engine.store import Ledger, FSYNC_POLICIES
+
+
+def make_obj(i: int):
+    return {"amendment": {"id": f"A-{i}", "parent_ids": ["R-1"], "content_delta": {"effect": "x" * 64}},
+            "metrics": {"C": 0.9, "TR": 0.9, "BR": 0.1}}
+
+
+def bench(label: str, n: int, write) -> None:
+    t0 = time.perf_counter()
+    write(n)
+    dt = time.perf_counter() - t0
+    print(f"{label:<28} {n / dt:>12,.0f} records/s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark Ledger append throughput")
+    ap.add_argument("--records", type=int, default=20000)
+    ap.add_argument("--batch", type=int, default=500)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        for policy in FSYNC_POLICIES:
+            # per-record fsync is slow; keep its run short
+            n = min(args.records, 2000) if policy == "record" else args.records
+            with Ledger(os.path.join(d, f"single-{policy}.jsonl"), fsync=policy) as ledger:
+                bench(f"append   fsync={policy}", n, lambda n: [ledger.append(make_obj(i)) for i in range(n)])
+            with Ledger(os.path.join(d, f"batch-{policy}.jsonl"), fsync=policy) as ledger:
+                def write(n):
+                    with ledger.transaction(group_size=args.batch) as tx:
+                        for i in range(n):
+                            tx.append(make_obj(i))
+                bench(f"batched  fsync={policy}", n, write)
+
+        with Ledger(os.path.join(d, "batch-none.jsonl")) as ledger:
+            for workers in (1, os.cpu_count() or 1):
+                ok, m = ledger.verify(workers=workers, min_range_bytes=64 << 10)
+                print(f"verify   workers={workers:<14} {m['records_per_sec']:>12,.0f} records/s  ({m['mb_per_sec']:.1f} MB/s, ok={ok})")
+
+            t0 = time.perf_counter()
+            ledger.rebuild_index()
+            print(f"index    rebuild              {args.records / (time.perf_counter() - t0):>12,.0f} records/s")
+            for label, query in (("find     amendment_id", {"amendment_id": f"A-{args.records // 2}"}),
+                                 ("scan     records()", None)):
+                t0 = time.perf_counter()
+                if query is None:
+                    hits = [r for r in ledger.records() if r["obj"]["amendment"]["id"] == f"A-{args.records // 2}"]
+                else:
+                    hits = ledger.find(**query)
+                print(f"{label:<29}{(time.perf_counter() - t0) * 1000:>12.2f} ms  ({len(hits)} hit)")
+
+
+if __name__ == "__main__":
+    main()
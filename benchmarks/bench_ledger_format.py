@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""JSONL vs binary ledger records: size on disk, verify, replay and tail reads.
+
+    python -m benchmarks.bench_ledger_format --records 50000
+"""
+import argparse, os, tempfile, time
+from logos_engine.store import Ledger, convert_ledger
+from benchmarks.bench_ledger import make_obj
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare ledger record formats")
+    ap.add_argument("--records", type=int, default=50000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        src = os.path.join(d, "ledger.jsonl")
+        with Ledger(src) as ledger:
+            with ledger.transaction(group_size=1000) as tx:
+                for i in range(args.records):
+                    tx.append(make_obj(i))
+        paths = {"jsonl": src}
+        for label, compress in (("binary", False), ("binary+zlib", True)):
+            paths[label] = os.path.join(d, label)
+            convert_ledger(src, paths[label], "binary", compress_payload=compress)
+
+        print(f"{'format':<12} {'MB':>8} {'verify rec/s':>14} {'replay rec/s':>14} {'tail read us':>14}")
+        for label, path in paths.items():
+            ledger = Ledger(path)
+            ok, m = ledger.verify(workers=1)
+            replay, n = timed(lambda: sum(1 for _ in ledger.records()))
+            tail, _ = timed(lambda: [ledger._load_head() for _ in range(1000)])
+            print(f"{label:<12} {os.path.getsize(path) / (1 << 20):>8.1f} {m['records_per_sec']:>14,.0f} "
+                  f"{n / replay:>14,.0f} {tail * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""OpenAIClient throughput against the local stub server, with and without pooling.
+
+    python -m benchmarks.bench_openai_stub --requests 500 --latency-ms 2
+"""
+import argparse, time
+from concurrent.futures import ThreadPoolExecutor
+from llm_adapter.openai_client import OpenAIClient
+from llm_adapter.stub_server import StubServer
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark OpenAIClient against the stub server")
+    ap.add_argument("--requests", type=int, default=500)
+    ap.add_argument("--threads", type=int, default=8)
+    ap.add_argument("--latency-ms", type=float, default=2.0)
+    ap.add_argument("--fail-first", type=int, default=0, help="Inject this many initial 503s")
+    args = ap.parse_args()
+
+    for label, keepalive in (("pooled", 20), ("no keep-alive", 0)):
+        with StubServer(latency_s=args.latency_ms / 1000.0, fail_first=args.fail_first) as stub:
+            client = OpenAIClient(api_key="stub", base_url=stub.base_url, backoff_base_s=0.01,
+                                  max_keepalive_connections=keepalive, share_transport=False)
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(args.threads) as pool:
+                list(pool.map(lambda i: client.complete("stub", f"p{i}"), range(args.requests)))
+            dt = time.perf_counter() - t0
+            print(f"{label:<14} {args.requests / dt:>8,.0f} req/s  connections={stub.connections:<5} "
+                  f"requests={stub.requests} retries={client.retries}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,24 @@ Exported helpers let you create/register adapters that conform to the
 """
 
 from .adapters import simple_adapter_factory, simple_adapter
-from .postprocess import interpretations_to_entropy, normalize_and_fuse
+from .postprocess import interpretations_to_entropy, normalize_and_fuse, Fuser, IntentLexicon
 from .types import AdapterType
 from .orchestrator import Orchestrator
+from .coalesce import CoalescingClient
+from .cache import CachingClient
+from .cluster import NearDuplicateClusterer, cluster_labels
 
 __all__ = [
 	"simple_adapter_factory",
 	"simple_adapter",
 	"interpretations_to_entropy",
 	"normalize_and_fuse",
+	"Fuser",
+	"IntentLexicon",
 	"AdapterType",
 	"Orchestrator",
+	"CoalescingClient",
+	"CachingClient",
+	"NearDuplicateClusterer",
+	"cluster_labels",
 ]
@@ -1,17 +1,148 @@
-from typing import Dict, Any, List, Callable, Sequence, Optional
+from typing import Dict, Any, List, Callable, Sequence, Optional, Set
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+import queue, threading, time
 from .types import AdapterType
-from .postprocess import interpretations_to_entropy
+from .postprocess import interpretations_to_entropy, adaptive_interpretations_entropy
 from .openai_client import OpenAIClient
 
-def simple_adapter_factory(model_callables: Sequence[Callable[[str], str]], num_models: Optional[int] = None) -> AdapterType:
+class _MemberPool:
+    """Long-lived pool of daemon threads running member calls.
+
+    One pool is owned by each adapter, so `workers` bounds the live calls
+    across all adapter calls. A call given up on with `abandon` stops
+    counting: its thread is retired (it exits once the member returns) and
+    a replacement is started, so hung members never starve later calls.
+    Threads are daemons and never block interpreter exit.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._live = 0
+        self._running: Dict[Future, threading.Thread] = {}
+        self._retired: Set[threading.Thread] = set()
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> None:
+        # caller holds the lock
+        threading.Thread(target=self._run, daemon=True).start()
+        self._live += 1
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._live < self.workers:
+                self._spawn()
+        fut: Future = Future()
+        self._queue.put((fut, fn, args))
+        return fut
+
+    def abandon(self, fut: Future) -> None:
+        """Cancel `fut` if still queued; if running, retire its thread and replace it."""
+        if fut.cancel():
+            return
+        with self._lock:
+            thread = self._running.pop(fut, None)
+            if thread is not None:
+                self._retired.add(thread)
+                self._live -= 1
+                self._spawn()
+
+    def _run(self) -> None:
+        me = threading.current_thread()
+        while True:
+            fut, fn, args = self._queue.get()
+            with self._lock:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                self._running[fut] = me
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as e:
+                fut.set_exception(e)
+            with self._lock:
+                self._running.pop(fut, None)
+                if me in self._retired:
+                    self._retired.discard(me)
+                    return
+
+
+def _query_concurrently(members: Sequence[Callable[[str], str]], prompt: str, pool: _MemberPool,
+                        member_timeout_s: Optional[float], deadline: Optional[float]) -> List[str]:
+    """Fan `prompt` out to `members` on `pool`.
+
+    Members that raise, exceed `member_timeout_s` (measured from when they
+    start running) or are unfinished at `deadline` (a `time.monotonic()`
+    value) yield "error". Late results are discarded: queued members not
+    yet started are cancelled and hung ones are abandoned on the pool.
+    """
+    results = ["error"] * len(members)
+    started: Dict[int, float] = {}
+
+    def run(i: int) -> str:
+        started[i] = time.monotonic()
+        return members[i](prompt)
+
+    futures = {pool.submit(run, i): i for i in range(len(members))}
+    pending = set(futures)
+    try:
+        while pending:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+            if member_timeout_s is not None:
+                expired = {f for f in pending if futures[f] in started and now - started[futures[f]] >= member_timeout_s}
+                for f in expired:
+                    pool.abandon(f)
+                pending -= expired
+                if not pending:
+                    break
+            wakes = [deadline - now] if deadline is not None else []
+            if member_timeout_s is not None:
+                wakes += [started[futures[f]] + member_timeout_s - now for f in pending if futures[f] in started]
+                wakes = wakes or [member_timeout_s]
+            done, pending = wait(pending, timeout=max(0.0, min(wakes)) if wakes else None, return_when=FIRST_COMPLETED)
+            for f in done:
+                try:
+                    results[futures[f]] = f.result()
+                except Exception:
+                    pass
+    finally:
+        for f in pending:
+            pool.abandon(f)
+    return results
+
+
+def simple_adapter_factory(model_callables: Sequence[Callable[[str], str]], num_models: Optional[int] = None,
+                           concurrent: bool = False, max_in_flight: Optional[int] = None,
+                           member_timeout_s: Optional[float] = None, overall_timeout_s: Optional[float] = None,
+                           adaptive: bool = False, coherence_threshold: Optional[float] = None,
+                           tolerance: Optional[float] = None, min_samples: int = 3, wave_size: int = 2,
+                           similarity_threshold: Optional[float] = None) -> AdapterType:
     """Create an adapter that queries a sequence of model_callables.
 
     Each callable should accept a string prompt and return a short interpretation string.
     The returned adapter matches logos_engine.se.SEAdapter: (amendment, rules) -> float
     If num_models is None, it defaults to the length of model_callables.
+
+    With `concurrent=True` members are queried in parallel on a daemon thread
+    pool owned by the adapter, with at most `max_in_flight` live member calls
+    across all calls to it (default: one per member), so latency
+    tracks the slowest member instead of the sum. Setting either timeout
+    implies concurrent mode; timed-out members count as an "error" answer,
+    exactly like members that raise. Abandoned members never block exit.
+
+    With `adaptive=True` members are asked in waves (`min_samples` first, then
+    `wave_size` at a time) and querying stops once the accept/reject bucket at
+    `coherence_threshold` or the entropy within `tolerance` is settled;
+    `overall_timeout_s` bounds all waves together. The adapter's `stats` dict accumulates the `calls` made and `skipped`.
+
+    With `similarity_threshold` set, near-duplicate answers are clustered
+    (MinHash LSH, see llm_adapter.cluster) before the entropy is computed.
     """
     if num_models is None:
         num_models = len(model_callables)
+    concurrent = concurrent or member_timeout_s is not None or overall_timeout_s is not None
+    pool = _MemberPool(max_in_flight or min(num_models, len(model_callables))) if concurrent else None
 
     def adapter(amendment: Dict[str, Any], rules: List[Dict[str, Any]]) -> float:
         facts = []
@@ -19,16 +150,33 @@ def simple_adapter_factory(model_callables: Sequence[Callable[[str], str]], num_
             facts.append(f"{k}:{str(v).strip()}")
         prompt = "\n".join(facts) or "noop"
 
-        interpretations: List[str] = []
-        for i in range(min(num_models, len(model_callables))):
-            try:
-                resp = model_callables[i](prompt)
-            except Exception:
-                resp = "error"
-            interpretations.append(resp)
+        members = list(model_callables[:min(num_models, len(model_callables))])
+        # one deadline for the whole call, shared by every adaptive wave
+        deadline = time.monotonic() + overall_timeout_s if overall_timeout_s is not None else None
+
+        def ask_wave(indices: List[int]) -> List[str]:
+            wave = [members[i] for i in indices]
+            if concurrent:
+                return _query_concurrently(wave, prompt, pool, member_timeout_s, deadline)
+            out = []
+            for member in wave:
+                try:
+                    out.append(member(prompt))
+                except Exception:
+                    out.append("error")
+            return out
 
-        return interpretations_to_entropy(interpretations)
+        if adaptive:
+            score, report = adaptive_interpretations_entropy(ask_wave, len(members), coherence_threshold,
+                                                             tolerance, min_samples, wave_size, similarity_threshold)
+            adapter.stats["calls"] += report["calls"]
+            adapter.stats["skipped"] += report["skipped"]
+            return score
 
+        interpretations = ask_wave(list(range(len(members)))) if members else []
+        return interpretations_to_entropy(interpretations, similarity_threshold)
+
+    adapter.stats = {"calls": 0, "skipped": 0}
     return adapter
 
 
@@ -48,6 +196,3 @@ def simple_adapter(amendment: Dict[str, Any], rules: List[Dict[str, Any]]) -> fl
 
 # Alias for backwards compatibility
 make_ensemble_adapter = simple_adapter_factory
-
-- from .openai_client import OpenAIClient
-+ from .clients.openai_client import OpenAIClient
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""Persistent completion cache for ModelClients.
+
+`CachingClient` wraps any ModelClient (OpenAIClient, a MockClient, or the
+entries of `clients.make_default_clients()`) and stores (output, meta) in a
+local SQLite file keyed on model + prompt + normalized params. Only
+deterministic requests (temperature 0) are cached unless
+`deterministic_only=False`. Entries expire after `ttl_s`, the least recently
+used are evicted beyond `max_entries`, and `bypass=True` (on the wrapper, or
+`cache_bypass=True` per call) always goes upstream and refreshes the entry.
+
+Hits do not write: their recency is buffered and flushed with the next
+store (before eviction), every `_TOUCH_BATCH` hits, and on `close()`.
+Eviction is batched by `logos_engine.row_cap`, so a miss costs an insert
+rather than an index walk.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+import copy
+import json
+import sqlite3
+import threading
+import time
+from .coalesce import request_key, is_deterministic
+from .types import ModelClient
+from logos_engine.row_cap import RowCap
+
+_TOUCH_BATCH = 256
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop unset params and canonicalize numbers so equivalent calls share a key."""
+    out: Dict[str, Any] = {}
+    for k, v in params.items():
+        if v is None:
+            continue
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            v = float(v)
+        out[k] = v
+    return out
+
+
+class CachingClient:
+    def __init__(self, client: ModelClient, db_path: str = ":memory:", max_entries: int = 100000,
+                 ttl_s: Optional[float] = None, bypass: bool = False, deterministic_only: bool = True) -> None:
+        self.client = client
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.bypass = bypass
+        self.deterministic_only = deterministic_only
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, output TEXT NOT NULL, "
+                         "meta TEXT NOT NULL, created REAL NOT NULL, used REAL NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS completions_used ON completions (used)")
+        self._db.commit()
+        self._cap = RowCap(self._db, "completions", "key", "used", max_entries)
+        self._touched: Dict[str, float] = {}
+
+    def _lookup(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT output, meta, created FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl_s is not None and now - row[2] >= self.ttl_s):
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touches()
+                self._db.commit()
+        return row[0], json.loads(row[1])
+
+    def _flush_touches(self) -> None:
+        # Write buffered hit times back; `_store` does this before evicting,
+        # so recency is current whenever rows are chosen for deletion.
+        if self._touched:
+            self._db.executemany("UPDATE completions SET used = ? WHERE key = ?",
+                                 [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+
+    def _store(self, key: str, output: str, meta: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._flush_touches()
+            self._touched.pop(key, None)
+            self._cap.before_upsert(key)
+            self._db.execute("INSERT OR REPLACE INTO completions (key, output, meta, created, used) VALUES (?, ?, ?, ?, ?)",
+                             (key, output, json.dumps(meta or {}, default=str), now, now))
+            self._cap.trim()
+            self._db.commit()
+
+    def complete(self, model: str, prompt: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
+        bypass = kwargs.pop("cache_bypass", False) or self.bypass
+        if self.deterministic_only and not is_deterministic(kwargs):
+            return self.client.complete(model, prompt, **kwargs)
+        key = request_key(model, prompt, normalize_params(kwargs))
+        if not bypass:
+            hit = self._lookup(key)
+            if hit is not None:
+                self.hits += 1
+                return hit[0], dict(hit[1], cached=True)
+        self.misses += 1
+        output, meta = self.client.complete(model, prompt, **kwargs)
+        self._store(key, output, meta)
+        return output, meta
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    def share(self, client: ModelClient) -> "CachingClient":
+        """Wrap `client` over this cache's store and settings (own hit/miss counters).
+
+        Keys include the model name, so clients can share a store safely;
+        closing any of the wrappers closes it for all.
+        """
+        other = copy.copy(self)
+        other.client = client
+        other.hits = other.misses = 0
+        return other
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._db.commit()
+        self._db.close()
+
+
+def cached_clients(clients: Dict[str, ModelClient], **options: Any) -> Dict[str, ModelClient]:
+    """Wrap every client of a registry (e.g. `make_default_clients()`) over one shared cache store."""
+    shared: Optional[CachingClient] = None
+    out: Dict[str, ModelClient] = {}
+    for key, client in clients.items():
+        shared = CachingClient(client, **options) if shared is None else shared.share(client)
+        out[key] = shared
+    return out
@@ -0,0 +1,115 @@
+"""Near-duplicate clustering of interpretation strings (MinHash LSH).
+
+Ensemble members often return the same interpretation with different
+whitespace, casing or small wording changes. Bucketing by exact string
+equality counts those as disagreement and inflates entropy. The
+`NearDuplicateClusterer` here groups them in near-linear time instead:
+
+1. Text is normalized (lowercase, whitespace collapsed). Identical normalized
+   strings share a cluster without further work.
+2. Otherwise the character k-shingles get a MinHash signature. The signature
+   is split into bands, and texts that share a band bucket become candidates.
+3. A candidate is accepted only if the exact Jaccard similarity of the
+   shingle sets is at least `threshold`.
+
+Clustering is greedy and order-dependent. Each text joins the cluster of the
+earliest accepted candidate, or opens a new cluster. Earlier labels never
+change, so the clusterer can also label answers as they stream in.
+Everything is seeded and deterministic across processes.
+"""
+
+from typing import Dict, List, Sequence, Set, Tuple
+import hashlib
+import random
+
+_MERSENNE = (1 << 61) - 1
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """Character k-shingles of already-normalized `text` (the text itself if shorter)."""
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """(bands, rows) with bands * rows == num_perm whose LSH S-curve midpoint
+    (1/bands) ** (1/rows) lies closest to `threshold`."""
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if abs((1.0 / bands) ** (1.0 / rows) - threshold) < abs((1.0 / best[0]) ** (1.0 / best[1]) - threshold):
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateClusterer:
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, shingle_size: int = 3, seed: int = 0) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        rnd = random.Random(seed)
+        self._perms = [(rnd.randrange(1, _MERSENNE), rnd.randrange(0, _MERSENNE)) for _ in range(num_perm)]
+        self._exact: Dict[str, int] = {}
+        self._shingles: List[Set[str]] = []  # per distinct normalized text
+        self._cluster_of: List[int] = []  # per distinct normalized text
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+        self.clusters = 0
+
+    def _signature(self, sh: Set[str]) -> List[int]:
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in sh]
+        return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in self._perms]
+
+    def add(self, text: str) -> int:
+        """Cluster label (0, 1, ... in order of first appearance) for `text`."""
+        norm = normalize_text(text)
+        if norm in self._exact:
+            return self._cluster_of[self._exact[norm]]
+        sh = shingles(norm, self.shingle_size)
+        sig = self._signature(sh)
+        keys = [tuple(sig[i * self.rows:(i + 1) * self.rows]) for i in range(self.bands)]
+        candidates: Set[int] = set()
+        for band, key in zip(self._buckets, keys):
+            candidates.update(band.get(key, ()))
+        label = None
+        tried: Set[int] = set()
+        for c in sorted(candidates):
+            cluster = self._cluster_of[c]
+            if cluster in tried:
+                continue
+            if jaccard(sh, self._shingles[c]) >= self.threshold:
+                label = cluster
+                break
+            tried.add(cluster)
+        if label is None:
+            label = self.clusters
+            self.clusters += 1
+        idx = len(self._shingles)
+        self._exact[norm] = idx
+        self._shingles.append(sh)
+        self._cluster_of.append(label)
+        for band, key in zip(self._buckets, keys):
+            band.setdefault(key, []).append(idx)
+        return label
+
+
+def cluster_labels(texts: Sequence[str], threshold: float = 0.8, num_perm: int = 64,
+                   shingle_size: int = 3, seed: int = 0) -> List[int]:
+    """Cluster label for each of `texts`; see NearDuplicateClusterer."""
+    clusterer = NearDuplicateClusterer(threshold, num_perm, shingle_size, seed)
+    return [clusterer.add(t) for t in texts]
@@ -0,0 +1,77 @@
+"""In-flight request coalescing ("singleflight") for ModelClients.
+
+`CoalescingClient` wraps any ModelClient. While a completion for a given
+(model, prompt, params) is in flight, identical requests from other threads
+wait for it and receive the same (output, meta) instead of calling upstream
+again. By default only deterministic requests (temperature 0, the default
+used by OpenAIClient) are coalesced, since sampled outputs are not
+interchangeable.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+import json
+import threading
+from .types import ModelClient
+
+
+def request_key(model: str, prompt: str, params: Dict[str, Any]) -> str:
+    """Canonical string for a (model, prompt, params) request."""
+    return json.dumps({"model": model, "prompt": prompt, "params": params}, sort_keys=True, default=str)
+
+
+def is_deterministic(params: Dict[str, Any]) -> bool:
+    return float(params.get("temperature", 0.0) or 0.0) == 0.0
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[Tuple[str, Dict[str, Any]]] = None
+        self.error: Optional[BaseException] = None
+
+
+class CoalescingClient:
+    def __init__(self, client: ModelClient, deterministic_only: bool = True) -> None:
+        self.client = client
+        self.deterministic_only = deterministic_only
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
+        self._inflight: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def complete(self, model: str, prompt: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
+        if self.deterministic_only and not is_deterministic(kwargs):
+            with self._lock:
+                self.upstream_calls += 1
+            return self.client.complete(model, prompt, **kwargs)
+
+        key = request_key(model, prompt, kwargs)
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+                self.upstream_calls += 1
+            else:
+                self.coalesced_calls += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            output, meta = call.result
+            return output, dict(meta or {})
+
+        try:
+            call.result = self.client.complete(model, prompt, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {"upstream_calls": self.upstream_calls, "coalesced_calls": self.coalesced_calls}
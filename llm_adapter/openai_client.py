@@ -1,32 +1,119 @@
 import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
 from typing import Dict, Any, Tuple, Optional
-from openai import OpenAI
+import httpx
+from openai import OpenAI, APIConnectionError, APIStatusError
+
+# Status codes worth retrying: timeouts, conflicts, rate limits, server errors.
+RETRY_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+_shared_http: Dict[Tuple[int, int, float], httpx.Client] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_http_client(max_connections: int = 100, max_keepalive_connections: int = 20,
+                       keepalive_expiry_s: float = 30.0) -> httpx.Client:
+    """Process-wide pooled httpx client, one per pool configuration."""
+    key = (max_connections, max_keepalive_connections, keepalive_expiry_s)
+    with _shared_lock:
+        client = _shared_http.get(key)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(max_connections=max_connections,
+                                  max_keepalive_connections=max_keepalive_connections,
+                                  keepalive_expiry=keepalive_expiry_s)
+            client = _shared_http[key] = httpx.Client(limits=limits)
+        return client
+
+
+def _retry_after_s(exc: Exception) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000.0
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 
 class OpenAIClient:
     """
     Env-based OpenAI client implementing ModelClient Protocol:
-      - OPENAI_API_KEY (required)
+      - OPENAI_API_KEY (required unless api_key is passed)
       - OPENAI_BASE_URL (optional; for proxies/compat)
       - OPENAI_TIMEOUT_MS (optional)
+      - OPENAI_MAX_RETRIES (optional; default 3)
+
+    Requests go through a pooled httpx transport that is shared by every
+    instance with the same pool limits (pass `share_transport=False` for a
+    private one). Connection errors and RETRY_STATUS responses are retried
+    with full-jitter exponential backoff, capped at `backoff_max_s`; a
+    Retry-After / retry-after-ms header from the server takes precedence.
     """
-    def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_retries: Optional[int] = None, backoff_base_s: float = 0.5, backoff_max_s: float = 20.0,
+                 max_connections: int = 100, max_keepalive_connections: int = 20,
+                 keepalive_expiry_s: float = 30.0, share_transport: bool = True):
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is not set")
-        base_url = os.getenv("OPENAI_BASE_URL")
+        base_url = base_url or os.getenv("OPENAI_BASE_URL")
         timeout_s = None
         if os.getenv("OPENAI_TIMEOUT_MS"):
             try:
                 timeout_s = int(os.getenv("OPENAI_TIMEOUT_MS")) / 1000.0
             except ValueError:
                 pass
+        if max_retries is None:
+            try:
+                max_retries = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+            except ValueError:
+                max_retries = 3
+
+        if share_transport:
+            self.http_client = shared_http_client(max_connections, max_keepalive_connections, keepalive_expiry_s)
+        else:
+            self.http_client = httpx.Client(limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry_s))
 
+        # Retries are handled here (with Retry-After support), so the SDK's own are disabled.
         # The official SDK accepts base_url; timeout handled in request kwargs
+        kwargs: Dict[str, Any] = {"api_key": api_key, "max_retries": 0, "http_client": self.http_client}
         if base_url:
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            self.client = OpenAI(api_key=api_key)
+            kwargs["base_url"] = base_url
+        self.client = OpenAI(**kwargs)
         self.timeout = timeout_s
+        self.max_retries = max_retries
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.retries = 0
+
+    def _should_retry(self, exc: Exception) -> bool:
+        if isinstance(exc, APIStatusError):
+            return exc.status_code in RETRY_STATUS
+        return isinstance(exc, APIConnectionError)
+
+    def _backoff_s(self, attempt: int, exc: Exception) -> float:
+        hinted = _retry_after_s(exc)
+        if hinted is not None:
+            return min(hinted, self.backoff_max_s)
+        return random.uniform(0.0, min(self.backoff_max_s, self.backoff_base_s * (2 ** attempt)))
 
     def complete(self, model: str, prompt: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
         """
@@ -39,19 +126,30 @@ class OpenAIClient:
         top_p = kwargs.get("top_p", 1.0)
         max_tokens = kwargs.get("max_tokens", 512)
 
-        # Chat completions recommended; prompt in a single user message
-        resp = self.client.chat.completions.create(
-            model=mdl,
-            messages=[{"role":"user","content":prompt}],
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            timeout=self.timeout  # supported by SDK
-        )
+        attempt = 0
+        while True:
+            try:
+                # Chat completions recommended; prompt in a single user message
+                resp = self.client.chat.completions.create(
+                    model=mdl,
+                    messages=[{"role":"user","content":prompt}],
+                    temperature=temperature,
+                    top_p=top_p,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout  # supported by SDK
+                )
+                break
+            except Exception as e:
+                if attempt >= self.max_retries or not self._should_retry(e):
+                    raise
+                time.sleep(self._backoff_s(attempt, e))
+                attempt += 1
+                self.retries += 1
         text = (resp.choices[0].message.content or "").strip()
         meta = {
             "id": resp.id,
             "model": resp.model,
-            "usage": getattr(resp, "usage", None).dict() if getattr(resp, "usage", None) else None
+            "usage": getattr(resp, "usage", None).dict() if getattr(resp, "usage", None) else None,
+            "attempts": attempt + 1,
         }
         return text, meta
@@ -1,4 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+import asyncio
+import threading
 from .types import ModelPrompt, RawCompletion, Interpretation, ModelClient
 from .postprocess import normalize_and_fuse
 
@@ -7,16 +10,86 @@ class Orchestrator:
     """
     Accepts multiple prompts/clients, collects outputs, and produces
     a deterministic Interpretation via post-processing.
+
+    Completions are dispatched concurrently (at most `max_concurrency` at a
+    time, and at most `client_limits[key]` per client key) but collected in
+    batch order, so fusion is identical to a serial run. If any completion
+    fails, queued work is cancelled, running work is awaited, and the
+    earliest failure (in batch order) is raised.
     """
-    def __init__(self, clients: Dict[str, ModelClient]) -> None:
+    def __init__(self, clients: Dict[str, ModelClient], max_concurrency: int = 8,
+                 client_limits: Optional[Dict[str, int]] = None) -> None:
         self.clients = clients
+        self.max_concurrency = max(1, max_concurrency)
+        self.client_limits = dict(client_limits or {})
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
 
-    def run(self, batch: List[ModelPrompt]) -> Interpretation:
-        raws: List[RawCompletion] = []
+    def _limit(self, key: str) -> int:
+        return max(1, self.client_limits.get(key, self.max_concurrency))
+
+    def _slot(self, key: str) -> threading.BoundedSemaphore:
+        with self._slots_lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self._limit(key))
+            return self._slots[key]
+
+    def _check(self, batch: List[ModelPrompt]) -> None:
+        # Fail before dispatching anything.
         for mp in batch:
-            client = self.clients.get(mp.model)
-            if client is None:
+            if self.clients.get(mp.model) is None:
                 raise ValueError(f"No client configured for model: {mp.model}")
-            output, meta = client.complete(mp.model, mp.prompt, **(mp.params or {}))
-            raws.append(RawCompletion(model=mp.model, prompt=mp.prompt, output=output, meta=meta))
+
+    def _complete(self, mp: ModelPrompt) -> RawCompletion:
+        with self._slot(mp.model):
+            output, meta = self.clients[mp.model].complete(mp.model, mp.prompt, **(mp.params or {}))
+        return RawCompletion(model=mp.model, prompt=mp.prompt, output=output, meta=meta)
+
+    def run(self, batch: List[ModelPrompt]) -> Interpretation:
+        self._check(batch)
+        if len(batch) <= 1 or self.max_concurrency == 1:
+            return normalize_and_fuse([self._complete(mp) for mp in batch])
+        pool = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batch)))
+        try:
+            futures = [pool.submit(self._complete, mp) for mp in batch]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            failed = [f for f in futures if f in done and f.exception() is not None]
+            if failed:
+                raise failed[0].exception()
+            raws = [f.result() for f in futures]
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return normalize_and_fuse(raws)
+
+    async def arun(self, batch: List[ModelPrompt]) -> Interpretation:
+        """Asyncio variant of `run`.
+
+        Clients exposing an `acomplete` coroutine are awaited directly; plain
+        clients run in the default thread executor.
+        """
+        self._check(batch)
+        overall = asyncio.Semaphore(self.max_concurrency)
+        per_client = {key: asyncio.Semaphore(self._limit(key)) for key in {mp.model for mp in batch}}
+
+        async def one(mp: ModelPrompt) -> RawCompletion:
+            async with overall, per_client[mp.model]:
+                client = self.clients[mp.model]
+                params = mp.params or {}
+                if hasattr(client, "acomplete"):
+                    output, meta = await client.acomplete(mp.model, mp.prompt, **params)
+                else:
+                    output, meta = await asyncio.to_thread(client.complete, mp.model, mp.prompt, **params)
+            return RawCompletion(model=mp.model, prompt=mp.prompt, output=output, meta=meta)
+
+        tasks = [asyncio.ensure_future(one(mp)) for mp in batch]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            failed = [t for t in tasks if t.done() and not t.cancelled() and t.exception() is not None]
+            if failed:
+                raise failed[0].exception()
+            raws = [t.result() for t in tasks]
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         return normalize_and_fuse(raws)
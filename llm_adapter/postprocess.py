@@ -1,6 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Sequence, Set, Tuple
+from bisect import insort
 import math
 import hashlib
+from logos_engine.sampling import sample_in_waves
+from llm_adapter.cluster import NearDuplicateClusterer, cluster_labels
 try:
     from llm_adapter.types import RawCompletion, Interpretation
 except ImportError:
@@ -24,99 +27,212 @@ def _shannon_entropy(probs: List[float]) -> float:
     return -sum(p * math.log2(p) for p in probs if p > 0 and p <= 1)
 
 
-def interpretations_to_entropy(interpretations: List[str]) -> float:
+def interpretations_to_entropy(interpretations: List[str], similarity_threshold: Optional[float] = None) -> float:
     """Convert a list of interpretation strings (from ensemble members) into
     a normalized entropy value in [0,1].
 
     Normalization uses log(N) where N is the number of ensemble members.
+    With `similarity_threshold` set, near-duplicate strings (shingle Jaccard
+    similarity at least that) are bucketed together first; see llm_adapter.cluster.
     """
     if not interpretations:
         return 0.0
+    if similarity_threshold is not None:
+        interpretations = cluster_labels(interpretations, similarity_threshold)
     freq = {}
     for it in interpretations:
         freq[it] = freq.get(it, 0) + 1
-    n = len(interpretations)
-    probs = [count / n for count in freq.values()]
+    return _entropy_from_counts(list(freq.values()))
+
+
+def _entropy_from_counts(counts: Sequence[int]) -> float:
+    # Same normalization as interpretations_to_entropy, from bucket counts.
+    n = sum(counts)
+    probs = [count / n for count in counts]
     H = _shannon_entropy(probs)
-    N_unique = len(freq)
+    N_unique = len(counts)
     H_max = math.log2(N_unique) if N_unique > 1 else 1.0
     if H_max == 0:
         return 0.0
     return float(max(0.0, min(1.0, H / H_max)))
 
 
-def _stable_hash(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def adaptive_interpretations_entropy(ask_wave: Callable[[List[int]], List[str]], total: int,
+                                     coherence_threshold: Optional[float] = None, tolerance: Optional[float] = None,
+                                     min_samples: int = 3, wave_size: int = 2,
+                                     similarity_threshold: Optional[float] = None) -> Tuple[float, Dict[str, Any]]:
+    """Early-stopping `interpretations_to_entropy` over `total` ensemble members.
+
+    `ask_wave(indices)` returns the interpretations of those members. Members
+    are asked in waves until the accept/reject bucket at `coherence_threshold`
+    or the entropy (within `tolerance`) is settled; see logos_engine.sampling.
+    Returns (entropy, report) with the number of `calls` made and `skipped`.
+    `similarity_threshold` clusters answers as they arrive, as in
+    `interpretations_to_entropy`.
+    """
+    if total <= 0:
+        return 0.0, {"calls": 0, "skipped": 0, "bounds": (0.0, 0.0), "stopped": "exhausted"}
+    if similarity_threshold is not None:
+        clusterer = NearDuplicateClusterer(similarity_threshold)
+        raw_wave = ask_wave
+
+        def ask_wave(indices: List[int]) -> List[str]:
+            return [str(clusterer.add(a)) for a in raw_wave(indices)]
+    return sample_in_waves(ask_wave, total, _entropy_from_counts, coherence_threshold, tolerance, min_samples, wave_size)
+
+
+# Intent buckets in priority order (the old if/elif chain): the first bucket
+# with any keyword present in the lowercased text wins.
+DEFAULT_INTENTS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("summarize", ("summarize", "summary")),
+    ("classify", ("classify", "label")),
+    ("extract", ("extract", "pull out")),
+    ("plan", ("plan", "roadmap")),
+)
+
+# bytes.translate table: ASCII whitespace (as str.split sees it) -> b" ", everything else -> b"x"
+_SPACE_MAP = bytes(32 if i < 128 and chr(i).isspace() else 120 for i in range(256))
+
+
+class IntentLexicon:
+    """Priority-ordered keyword lexicon, compiled once.
+
+    Compilation flattens the buckets into one (keyword, intent) scan order and
+    drops keywords that can never decide the outcome: duplicates, and
+    keywords containing a keyword of the same or higher priority (whenever
+    they occur, that one occurs too). Matching walks that order with C-level
+    substring search and stops at the first hit, which is exactly the
+    if/elif semantics. Keywords are matched against lowercased text.
+    """
+
+    def __init__(self, intents: Sequence[Tuple[str, Sequence[str]]] = DEFAULT_INTENTS, default: str = "unknown") -> None:
+        self.default = default
+        order: List[Tuple[str, str]] = []
+        for intent, keywords in intents:
+            for kw in keywords:
+                if kw and not any(seen in kw for seen, _ in order):
+                    order.append((kw, intent))
+        self._order = tuple(order)
+
+    def match(self, t: str) -> str:
+        for kw, intent in self._order:
+            if kw in t:
+                return intent
+        return self.default
+
+
+DEFAULT_LEXICON = IntentLexicon()
 
 
-def _extract_naive_intent(text: str) -> Dict[str, Any]:
+def _count_tokens(t: str, data: bytes) -> int:
+    # Same count as len(t.split()); for ASCII text it reuses the encoded bytes
+    # (shared with hashing) and counts word starts without building a list.
+    if not t.isascii():
+        return len(t.split())
+    marks = data.translate(_SPACE_MAP)
+    return marks.count(b" x") + (1 if marks[:1] == b"x" else 0)
+
+
+def _extract_naive_intent(text: str, lexicon: Optional[IntentLexicon] = None) -> Dict[str, Any]:
     """
     Deterministic, regex-free heuristic:
     - lowercasing
-    - simple keyword buckets
+    - simple keyword buckets (see IntentLexicon / DEFAULT_INTENTS)
     - stable argument ordering
     """
     t = text.strip().lower()
-    intent = "unknown"
+    data = t.encode("utf-8")
     args: Dict[str, Any] = {}
-
-    if "summarize" in t or "summary" in t:
-        intent = "summarize"
-    elif "classify" in t or "label" in t:
-        intent = "classify"
-    elif "extract" in t or "pull out" in t:
-        intent = "extract"
-    elif "plan" in t or "roadmap" in t:
-        intent = "plan"
+    intent = (lexicon or DEFAULT_LEXICON).match(t)
 
     # very simple deterministic arguments
-    args["tokens"] = len(t.split())
-    args["hash"] = _stable_hash(t)[:12]
+    args["tokens"] = _count_tokens(t, data)
+    args["hash"] = hashlib.sha256(data).hexdigest()[:12]
     return {"intent": intent, "arguments": args}
 
 
-def normalize_and_fuse(raws: List[RawCompletion]) -> Interpretation:
+class Fuser:
+    """Incremental form of `normalize_and_fuse`.
+
+    Feed completions one at a time with `add`; `result()` returns exactly what
+    `normalize_and_fuse` would for the completions added so far. Only running
+    state is kept: the intent tally, min/max token counts, the token parities
+    seen and the sorted hashes. Give `expected` (the batch size) to use
+    `settled()`, which turns True once the remaining completions can no
+    longer change the winning intent, so callers may cancel them.
+    """
+
+    def __init__(self, expected: Optional[int] = None, lexicon: Optional[IntentLexicon] = None) -> None:
+        self.expected = expected
+        self.lexicon = lexicon
+        self.n = 0
+        self.tally: Dict[str, int] = {}
+        self.tokens_min: Optional[int] = None
+        self.tokens_max: Optional[int] = None
+        self.parities: Set[int] = set()
+        self.hashes: List[str] = []
+
+    def add(self, rc: RawCompletion) -> None:
+        x = _extract_naive_intent(rc.output, self.lexicon)
+        intent, arguments = x["intent"], x["arguments"]
+        self.n += 1
+        self.tally[intent] = self.tally.get(intent, 0) + 1
+        tokens = arguments["tokens"]
+        self.tokens_min = tokens if self.tokens_min is None else min(self.tokens_min, tokens)
+        self.tokens_max = tokens if self.tokens_max is None else max(self.tokens_max, tokens)
+        self.parities.add(tokens % 2)
+        insort(self.hashes, arguments["hash"])
+
+    def leader(self) -> Tuple[str, int]:
+        """Current (intent, votes); ties go to the lexicographically smallest intent."""
+        if not self.tally:
+            return "unknown", 0
+        max_votes = max(self.tally.values())
+        return min(k for k, v in self.tally.items() if v == max_votes), max_votes
+
+    def settled(self) -> bool:
+        if self.expected is None:
+            return False
+        remaining = self.expected - self.n
+        if remaining <= 0:
+            return True
+        chosen, votes = self.leader()
+        if not self.tally or remaining >= votes:
+            # an intent not seen yet could still catch up
+            return False
+        for intent, count in self.tally.items():
+            if intent == chosen:
+                continue
+            catch_up = count + remaining
+            if catch_up > votes or (catch_up == votes and intent < chosen):
+                return False
+        return True
+
+    def result(self) -> Interpretation:
+        if not self.n:
+            return Interpretation(intent="unknown", arguments={}, confidence=0.0)
+        chosen_intent, votes = self.leader()
+        parity_agree = 1.0 if len(self.parities) == 1 else 0.0
+        confidence = round((votes / self.n) * 0.9 + 0.1 * parity_agree, 3)
+        merged_args = {
+            "tokens_min": self.tokens_min,
+            "tokens_max": self.tokens_max,
+            "hashes": list(self.hashes),
+        }
+        return Interpretation(intent=chosen_intent, arguments=merged_args, confidence=confidence)
+
+
+def normalize_and_fuse(raws: List[RawCompletion], lexicon: Optional[IntentLexicon] = None) -> Interpretation:
     """
     Deterministic fusion:
     1) Normalize each output → (intent, arguments).
     2) Majority vote on intent; tie-breaker: lexicographically smallest intent.
     3) Confidence = (#winners / #total) adjusted by agreement on token-count parity.
     4) Arguments merged deterministically by sorted keys and min/max consensus.
-    """
-    if not raws:
-        return Interpretation(intent="unknown", arguments={}, confidence=0.0)
 
-    normals = []
+    Implemented on top of `Fuser`, which gives the same result incrementally.
+    """
+    fuser = Fuser(expected=len(raws), lexicon=lexicon)
     for rc in raws:
-        x = _extract_naive_intent(rc.output)
-        normals.append((rc, x["intent"], x["arguments"]))
-
-    # vote
-    tally: Dict[str, int] = {}
-    for _, intent, _ in normals:
-        tally[intent] = tally.get(intent, 0) + 1
-    if tally:
-        max_votes = max(tally.values())
-        winners = sorted([k for k, v in tally.items() if v == max_votes])
-        chosen_intent = winners[0]
-        votes = tally[chosen_intent]
-    else:
-        chosen_intent = "unknown"
-        votes = 0
-    n = len(raws)
-
-    # token parity agreement bonus
-    parities = [arguments["tokens"] % 2 for _, _, arguments in normals]
-    parity_agree = 1.0 if len(set(parities)) == 1 else 0.0
-
-    confidence = round((votes / n) * 0.9 + 0.1 * parity_agree, 3)
-
-    # deterministic arg merge (token stats and hashes)
-    tokens = sorted([arguments["tokens"] for _, _, arguments in normals])
-    merged_args = {
-        "tokens_min": tokens[0],
-        "tokens_max": tokens[-1],
-        "hashes": sorted([arguments["hash"] for _, _, arguments in normals]),
-    }
-
-    return Interpretation(intent=chosen_intent, arguments=merged_args, confidence=confidence)
+        fuser.add(rc)
+    return fuser.result()
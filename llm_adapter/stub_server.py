@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Local OpenAI-compatible stub server for offline tests and benchmarks.
+
+Serves POST /v1/chat/completions with an echo-style reply (the last user
+message), so fusion stays deterministic. Failures can be injected to
+exercise retry behaviour: the first `fail_first` requests get `fail_status`
+(with a Retry-After header when `retry_after` is set), and `latency_s`
+delays every response. HTTP/1.1 keep-alive is supported, and the server
+counts requests and accepted connections so pooling can be observed.
+
+    with StubServer(fail_first=2, fail_status=429, retry_after="0") as stub:
+        client = OpenAIClient(api_key="stub", base_url=stub.base_url)
+
+    python -m llm_adapter.stub_server --port 8089
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format, *args) -> None:  # keep test output quiet
+        pass
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _send(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with self.server.lock:
+            self.server.requests += 1
+            n = self.server.requests
+        if self.server.latency_s:
+            time.sleep(self.server.latency_s)
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+        if n <= self.server.fail_first:
+            headers = {"Retry-After": self.server.retry_after} if self.server.retry_after is not None else {}
+            self._send(self.server.fail_status, {"error": {"message": "injected failure", "type": "stub"}}, headers)
+            return
+        messages = payload.get("messages") or [{}]
+        text = str(messages[-1].get("content", ""))
+        self._send(200, {
+            "id": f"stub-{n}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": text}}],
+            "usage": {"prompt_tokens": len(text.split()), "completion_tokens": len(text.split()),
+                      "total_tokens": 2 * len(text.split())},
+        })
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class StubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fail_first: int = 0, fail_status: int = 503,
+                 retry_after: Optional[str] = None, latency_s: float = 0.0) -> None:
+        self.httpd = _Server((host, port), _Handler)
+        self.httpd.lock = threading.Lock()
+        self.httpd.requests = 0
+        self.httpd.connections = 0
+        self.httpd.fail_first = fail_first
+        self.httpd.fail_status = fail_status
+        self.httpd.retry_after = retry_after
+        self.httpd.latency_s = latency_s
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def requests(self) -> int:
+        return self.httpd.requests
+
+    @property
+    def connections(self) -> int:
+        return self.httpd.connections
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run a local OpenAI-compatible stub server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8089)
+    ap.add_argument("--fail-first", type=int, default=0, help="Fail this many initial requests")
+    ap.add_argument("--fail-status", type=int, default=503)
+    ap.add_argument("--retry-after", default=None, help="Retry-After header value for injected failures")
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    args = ap.parse_args()
+    stub = StubServer(args.host, args.port, args.fail_first, args.fail_status, args.retry_after, args.latency_ms / 1000.0)
+    print(f"OpenAI stub listening on {stub.base_url}")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
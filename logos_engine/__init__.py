@@ -1,2 +1,3 @@
 # logos_engine package
-__all__ = ["types", "store", "se", "m_gate", "nomics"]
+__all__ = ["types", "store", "se", "m_gate", "nomics", "rulebook", "sampling", "ledger_index", "codec", "merkle", "replay", "row_cap"]
+# `m_gate_batch` (vectorized gate) is not imported here because it needs NumPy.
@@ -0,0 +1,242 @@
+"""Record encodings for `Ledger` files.
+
+Every record carries {ts, seq, hash, prev, obj}; a codec decides how it is
+laid out on disk. Two are available:
+
+- `jsonl` (default): one JSON object per line.
+- `binary`: length-prefixed frames,
+
+      u32 length | body | u32 length        (big-endian)
+      body = u8 flags | u64 seq | f64 ts | hash (32 bytes) | [prev (32 bytes)] | payload
+
+  Flag bit 0 marks a prev digest (absent on the first record); bit 1 a
+  zlib-compressed payload (only used when it is smaller). The trailing
+  length lets the last record be read straight back from EOF. The payload
+  is the object's `canonical_json` text, i.e. exactly what `hash_record`
+  hashes, so checking a record is one sha256 with no JSON parsing and
+  converting between the formats keeps every hash.
+
+Codecs are stateless apart from the encode options, so workers look them up
+by name in CODECS.
+"""
+
+import gzip, json, os, struct, zlib
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+from .types import canonical_json, hash_canonical
+
+# Bytes read per step when scanning backwards for the last line.
+_TAIL_BLOCK = 8192
+
+_LEN = struct.Struct(">I")
+_HEAD = struct.Struct(">BQd32s")  # flags, seq, ts, hash
+_HAS_PREV = 1
+_ZLIB = 2
+
+# (hash, prev, seq, hash_ok) of one record, as checked by Ledger.verify
+Check = Tuple[str, Optional[str], Optional[int], bool]
+
+
+class JsonlCodec:
+    name = "jsonl"
+
+    def encode(self, ts: float, seq: int, h: str, prev: Optional[str], obj_json: str) -> bytes:
+        return ('{"ts": %s, "seq": %d, "hash": "%s", "prev": %s, "obj": %s}\n' % (
+            json.dumps(ts), seq, h, json.dumps(prev), obj_json)).encode("utf-8")
+
+    def decode(self, chunk: bytes) -> Dict[str, Any]:
+        return json.loads(chunk)
+
+    # a line carries every field; no cheaper header-only read exists
+    header = decode
+
+    def check(self, chunk: bytes) -> Check:
+        rec = json.loads(chunk)
+        h, prev = rec["hash"], rec["prev"]
+        return h, prev, rec.get("seq"), hash_canonical(canonical_json(rec["obj"]), prev) == h
+
+    def scan(self, f: BinaryIO, partial: bool = True) -> Iterator[bytes]:
+        """Records from the current position of `f` (blank lines skipped by the caller).
+
+        With `partial=False` a last line without its newline (still being
+        written) is not returned.
+        """
+        for line in f:
+            if not partial and not line.endswith(b"\n"):
+                return
+            yield line
+
+    def repair_tail(self, path: str) -> bool:
+        """Cut a last line torn by a crash mid-write; True if `path` was changed.
+
+        Every record is written with its newline, so a last line without one
+        is torn unless it still parses, in which case only the newline is added.
+        """
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return False
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return False
+            pos, buf, start = size, b"", 0
+            while pos > 0:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                nl = buf.rfind(b"\n")
+                if nl >= 0:
+                    start = pos + nl + 1
+                    break
+            f.seek(start)
+            try:
+                json.loads(f.read())
+            except ValueError:
+                f.truncate(start)
+            else:
+                f.write(b"\n")
+            return True
+
+    def read_last(self, path: str) -> Optional[Dict[str, Any]]:
+        """Last record of `path`, found by reading backwards from EOF."""
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = b""
+            while pos > 0:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                stripped = buf.rstrip()
+                nl = stripped.rfind(b"\n")
+                if nl >= 0:
+                    return json.loads(stripped[nl + 1:])
+            buf = buf.strip()
+            return json.loads(buf) if buf else None
+
+
+class BinaryCodec:
+    name = "binary"
+
+    def __init__(self, compress: bool = False) -> None:
+        self.compress = compress
+
+    def encode(self, ts: float, seq: int, h: str, prev: Optional[str], obj_json: str) -> bytes:
+        payload = obj_json.encode("utf-8")
+        flags = 0
+        if self.compress:
+            packed = zlib.compress(payload)
+            if len(packed) < len(payload):
+                payload, flags = packed, _ZLIB
+        if prev is not None:
+            flags |= _HAS_PREV
+        body = b"".join((_HEAD.pack(flags, seq, ts, bytes.fromhex(h)),
+                         bytes.fromhex(prev) if prev is not None else b"", payload))
+        n = _LEN.pack(len(body))
+        return n + body + n
+
+    def _fields(self, chunk: bytes) -> Tuple[Dict[str, Any], int, int]:
+        if len(chunk) < 8 + _HEAD.size or chunk[:4] != chunk[-4:] or _LEN.unpack_from(chunk)[0] != len(chunk) - 8:
+            raise ValueError("truncated or corrupt record frame")
+        flags, seq, ts, h = _HEAD.unpack_from(chunk, 4)
+        pos = 4 + _HEAD.size
+        prev = None
+        if flags & _HAS_PREV:
+            prev = chunk[pos:pos + 32].hex()
+            pos += 32
+        return {"ts": ts, "seq": seq, "hash": h.hex(), "prev": prev}, flags, pos
+
+    def _payload(self, chunk: bytes, flags: int, pos: int) -> str:
+        payload = chunk[pos:-4]
+        if flags & _ZLIB:
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error as e:
+                raise ValueError(f"corrupt record payload: {e}") from None
+        return payload.decode("utf-8")
+
+    def header(self, chunk: bytes) -> Dict[str, Any]:
+        """{ts, seq, hash, prev} without touching the payload."""
+        return self._fields(chunk)[0]
+
+    def decode(self, chunk: bytes) -> Dict[str, Any]:
+        rec, flags, pos = self._fields(chunk)
+        rec["obj"] = json.loads(self._payload(chunk, flags, pos))
+        return rec
+
+    def check(self, chunk: bytes) -> Check:
+        rec, flags, pos = self._fields(chunk)
+        h, prev = rec["hash"], rec["prev"]
+        return h, prev, rec["seq"], hash_canonical(self._payload(chunk, flags, pos), prev) == h
+
+    def scan(self, f: BinaryIO, partial: bool = True) -> Iterator[bytes]:
+        """Frames from the current position of `f`.
+
+        A truncated last frame is returned as-is (so decoding it fails)
+        unless `partial=False`, which stops before it.
+        """
+        while True:
+            head = f.read(4)
+            if not head:
+                return
+            want = _LEN.unpack(head)[0] + 4 if len(head) == 4 else 0
+            rest = f.read(want) if want else b""
+            if not want or len(rest) < want:
+                if partial:
+                    yield head + rest
+                return
+            yield head + rest
+
+    def repair_tail(self, path: str) -> bool:
+        """Cut a last frame torn by a crash mid-write; True if `path` was changed.
+
+        An intact tail is recognized from the trailing length alone; only a
+        torn one costs a scan over the frame lengths.
+        """
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return False
+            if size >= 8:
+                f.seek(size - 4)
+                n = _LEN.unpack(f.read(4))[0]
+                if n + 8 <= size:
+                    f.seek(size - n - 8)
+                    if f.read(4) == _LEN.pack(n):
+                        return False
+            f.seek(0)
+            intact = sum(len(chunk) for chunk in self.scan(f, partial=False))
+            f.truncate(intact)
+            return True
+
+    def read_last(self, path: str) -> Optional[Dict[str, Any]]:
+        """{ts, seq, hash, prev} of the last frame, via the trailing length."""
+        size = os.path.getsize(path)
+        if size == 0:
+            return None
+        with open(path, "rb") as f:
+            f.seek(size - 4)
+            n = _LEN.unpack(f.read(4))[0]
+            if n + 8 > size:
+                raise ValueError("truncated or corrupt record frame")
+            f.seek(size - n - 8)
+            return self.header(f.read(n + 8))
+
+
+CODECS = {"jsonl": JsonlCodec(), "binary": BinaryCodec()}
+LEDGER_FORMATS = tuple(CODECS)
+
+
+def sniff_format(path: str) -> Optional[str]:
+    """Format of an existing ledger file from its first byte; None if empty or missing."""
+    try:
+        with (gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")) as f:
+            first = f.read(1)
+    except FileNotFoundError:
+        return None
+    if not first:
+        return None
+    # A JSONL record starts with "{"; a frame with the high byte of its length.
+    return "jsonl" if first in b"{ \t\r\n" else "binary"
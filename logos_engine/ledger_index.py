@@ -0,0 +1,158 @@
+"""Secondary indexes over a `Ledger` for audit queries.
+
+Maps amendment id, parent rule id and status_action to the position
+(segment, byte offset) of every record that carries them. The index is kept
+in a SQLite file next to the ledger (`<path>.index`). Segments are numbered
+by their position in `Ledger.segment_paths()`. The active segment keeps its
+number when it is sealed, so positions stay valid across rotation.
+
+The index stores a watermark: the (segment, offset) up to which records have
+been indexed. `catch_up` parses only what was appended after it. So a ledger
+written without `index=True`, or by another process, is indexed on the next
+query. A missing index file is rebuilt from scratch, and `rebuild` forces
+that. Offsets into gzip-compressed sealed segments are offsets in the
+decompressed stream; seeking there decompresses from the segment start.
+"""
+
+import os, sqlite3, threading
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .codec import CODECS
+from .store import _open_segment
+
+# (field, value) keys a record can be found by
+INDEX_FIELDS = ("amendment", "rule", "status_action")
+
+# lines parsed per SQLite transaction while catching up
+_CATCH_UP_BATCH = 20000
+
+
+def index_keys(obj: Any) -> List[Tuple[str, str]]:
+    """(field, value) pairs a record's obj is indexed under.
+
+    `nomics` records wrap the amendment as {"amendment": ..., "metrics": ...};
+    a bare amendment dict is indexed the same way.
+    """
+    if not isinstance(obj, dict):
+        return []
+    a = obj.get("amendment")
+    if not isinstance(a, dict):
+        a = obj
+    keys: List[Tuple[str, str]] = []
+    if a.get("id") is not None:
+        keys.append(("amendment", str(a["id"])))
+    for pid in a.get("parent_ids") or ():
+        keys.append(("rule", str(pid)))
+    if a.get("status_action") is not None:
+        keys.append(("status_action", str(a["status_action"])))
+    return keys
+
+
+class LedgerIndex:
+    def __init__(self, db_path: str, codec=CODECS["jsonl"]):
+        self.db_path = db_path
+        self.codec = codec
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS entries (field TEXT NOT NULL, value TEXT NOT NULL, "
+                         "segment INTEGER NOT NULL, offset INTEGER NOT NULL, seq INTEGER)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_key ON entries (field, value, segment, offset)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS watermark (id INTEGER PRIMARY KEY CHECK (id = 0), "
+                         "segment INTEGER NOT NULL, offset INTEGER NOT NULL)")
+        self._db.commit()
+
+    def watermark(self) -> Tuple[int, int]:
+        row = self._db.execute("SELECT segment, offset FROM watermark WHERE id = 0").fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    def _set_watermark(self, segment: int, offset: int) -> None:
+        self._db.execute("INSERT OR REPLACE INTO watermark (id, segment, offset) VALUES (0, ?, ?)", (segment, offset))
+
+    def _add(self, segment: int, offset: int, lines: Iterable[bytes]) -> int:
+        rows = []
+        for chunk in lines:
+            if not chunk.isspace():
+                rec = self.codec.decode(chunk)
+                seq = rec.get("seq")
+                rows.extend((field, value, segment, offset, seq) for field, value in index_keys(rec.get("obj")))
+            offset += len(chunk)
+        self._db.executemany("INSERT INTO entries (field, value, segment, offset, seq) VALUES (?, ?, ?, ?, ?)", rows)
+        self._set_watermark(segment, offset)
+        self._db.commit()
+        return offset
+
+    def add_lines(self, segment: int, offset: int, lines: Sequence[bytes]) -> bool:
+        """Index freshly written `lines` starting at `offset` of `segment`.
+
+        Returns False without indexing if the write does not start at the
+        watermark (another writer appended in between); `catch_up` then
+        scans from the watermark.
+        """
+        with self._lock:
+            if self.watermark() != (segment, offset):
+                return False
+            self._add(segment, offset, lines)
+            return True
+
+    def next_segment(self, segment: int, size: int) -> None:
+        """Move the watermark past `segment` if it was indexed up to its end (`size`)."""
+        with self._lock:
+            if self.watermark() == (segment, size):
+                self._set_watermark(segment + 1, 0)
+                self._db.commit()
+
+    def catch_up(self, paths: Sequence[str]) -> None:
+        """Index everything after the watermark in `paths` (`Ledger.segment_paths()`)."""
+        with self._lock:
+            segment, offset = self.watermark()
+            if segment >= len(paths) or (segment == len(paths) - 1 and offset > os.path.getsize(paths[-1])):
+                # The ledger is shorter than what was indexed: start over.
+                self._clear()
+                segment, offset = 0, 0
+            while True:
+                with _open_segment(paths[segment]) as f:
+                    f.seek(offset)
+                    batch: List[bytes] = []
+                    # a record still being written is left for the next catch-up
+                    for chunk in self.codec.scan(f, partial=False):
+                        batch.append(chunk)
+                        if len(batch) >= _CATCH_UP_BATCH:
+                            offset = self._add(segment, offset, batch)
+                            batch = []
+                    if batch:
+                        offset = self._add(segment, offset, batch)
+                if segment == len(paths) - 1:
+                    return
+                segment, offset = segment + 1, 0
+                self._set_watermark(segment, offset)
+                self._db.commit()
+
+    def lookup(self, criteria: Sequence[Tuple[str, str]]) -> List[Tuple[int, int]]:
+        """(segment, offset) of records matching every (field, value), in chain order."""
+        if not criteria:
+            raise ValueError("at least one criterion is required")
+        for field, _ in criteria:
+            if field not in INDEX_FIELDS:
+                raise ValueError(f"Unknown index field: {field}")
+        query = " INTERSECT ".join(["SELECT segment, offset FROM entries WHERE field = ? AND value = ?"] * len(criteria))
+        params = [p for field, value in criteria for p in (field, str(value))]
+        with self._lock:
+            return self._db.execute(query + " ORDER BY segment, offset", params).fetchall()
+
+    def _clear(self) -> None:
+        self._db.execute("DELETE FROM entries")
+        self._db.execute("DELETE FROM watermark")
+        self._db.commit()
+
+    def rebuild(self, paths: Sequence[str]) -> None:
+        with self._lock:
+            self._clear()
+        self.catch_up(paths)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"entries": entries, "watermark": self.watermark()}
+
+    def close(self) -> None:
+        self._db.close()
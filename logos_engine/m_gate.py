@@ -1,11 +1,12 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Tuple
+from .rulebook import Rules
 
-def blast_radius(amendment: Dict[str, Any], rules: List[Dict[str, Any]]) -> float:
+def blast_radius(amendment: Dict[str, Any], rules: Rules) -> float:
     touched = set(amendment.get("parent_ids", []))
     total = max(1, len(rules))
     return min(1.0, len(touched) / total)
 
-def traceability_score(amendment: Dict[str, Any], rules: List[Dict[str, Any]]) -> float:
+def traceability_score(amendment: Dict[str, Any], rules: Rules) -> float:
     # Simple proxy: presence of parent_ids, procedure_id, and evidence implies high traceability.
     has_parents = bool(amendment.get("parent_ids"))
     has_procedure = bool(amendment.get("procedure_id"))
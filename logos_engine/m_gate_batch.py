@@ -0,0 +1,72 @@
+"""Vectorized M-gate for what-if sweeps (requires NumPy).
+
+Scores many amendments against one or many threshold sets in a single call.
+Every metric is computed with the same floating-point operations, in the same
+order, as the scalar functions in `m_gate`, so results match them exactly.
+"""
+
+from typing import Dict, Any, Sequence, Tuple, Union
+import numpy as np
+
+from .rulebook import Rules
+from .se import estimate_se_many, normalize_se
+
+ThresholdSets = Union[Dict[str, float], Sequence[Dict[str, float]], Sequence[Sequence[float]], np.ndarray]
+
+
+def traceability_scores(amendments: Sequence[Dict[str, Any]]) -> np.ndarray:
+    def flag(key: str) -> np.ndarray:
+        return np.fromiter((bool(a.get(key)) for a in amendments), dtype=bool, count=len(amendments))
+
+    score = np.full(len(amendments), 0.5)
+    score += np.where(flag("parent_ids"), 0.2, 0.0)
+    score += np.where(flag("procedure_id"), 0.2, 0.0)
+    score += np.where(flag("evidence"), 0.1, 0.0)
+    return np.minimum(1.0, score)
+
+
+def blast_radii(amendments: Sequence[Dict[str, Any]], rules: Rules) -> np.ndarray:
+    touched = np.fromiter((len(set(a.get("parent_ids", []))) for a in amendments), dtype=np.float64, count=len(amendments))
+    return np.minimum(1.0, touched / max(1, len(rules)))
+
+
+def metrics_batch(amendments: Sequence[Dict[str, Any]], rules: Rules) -> Dict[str, np.ndarray]:
+    """C, TR and BR arrays for a list of amendments (SE via `estimate_se_many`)."""
+    se = estimate_se_many(list(amendments), rules)
+    C = np.array([1.0 - normalize_se(x) for x in se], dtype=np.float64)
+    return {"C": C, "TR": traceability_scores(amendments), "BR": blast_radii(amendments, rules)}
+
+
+def _threshold_matrix(thresholds: ThresholdSets) -> Tuple[np.ndarray, bool]:
+    """Normalize thresholds to a (k, 3) array of (θC, θTR, θBR); flag if a single set was given."""
+    if isinstance(thresholds, dict):
+        thresholds = [thresholds]
+        single = True
+    else:
+        single = np.ndim(thresholds) == 1 and not isinstance(thresholds[0], dict)
+        if single:
+            thresholds = [thresholds]
+    rows = [[t["coherence"], t["traceability"], t["blast_radius"]] if isinstance(t, dict) else list(t) for t in thresholds]
+    return np.asarray(rows, dtype=np.float64).reshape(-1, 3), single
+
+
+def accept_batch(C, TR, BR, thresholds: ThresholdSets) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Vectorized `m_gate.accept`.
+
+    C, TR and BR are length-n arrays. `thresholds` is one constitution-style
+    dict ({"coherence", "traceability", "blast_radius"}), a (θC, θTR, θBR)
+    triple, or a sequence / (k, 3) array of either. Returns (ok, metrics):
+    `ok` has shape (n,) for a single threshold set and (k, n) otherwise, and
+    metrics holds the C/TR/BR arrays plus the θ columns.
+    """
+    C, TR, BR = (np.asarray(x, dtype=np.float64) for x in (C, TR, BR))
+    T, single = _threshold_matrix(thresholds)
+    ok = (C[None, :] >= T[:, 0:1]) & (TR[None, :] >= T[:, 1:2]) & (BR[None, :] <= T[:, 2:3])
+    metrics = {"C": C, "TR": TR, "BR": BR, "θC": T[:, 0], "θTR": T[:, 1], "θBR": T[:, 2]}
+    return (ok[0] if single else ok), metrics
+
+
+def gate_amendments(amendments: Sequence[Dict[str, Any]], rules: Rules, thresholds: ThresholdSets) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """`metrics_batch` followed by `accept_batch`."""
+    m = metrics_batch(amendments, rules)
+    return accept_batch(m["C"], m["TR"], m["BR"], thresholds)
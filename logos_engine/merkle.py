@@ -0,0 +1,210 @@
+"""Merkle checkpoints and inclusion proofs over ledger record hashes.
+
+Leaves are the record hashes (`types.hash_record`) in chain order, so leaf
+i is the record with seq i. The tree has the RFC 6962 / 9162 (Certificate
+Transparency) shape, with domain-separated hashing:
+
+    leaf = sha256(0x00 || record hash)      node = sha256(0x01 || left || right)
+
+`MerkleLog` stores the record hashes and every complete, aligned subtree
+above them in SQLite (`<ledger>.merkle`). That is about one node per
+record, and appending is amortized O(1). Any root or inclusion proof can
+then be assembled from O(log n) stored nodes. A checkpoint records a
+(size, root) pair. An auditor who trusts a published checkpoint root can
+check one record with `verify_inclusion`, which takes the record hash
+(recomputed from the record with `hash_record`), its index, the
+checkpoint size and the proof path. That is O(log n) hashes, without the
+rest of the ledger.
+"""
+
+import hashlib, sqlite3, threading, time
+from typing import Any, Dict, List, Optional, Sequence
+
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def leaf_hash(record_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(record_hash)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _split(n: int) -> int:
+    # largest power of two strictly below n (n >= 2)
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+def merkle_root(record_hashes: Sequence[str]) -> str:
+    """Root over `record_hashes`, computed directly (reference implementation)."""
+    if not record_hashes:
+        return EMPTY_ROOT
+    level = [leaf_hash(h) for h in record_hashes]
+
+    def mth(lo: int, hi: int) -> bytes:
+        if hi - lo == 1:
+            return level[lo]
+        k = _split(hi - lo)
+        return node_hash(mth(lo, lo + k), mth(lo + k, hi))
+
+    return mth(0, len(level)).hex()
+
+
+def verify_inclusion(record_hash: str, index: int, size: int, path: Sequence[str], root: str) -> bool:
+    """True if the record with `record_hash` is leaf `index` of the tree of `size` leaves with `root`.
+
+    RFC 9162, section 2.1.3.2; O(len(path)) = O(log size).
+    """
+    if not 0 <= index < size:
+        return False
+    fn, sn = index, size - 1
+    r = leaf_hash(record_hash)
+    for p in path:
+        if sn == 0:
+            return False
+        p = bytes.fromhex(p)
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            if not fn & 1:
+                while not fn & 1 and fn:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r.hex() == root
+
+
+class MerkleLog:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS nodes (level INTEGER NOT NULL, idx INTEGER NOT NULL, "
+                         "hash BLOB NOT NULL, PRIMARY KEY (level, idx)) WITHOUT ROWID")
+        self._db.execute("CREATE TABLE IF NOT EXISTS leaves (idx INTEGER PRIMARY KEY, record_hash TEXT NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS checkpoints (size INTEGER PRIMARY KEY, root TEXT NOT NULL, "
+                         "ts REAL NOT NULL)")
+        self._db.commit()
+        row = self._db.execute("SELECT MAX(idx) FROM leaves").fetchone()
+        self.size = 0 if row[0] is None else row[0] + 1
+        # Complete nodes still waiting for a right sibling: one per set bit of size.
+        self._edge: Dict[int, bytes] = {}
+        for level in range(self.size.bit_length()):
+            if self.size >> level & 1:
+                self._edge[level] = self._node(level, (self.size >> level) - 1)
+
+    def _node(self, level: int, idx: int) -> bytes:
+        if level == 0:
+            row = self._db.execute("SELECT record_hash FROM leaves WHERE idx = ?", (idx,)).fetchone()
+            return leaf_hash(row[0]) if row else self._missing(level, idx)
+        row = self._db.execute("SELECT hash FROM nodes WHERE level = ? AND idx = ?", (level, idx)).fetchone()
+        return row[0] if row else self._missing(level, idx)
+
+    def _missing(self, level: int, idx: int) -> bytes:
+        raise KeyError(f"missing merkle node ({level}, {idx})")
+
+    def add(self, first_index: int, record_hashes: Sequence[str]) -> bool:
+        """Append leaves for records `first_index, first_index + 1, ...`.
+
+        The tree has no gaps, so a batch starting anywhere but `size` is
+        refused with False and the ledger is re-read by `catch_up`.
+        """
+        with self._lock:
+            if first_index != self.size:
+                return False
+            rows = []
+            leaves = []
+            for h in record_hashes:
+                leaves.append((self.size, h))
+                # leaves are stored as record hashes; nodes from level 1 up
+                i, level, cur = self.size, 0, leaf_hash(h)
+                while i & 1:
+                    cur = node_hash(self._edge.pop(level), cur)
+                    i >>= 1
+                    level += 1
+                    rows.append((level, i, cur))
+                self._edge[level] = cur
+                self.size += 1
+            self._db.executemany("INSERT OR REPLACE INTO nodes (level, idx, hash) VALUES (?, ?, ?)", rows)
+            self._db.executemany("INSERT OR REPLACE INTO leaves (idx, record_hash) VALUES (?, ?)", leaves)
+            self._db.commit()
+            return True
+
+    def catch_up(self, ledger) -> None:
+        """Add leaves for every record of `ledger` past the current size."""
+        if ledger.head()[1] < self.size:
+            return
+        batch: List[str] = []
+        for rec in ledger.records(start_seq=self.size):
+            batch.append(rec["hash"])
+            if len(batch) >= 10000:
+                self.add(self.size, batch)
+                batch = []
+        if batch:
+            self.add(self.size, batch)
+
+    def record_hash(self, index: int) -> str:
+        with self._lock:
+            row = self._db.execute("SELECT record_hash FROM leaves WHERE idx = ?", (index,)).fetchone()
+        if row is None:
+            raise ValueError(f"no leaf {index} (stored: {self.size})")
+        return row[0]
+
+    def _range_hash(self, lo: int, hi: int) -> bytes:
+        # MTH(D[lo:hi]); every power-of-two run reached here is aligned, hence stored
+        n = hi - lo
+        if n & (n - 1) == 0:
+            return self._node(n.bit_length() - 1, lo // n)
+        k = _split(n)
+        return node_hash(self._range_hash(lo, lo + k), self._range_hash(lo + k, hi))
+
+    def root(self, size: Optional[int] = None) -> str:
+        size = self.size if size is None else size
+        if not 0 <= size <= self.size:
+            raise ValueError(f"tree has {self.size} leaves, not {size}")
+        with self._lock:
+            return self._range_hash(0, size).hex() if size else EMPTY_ROOT
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Record (size, root) for the current tree and return it."""
+        cp = {"size": self.size, "root": self.root(), "ts": time.time()}
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO checkpoints (size, root, ts) VALUES (?, ?, ?)",
+                             (cp["size"], cp["root"], cp["ts"]))
+            self._db.commit()
+        return cp
+
+    def checkpoints(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute("SELECT size, root, ts FROM checkpoints ORDER BY size").fetchall()
+        return [{"size": s, "root": r, "ts": ts} for s, r, ts in rows]
+
+    def latest_checkpoint(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT size, root, ts FROM checkpoints ORDER BY size DESC LIMIT 1").fetchone()
+        return {"size": row[0], "root": row[1], "ts": row[2]} if row else None
+
+    def proof(self, index: int, size: Optional[int] = None) -> List[str]:
+        """Inclusion path of leaf `index` in the tree of the first `size` leaves (default: all)."""
+        size = self.size if size is None else size
+        if not 0 <= index < size <= self.size:
+            raise ValueError(f"no leaf {index} in a tree of {size} (stored: {self.size})")
+        path: List[bytes] = []
+        lo, hi = 0, size
+        with self._lock:
+            # RFC 6962 PATH(m, D[lo:hi]), iteratively; siblings collected top-down
+            while hi - lo > 1:
+                k = _split(hi - lo)
+                if index < lo + k:
+                    path.append(self._range_hash(lo + k, hi))
+                    hi = lo + k
+                else:
+                    path.append(self._range_hash(lo, lo + k))
+                    lo += k
+        return [p.hex() for p in reversed(path)]
+
+    def close(self) -> None:
+        self._db.close()
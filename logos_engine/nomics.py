@@ -1,29 +1,49 @@
-from typing import Dict, Any, List, Tuple
-from .se import estimate_se, normalize_se
+from contextlib import nullcontext
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+from .se import estimate_se, estimate_se_async, estimate_se_many, normalize_se
 from .m_gate import blast_radius, traceability_score, accept
 from .store import Ledger
+from .rulebook import RuleBook, ProcedureTable, Rules, Procedures
+
+_STATUS_FOR_ACTION = {
+    "transmute_to_constitutional": "constitutional",
+    "transmute_to_statutory": "statutory",
+}
 
 def validate_structural(amendment: Dict[str, Any]) -> bool:
     required = ["id", "parent_ids", "status_action", "content_delta", "procedure_id", "evidence"]
     return all(k in amendment for k in required)
 
-def validate_juridical(amendment: Dict[str, Any], procedures: List[Dict[str, Any]], rules: List[Dict[str, Any]]) -> bool:
-    pid = amendment.get("procedure_id")
-    proc = next((p for p in procedures if p["id"] == pid), None)
+def validate_juridical(amendment: Dict[str, Any], procedures: Procedures, rules: Rules) -> bool:
+    proc = ProcedureTable.of(procedures).get(amendment.get("procedure_id"))
     if not proc:
         return False
     if amendment.get("status_action") != "none" and not proc.get("transmutation_allowed", False):
         return False
     return True
 
-def propose(amendment: Dict[str, Any], rules: List[Dict[str, Any]], thresholds: Dict[str, float], procedures: List[Dict[str, Any]], ledger: Ledger) -> Tuple[bool, Dict[str, float]]:
+def apply_amendment(amendment: Dict[str, Any], rules: Rules) -> None:
+    """Apply an accepted amendment's delta and status action to its parent rules in place."""
+    book = RuleBook.of(rules)
+    delta = amendment.get("content_delta", {})
+    status = _STATUS_FOR_ACTION.get(amendment.get("status_action"))
+    for rid in amendment.get("parent_ids", []):
+        if book.update(rid, delta) and status:
+            book[rid]["status"] = status
+
+
+def _screen(amendment: Dict[str, Any], procedures: Procedures, rules: Rules) -> Optional[Tuple[bool, Dict[str, float]]]:
+    """Structural + juridical checks; returns the rejection, or None to continue."""
     if not validate_structural(amendment):
         return False, {"parse/typing": 0.0}
 
     if not validate_juridical(amendment, procedures, rules):
         return False, {"error": "procedure/hierarchy"}
+    return None
 
-    se = estimate_se(amendment, rules)
+
+def _decide(amendment: Dict[str, Any], rules: Rules, thresholds: Dict[str, float], se: float, ledger: Ledger) -> Tuple[bool, Dict[str, float]]:
     C = 1.0 - normalize_se(se)
     TR = traceability_score(amendment, rules)
     BR = blast_radius(amendment, rules)
@@ -31,14 +51,7 @@ def propose(amendment: Dict[str, Any], rules: List[Dict[str, Any]], thresholds:
     ok, metrics = accept(C, TR, BR, thresholds["coherence"], thresholds["traceability"], thresholds["blast_radius"])
     if ok:
         # Apply delta (very simplified): update fields on parent rules
-        for rid in amendment.get("parent_ids", []):
-            for r in rules:
-                if r["id"] == rid:
-                    r.update(amendment.get("content_delta", {}))
-                    if amendment.get("status_action") == "transmute_to_constitutional":
-                        r["status"] = "constitutional"
-                    elif amendment.get("status_action") == "transmute_to_statutory":
-                        r["status"] = "statutory"
+        apply_amendment(amendment, rules)
         ledger.append({"amendment": amendment, "metrics": metrics})
         return True, metrics  # metrics: Dict[str, float]
     else:
@@ -47,3 +60,74 @@ def propose(amendment: Dict[str, Any], rules: List[Dict[str, Any]], thresholds:
             # use a 0.0 score instead of a string
             return False, {"procedure/hierarchy": 0.0}
         return False, metrics
+
+
+def propose(amendment: Dict[str, Any], rules: Rules, thresholds: Dict[str, float], procedures: Procedures, ledger: Ledger) -> Tuple[bool, Dict[str, float]]:
+    rejected = _screen(amendment, procedures, rules)
+    if rejected is not None:
+        return rejected
+    return _decide(amendment, rules, thresholds, estimate_se(amendment, rules), ledger)
+
+
+async def propose_async(amendment: Dict[str, Any], rules: Rules, thresholds: Dict[str, float], procedures: Procedures, ledger: Ledger) -> Tuple[bool, Dict[str, float]]:
+    """Async `propose`: only SE estimation awaits, via `estimate_se_async`.
+
+    Screening, the gate, rule updates and the ledger append run without
+    yielding to the loop, so concurrent calls (e.g. under `asyncio.gather`)
+    never interleave a decision; they commit in the order estimates finish.
+    """
+    rejected = _screen(amendment, procedures, rules)
+    if rejected is not None:
+        return rejected
+    se = await estimate_se_async(amendment, rules)
+    return _decide(amendment, rules, thresholds, se, ledger)
+
+
+def propose_many(amendments: Iterable[Dict[str, Any]], rules: Rules, thresholds: Dict[str, float], procedures: Procedures, ledger: Ledger, chunk_size: int = 256) -> Iterator[Tuple[Any, bool, Dict[str, float]]]:
+    """Stream amendments through `propose` semantics, yielding (id, ok, metrics).
+
+    Amendments are pulled from the iterable `chunk_size` at a time, so memory
+    stays bounded. Per chunk, SE is estimated in one `estimate_se_many` call
+    and accepted records are committed to the ledger in one transaction; the
+    chunk's results are yielded after that commit. Decisions and commit order
+    match calling `propose` in a loop: an estimate is redone individually if
+    an earlier amendment in the same chunk already changed one of its parent
+    rules (adapters are assumed to depend on the amendment and its parents).
+    If an estimate raises, the decisions made so far are committed and
+    yielded before the error propagates, so rules and ledger stay in step.
+    """
+    book = RuleBook.of(rules)
+    table = ProcedureTable.of(procedures)
+    it = iter(amendments)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        screened = [_screen(a, table, book) for a in chunk]
+        pending = [a for a, r in zip(chunk, screened) if r is None]
+        estimates = iter(estimate_se_many(pending, book))
+        touched: Set[str] = set()
+        results: List[Tuple[Any, bool, Dict[str, float]]] = []
+        error: Optional[Exception] = None
+        begin = getattr(ledger, "transaction", None)
+        with (begin() if begin else nullcontext(ledger)) as sink:
+            try:
+                for a, rejected in zip(chunk, screened):
+                    if rejected is not None:
+                        results.append((a.get("id"), *rejected))
+                        continue
+                    se = next(estimates)
+                    parents = set(a.get("parent_ids", []))
+                    if parents & touched:
+                        se = estimate_se(a, book)
+                    ok, metrics = _decide(a, book, thresholds, se, sink)
+                    if ok:
+                        touched |= parents
+                    results.append((a.get("id"), ok, metrics))
+            except Exception as e:
+                # Rules already reflect the decisions so far; commit their
+                # records too, as a `propose` loop would have, then re-raise.
+                error = e
+        yield from results
+        if error is not None:
+            raise error
@@ -0,0 +1,149 @@
+"""Rebuild rule state from the ledger without re-scoring.
+
+Only accepted amendments are recorded, so replaying the ledger in seq order
+and applying each record's amendment (content_delta and status_action,
+via `nomics.apply_amendment`) to the base rules reproduces the live rule
+state. The SE adapter and the gate are never called.
+
+With a `snapshot_dir`, `ReplayEngine` writes a rule-state snapshot every
+`snapshot_every` records as `rules-<seq>.json`, holding {seq, hash, base,
+rules}: the ledger position, the record hash at that position, and a
+fingerprint of the base rules. The newest `keep` snapshots are kept. On
+the next start, `run` resumes from the newest snapshot that still matches:
+same base rules, a record at its seq with its hash. Only the tail after it
+is replayed.
+"""
+
+import copy, hashlib, json, os, time
+from typing import Any, Dict, List, Optional, Set
+
+from .nomics import apply_amendment
+from .rulebook import RuleBook, Rules
+from .store import Ledger
+from .types import canonical_json
+
+
+def rules_fingerprint(rules: Rules) -> str:
+    return hashlib.sha256(canonical_json(list(rules)).encode("utf-8")).hexdigest()
+
+
+class ReplayEngine:
+    def __init__(self, ledger: Ledger, base_rules: Rules, snapshot_dir: Optional[str] = None,
+                 snapshot_every: int = 1000, keep: int = 3):
+        self.ledger = ledger
+        self.base_rules = copy.deepcopy(list(base_rules))
+        self.base = rules_fingerprint(self.base_rules)
+        self.snapshot_dir = snapshot_dir
+        self.snapshot_every = snapshot_every
+        self.keep = keep
+        if snapshot_dir:
+            os.makedirs(snapshot_dir, exist_ok=True)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.book = RuleBook(copy.deepcopy(self.base_rules))
+        self.seq = -1
+        self.hash: Optional[str] = None
+        self._last_snapshot = -1
+
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        return self.book.to_list()
+
+    # -- snapshots ------------------------------------------------------------
+
+    def snapshot_paths(self) -> List[str]:
+        """Snapshot files, newest first."""
+        if not self.snapshot_dir:
+            return []
+        names = sorted((n for n in os.listdir(self.snapshot_dir) if n.startswith("rules-") and n.endswith(".json")),
+                       reverse=True)
+        return [os.path.join(self.snapshot_dir, n) for n in names]
+
+    def snapshot(self) -> Optional[str]:
+        """Write the current state as a snapshot (no-op before the first record)."""
+        if not self.snapshot_dir or self.seq < 0:
+            return None
+        path = os.path.join(self.snapshot_dir, f"rules-{self.seq:012d}.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump({"seq": self.seq, "hash": self.hash, "base": self.base, "rules": self.rules}, f)
+        os.replace(path + ".tmp", path)
+        self._last_snapshot = self.seq
+        for old in self.snapshot_paths()[self.keep:]:
+            os.remove(old)
+        return path
+
+    def _load_snapshot(self, head_seq: int, stale: Set[int]) -> bool:
+        # newest usable snapshot, passing over those whose seq turned out stale
+        for path in self.snapshot_paths():
+            try:
+                with open(path) as f:
+                    snap = json.load(f)
+            except (OSError, ValueError):
+                continue
+            seq = snap.get("seq", head_seq + 1)
+            if snap.get("base") != self.base or seq > head_seq or seq in stale:
+                continue
+            self.book = RuleBook(snap["rules"])
+            self.seq, self.hash = snap["seq"], snap["hash"]
+            self._last_snapshot = self.seq
+            return True
+        return False
+
+    # -- replay -------------------------------------------------------------
+
+    def run(self) -> Dict[str, Any]:
+        """Bring the rule state up to the ledger head.
+
+        A fresh engine starts from the best snapshot; later calls continue
+        from where the previous one stopped. Returns a report with the
+        snapshot resumed from (`from_seq`), records `replayed`, the `head`
+        seq and `snapshots` written.
+        """
+        t0 = time.perf_counter()
+        head_seq = self.ledger.head()[1]
+        stale: Set[int] = set()
+        if self.seq < 0 and self.snapshot_dir:
+            self._load_snapshot(head_seq, stale)
+        while True:
+            from_seq = self.seq
+            replayed, written, diverged = self._stream(head_seq)
+            if not diverged:
+                break
+            # The ledger no longer has the recorded hash at this position:
+            # drop to an older snapshot, or to the base rules.
+            stale.add(from_seq)
+            self._reset()
+            self._load_snapshot(head_seq, stale)
+        return {"from_seq": from_seq, "replayed": replayed, "head": self.seq, "snapshots": written,
+                "seconds": time.perf_counter() - t0}
+
+    def _stream(self, head_seq: int):
+        replayed = written = 0
+        start = max(0, self.seq)
+        for rec in self.ledger.records(start_seq=start):
+            seq = rec["seq"]
+            if seq > head_seq:
+                break
+            if seq <= self.seq:
+                if seq == self.seq and rec["hash"] != self.hash:
+                    return replayed, written, True
+                continue
+            obj = rec.get("obj")
+            amendment = obj.get("amendment") if isinstance(obj, dict) else None
+            if isinstance(amendment, dict):
+                apply_amendment(amendment, self.book)
+            self.seq, self.hash = seq, rec["hash"]
+            replayed += 1
+            if self.snapshot_dir and self.snapshot_every and self.seq - self._last_snapshot >= self.snapshot_every:
+                self.snapshot()
+                written += 1
+        return replayed, written, False
+
+
+def replay_rules(ledger: Ledger, base_rules: Rules, snapshot_dir: Optional[str] = None,
+                 snapshot_every: int = 1000) -> List[Dict[str, Any]]:
+    """Rule state at the ledger head; see `ReplayEngine`."""
+    engine = ReplayEngine(ledger, base_rules, snapshot_dir, snapshot_every)
+    engine.run()
+    return engine.rules
@@ -0,0 +1,39 @@
+"""Row caps for SQLite cache tables.
+
+Finding the rows past a limit with `ORDER BY ... OFFSET` walks an index on
+every insert. `RowCap` keeps the table's row count in memory instead and,
+once it passes `limit`, deletes the lowest rows by `order_by` down to 1/64
+below the limit, so trimming is rare and costs one short index range.
+Used by `se_cache.SECache` and `llm_adapter.cache.CachingClient`.
+"""
+
+import sqlite3
+
+
+class RowCap:
+    def __init__(self, db: sqlite3.Connection, table: str, key: str, order_by: str, limit: int):
+        self._db = db
+        self.table = table
+        self.key = key
+        self.order_by = order_by
+        self.limit = limit
+        self.recount()
+
+    def recount(self) -> int:
+        self.count = self._db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        return self.count
+
+    def before_upsert(self, key_value) -> None:
+        """Count the row an INSERT OR REPLACE of `key_value` is about to add, if new."""
+        if self._db.execute(f"SELECT 1 FROM {self.table} WHERE {self.key} = ?", (key_value,)).fetchone() is None:
+            self.count += 1
+
+    def trim(self) -> int:
+        """Delete the lowest rows if over the limit; returns how many. The caller commits."""
+        if self.count <= self.limit:
+            return 0
+        n = self.count - self.limit + self.limit // 64
+        self._db.execute(f"DELETE FROM {self.table} WHERE {self.key} IN "
+                         f"(SELECT {self.key} FROM {self.table} ORDER BY {self.order_by} LIMIT ?)", (n,))
+        self.count -= n
+        return n
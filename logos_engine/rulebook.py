@@ -0,0 +1,63 @@
+"""Id-keyed tables for rules and procedures.
+
+`propose` and friends historically take lists of dicts and scan them by id.
+`RuleBook` / `ProcedureTable` index the same dict objects by id so lookups
+and updates are O(1) while iteration still yields the plain dicts, which
+keeps list-style consumers working. Updates are applied in place, so a
+RuleBook built from a caller's list mutates that caller's rule dicts.
+"""
+
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
+
+
+class IdTable:
+    def __init__(self, items: Iterable[Dict[str, Any]] = ()):
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            self.add(item)
+
+    @classmethod
+    def of(cls, items: Union["IdTable", Iterable[Dict[str, Any]]]):
+        """Return `items` unchanged if already a table of this type, else index it."""
+        return items if isinstance(items, cls) else cls(items)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self._by_id[item["id"]] = item
+
+    def get(self, item_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(item_id, default)
+
+    def __getitem__(self, item_id: str) -> Dict[str, Any]:
+        return self._by_id[item_id]
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._by_id.values())
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self._by_id.values())
+
+
+class RuleBook(IdTable):
+    """Rules keyed by id."""
+
+    def update(self, rule_id: str, delta: Dict[str, Any]) -> bool:
+        """Merge `delta` into the rule in place; False if the id is unknown."""
+        rule = self._by_id.get(rule_id)
+        if rule is None:
+            return False
+        rule.update(delta)
+        return True
+
+
+class ProcedureTable(IdTable):
+    """Procedures keyed by id."""
+
+
+Rules = Union[RuleBook, List[Dict[str, Any]]]
+Procedures = Union[ProcedureTable, List[Dict[str, Any]]]
@@ -0,0 +1,76 @@
+"""Adaptive (early-stopping) sampling of ensemble interpretations.
+
+Ensemble SE adapters ask N members for an interpretation and turn the
+answer histogram into a normalized entropy. `sample_in_waves` asks the
+members in waves and, after each wave, computes exact bounds on the final
+entropy over every way the unasked members could still answer
+(`completion_bounds`). It stops as soon as
+
+- the accept/reject bucket at `coherence_threshold` (θC, with
+  C = 1 - SE as in the M-gate) is the same for every possible completion, or
+- the bounds are narrower than `tolerance`.
+
+A full run returns exactly the non-adaptive value; an early stop returns the
+sample estimate clipped into the bounds, so the gate decision is unchanged.
+"""
+
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+
+# entropy of a histogram, given its bucket counts (in first-seen order)
+EntropyOfCounts = Callable[[Sequence[int]], float]
+
+
+def completion_bounds(counts: Sequence[int], remaining: int, entropy_of_counts: EntropyOfCounts) -> Tuple[float, float]:
+    """Min/max of `entropy_of_counts` over all completions with `remaining` more answers.
+
+    Enumerates the reachable count multisets (each new answer joins an
+    existing bucket or opens a new one), which stays small for ensemble sizes.
+    """
+    states = {tuple(sorted(counts, reverse=True))}
+    for _ in range(remaining):
+        nxt = set()
+        for st in states:
+            for i, c in enumerate(st):
+                if i and st[i - 1] == c:
+                    continue  # same count as the previous bucket: same result
+                nxt.add(tuple(sorted(st[:i] + (c + 1,) + st[i + 1:], reverse=True)))
+            nxt.add(st + (1,))
+        states = nxt
+    values = [entropy_of_counts(st) for st in states]
+    return min(values), max(values)
+
+
+def sample_in_waves(ask_wave: Callable[[List[int]], List[str]], total: int, entropy_of_counts: EntropyOfCounts,
+                    coherence_threshold: Optional[float] = None, tolerance: Optional[float] = None,
+                    min_samples: int = 3, wave_size: int = 2) -> Tuple[float, Dict[str, Any]]:
+    """Query members `0..total-1` in waves via `ask_wave(indices) -> answers`.
+
+    Returns (entropy, report) where report holds `calls`, `skipped`, the final
+    `bounds` and `stopped` ("decision", "tolerance" or "exhausted").
+    """
+    freq: Dict[str, int] = {}
+    asked = 0
+    bounds = (0.0, 1.0)
+    stopped = "exhausted"
+    while asked < total:
+        step = min_samples if asked == 0 else wave_size
+        wave = list(range(asked, min(total, asked + max(1, step))))
+        for answer in ask_wave(wave):
+            freq[answer] = freq.get(answer, 0) + 1
+        asked += len(wave)
+        if asked >= total:
+            break
+        lo, hi = bounds = completion_bounds(list(freq.values()), total - asked, entropy_of_counts)
+        if coherence_threshold is not None and (1.0 - hi >= coherence_threshold or 1.0 - lo < coherence_threshold):
+            stopped = "decision"
+            break
+        if tolerance is not None and hi - lo <= tolerance:
+            stopped = "tolerance"
+            break
+
+    value = entropy_of_counts(list(freq.values())) if freq else 0.0
+    if stopped == "exhausted":
+        bounds = (value, value)
+    else:
+        value = min(bounds[1], max(bounds[0], value))
+    return value, {"calls": asked, "skipped": total - asked, "bounds": bounds, "stopped": stopped}
@@ -6,13 +6,24 @@ interface so you can plug in an LLM or ensemble adjudicator.
 Contract for adapters:
 - Accepts (amendment: dict, rules: list[dict])
 - Returns a float in [0.0, 1.0] representing estimated semantic entropy (higher = more entropy)
+
+Async adapters follow the same contract as coroutine functions; register them
+with `set_async_adapter` and call `estimate_se_async`.
 """
 
-from typing import Dict, Any, List, Callable
+import asyncio
+from concurrent.futures import Executor
+from typing import Dict, Any, Awaitable, List, Callable, Optional
 
 # Type for adapter: function(amendment, rules) -> float
 SEAdapter = Callable[[Dict[str, Any], List[Dict[str, Any]]], float]
 
+# Optional batch adapter: function(amendments, rules) -> list of floats, one per amendment
+SEBatchAdapter = Callable[[List[Dict[str, Any]], List[Dict[str, Any]]], List[float]]
+
+# Async adapter: coroutine function(amendment, rules) -> float, for network-backed estimators
+AsyncSEAdapter = Callable[[Dict[str, Any], List[Dict[str, Any]]], Awaitable[float]]
+
 
 def factoidize(amendment: Dict[str, Any]) -> List[str]:
     facts: List[str] = []
@@ -45,6 +56,10 @@ def normalize_se(se: float) -> float:
 
 # Default adapter points to the demo proxy. Replace this with your LLM/ensemble adapter.
 _adapter: SEAdapter = demo_estimate_se
+_batch_adapter: Optional[SEBatchAdapter] = None
+_async_adapter: Optional[AsyncSEAdapter] = None
+# Optional memoization layer (see se_cache.SECache); None disables caching.
+_cache = None
 
 
 def set_adapter(adapter: SEAdapter) -> None:
@@ -57,9 +72,53 @@ def set_adapter(adapter: SEAdapter) -> None:
         return 0.42
 
     set_adapter(my_adapter)
+
+    Clears any batch or async adapter, since they would no longer match.
     """
-    global _adapter
+    global _adapter, _batch_adapter, _async_adapter
     _adapter = adapter
+    _batch_adapter = None
+    _async_adapter = None
+
+
+def set_batch_adapter(adapter: Optional[SEBatchAdapter]) -> None:
+    """Register a batch SE adapter used by `estimate_se_many`.
+
+    It must return the same values the single adapter would, in input order.
+    Pass None to fall back to calling the single adapter per amendment.
+    """
+    global _batch_adapter
+    _batch_adapter = adapter
+
+
+def set_async_adapter(adapter: Optional[AsyncSEAdapter]) -> None:
+    """Register an async SE adapter used by `estimate_se_async`.
+
+    Example:
+
+    async def my_adapter(amendment: dict, rules: list[dict]) -> float:
+        return await call_llm_ensemble(amendment)
+
+    set_async_adapter(my_adapter)
+
+    Pass None to go back to running the sync adapter in a thread executor.
+    """
+    global _async_adapter
+    _async_adapter = adapter
+
+
+def set_cache(cache) -> None:
+    """Register an `se_cache.SECache` (or None to disable caching).
+
+    The cache is keyed on factoids, parent ids and the cache's rules-version
+    token, not on the adapter: clear it or bump the token after `set_adapter`.
+    """
+    global _cache
+    _cache = cache
+
+
+def _clamp(x: float) -> float:
+    return float(max(0.0, min(1.0, x)))
 
 
 def estimate_se(amendment: Dict[str, Any], rules: List[Dict[str, Any]]) -> float:
@@ -67,5 +126,53 @@ def estimate_se(amendment: Dict[str, Any], rules: List[Dict[str, Any]]) -> float
 
     Always returns a float in [0,1].
     """
-    return float(max(0.0, min(1.0, _adapter(amendment, rules))))
+    if _cache is not None:
+        return _cache.get_or_compute(amendment, lambda: _clamp(_adapter(amendment, rules)))
+    return _clamp(_adapter(amendment, rules))
+
 
+def estimate_se_many(amendments: List[Dict[str, Any]], rules: List[Dict[str, Any]]) -> List[float]:
+    """Estimate SE for several amendments against the same rules, in order.
+
+    With a cache registered only the misses reach the adapter.
+    """
+    if not amendments:
+        return []
+    out: List[Optional[float]] = [None] * len(amendments)
+    keys: List[Optional[str]] = [None] * len(amendments)
+    if _cache is not None:
+        for i, a in enumerate(amendments):
+            keys[i] = _cache.key(a)
+            out[i] = _cache.get(keys[i])
+    todo = [i for i, x in enumerate(out) if x is None]
+    if todo:
+        batch = [amendments[i] for i in todo]
+        raw = _batch_adapter(batch, rules) if _batch_adapter is not None else [_adapter(a, rules) for a in batch]
+        for i, x in zip(todo, raw):
+            out[i] = _clamp(x)
+            if _cache is not None:
+                _cache.put(keys[i], out[i])
+    return out
+
+
+async def estimate_se_async(amendment: Dict[str, Any], rules: List[Dict[str, Any]], executor: Optional[Executor] = None) -> float:
+    """Async counterpart of `estimate_se`.
+
+    Awaits the registered async adapter; without one, the sync adapter runs
+    in `executor` (default: the loop's thread pool) so the loop stays free.
+    Honours the SE cache like `estimate_se`.
+    """
+    key = None
+    if _cache is not None:
+        key = _cache.key(amendment)
+        hit = _cache.get(key)
+        if hit is not None:
+            return hit
+    if _async_adapter is not None:
+        value = _clamp(await _async_adapter(amendment, rules))
+    else:
+        loop = asyncio.get_running_loop()
+        value = _clamp(await loop.run_in_executor(executor, _adapter, amendment, rules))
+    if _cache is not None:
+        _cache.put(key, value)
+    return value
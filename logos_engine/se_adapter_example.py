@@ -14,26 +14,37 @@ Usage:
     se.set_adapter(ensemble_estimate_se)
 
 Adapter signature: func(amendment: dict, rules: list[dict]) -> float
+
+`ensemble_estimate_se_batch` scores many amendments at once (requires NumPy)
+and can be registered with `se.set_batch_adapter`.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import hashlib, json, math
+from logos_engine.sampling import sample_in_waves
+from logos_engine.se import factoidize
+
+# Interpretation templates per model, in choice-index order.
+_LEVELS = ("noop", "minor", "moderate", "major", "intent_change")
+
 
+def _key_prefix(amendment: Dict[str, Any], facts: List[str]) -> "hashlib._Hash":
+    # sha256 state over the part of the model key shared by every model index
+    return hashlib.sha256((amendment.get("id", "") + "|" + json.dumps(facts, sort_keys=True) + "|").encode("utf-8"))
 
-def _deterministic_choice(seed_bytes: bytes, choices: List[str]) -> str:
-    # Map deterministic bytes -> index
-    idx = int.from_bytes(seed_bytes, "big") % len(choices)
-    return choices[idx]
 
+def _choice_index(prefix: "hashlib._Hash", model_idx: int) -> int:
+    h = prefix.copy()
+    h.update(str(model_idx).encode("utf-8"))
+    return int.from_bytes(h.digest(), "big") % len(_LEVELS)
 
-def _model_interpretation(amendment: Dict[str, Any], facts: List[str], model_idx: int) -> str:
-    # Create a deterministic pseudo-random interpretation string for a model
-    key = (amendment.get("id", "") + "|" + json.dumps(facts, sort_keys=True) + f"|{model_idx}").encode("utf-8")
-    h = hashlib.sha256(key).digest()
-    # Candidate interpretation templates derived from facts
+
+def _model_interpretation(amendment: Dict[str, Any], facts: List[str], model_idx: int,
+                          prefix: Optional["hashlib._Hash"] = None) -> str:
+    # Create a deterministic pseudo-random interpretation string for a model:
+    # sha256(id|facts-json|model_idx) picks one of the templates derived from facts
     base = facts[0] if facts else "noop"
-    choices = [f"{base}:noop", f"{base}:minor", f"{base}:moderate", f"{base}:major", f"{base}:intent_change"]
-    return _deterministic_choice(h, choices)
+    return f"{base}:{_LEVELS[_choice_index(prefix or _key_prefix(amendment, facts), model_idx)]}"
 
 
 def _shannon_entropy(probs: List[float]) -> float:
@@ -41,6 +52,16 @@ def _shannon_entropy(probs: List[float]) -> float:
     return -sum(p * math.log(p) for p in probs if p > 0.0)
 
 
+def _normalized_entropy(counts: Sequence[int]) -> float:
+    # Shannon entropy of the histogram, normalized by log(#answers) so max entropy -> 1.0
+    n = sum(counts)
+    probs = [count / n for count in counts]
+    H = _shannon_entropy(probs)
+    H_max = math.log(n)
+    normalized = 0.0 if H_max <= 0.0 else min(1.0, H / H_max)
+    return float(max(0.0, min(1.0, normalized)))
+
+
 def ensemble_estimate_se(amendment: Dict[str, Any], rules: List[Dict[str, Any]], num_models: int = 7) -> float:
     """Simulate an ensemble of `num_models` deterministic judgments and return
     normalized semantic entropy in [0,1].
@@ -55,34 +76,79 @@ def ensemble_estimate_se(amendment: Dict[str, Any], rules: List[Dict[str, Any]],
     if num_models <= 1:
         return 0.0
 
-    # Try to use the packaged factoidize if available for parity
-    try:
-        from logos_engine.se import factoidize
-    except Exception:
-        # fallback local extraction
-        facts = []
-        for k, v in amendment.get("content_delta", {}).items():
-            facts.append(f"{k}:{str(v).strip()}")
-        facts = facts or ["noop"]
-    else:
-        facts = factoidize(amendment)
+    facts = factoidize(amendment)
+    prefix = _key_prefix(amendment, facts)
 
     interpretations: List[str] = []
     for i in range(num_models):
-        interpretations.append(_model_interpretation(amendment, facts, i))
+        interpretations.append(_model_interpretation(amendment, facts, i, prefix))
 
     # Frequency -> probs
     freq: Dict[str, int] = {}
     for it in interpretations:
         freq[it] = freq.get(it, 0) + 1
 
-    probs = [count / num_models for count in freq.values()]
+    return _normalized_entropy(list(freq.values()))
 
-    # Entropy normalized by log(num_models) so max entropy -> 1.0
-    H = _shannon_entropy(probs)
-    H_max = math.log(num_models)
-    normalized = 0.0 if H_max <= 0.0 else min(1.0, H / H_max)
-    return float(max(0.0, min(1.0, normalized)))
+
+def ensemble_estimate_se_adaptive(amendment: Dict[str, Any], rules: List[Dict[str, Any]], num_models: int = 7,
+                                  coherence_threshold: Optional[float] = None, tolerance: Optional[float] = None,
+                                  min_samples: int = 3, wave_size: int = 2) -> Tuple[float, Dict[str, Any]]:
+    """Early-stopping variant of `ensemble_estimate_se` (see logos_engine.sampling).
+
+    Models are queried in waves; sampling stops once the accept/reject bucket
+    at `coherence_threshold` or the entropy (within `tolerance`) can no longer
+    change. Returns (se, report); report["skipped"] counts the saved calls.
+    """
+    if num_models <= 1:
+        return 0.0, {"calls": 0, "skipped": 0, "bounds": (0.0, 0.0), "stopped": "exhausted"}
+    facts = factoidize(amendment)
+    prefix = _key_prefix(amendment, facts)
+    ask = lambda idx: [_model_interpretation(amendment, facts, i, prefix) for i in idx]
+    return sample_in_waves(ask, num_models, _normalized_entropy, coherence_threshold, tolerance, min_samples, wave_size)
+
+
+def ensemble_estimate_se_batch(amendments: Sequence[Dict[str, Any]], rules: List[Dict[str, Any]],
+                               num_models: int = 7) -> List[float]:
+    """`ensemble_estimate_se` for many amendments at once (requires NumPy).
+
+    Each amendment's key prefix is hashed once. Digests are reduced to choice
+    indices in one NumPy pass: a big-endian integer mod 5 is a weighted byte
+    sum. Histograms for the whole batch come from one `bincount`, put in the
+    scalar's first-seen order. The entropy is then evaluated once per
+    distinct histogram with the scalar code, because there are few of them
+    (compositions of `num_models`). Outputs are therefore bit-identical to
+    `ensemble_estimate_se`.
+    """
+    import numpy as np
+
+    if num_models <= 1 or not amendments:
+        return [0.0] * len(amendments)
+    k = len(_LEVELS)
+    m = len(amendments)
+    suffixes = [str(i).encode("utf-8") for i in range(num_models)]
+    digests = bytearray()
+    for a in amendments:
+        prefix = _key_prefix(a, factoidize(a))
+        for suffix in suffixes:
+            h = prefix.copy()
+            h.update(suffix)
+            digests += h.digest()
+    # int.from_bytes(d, "big") % k == sum(d[j] * (256 ** (31 - j) % k)) % k
+    weights = np.array([pow(256, 31 - j, k) for j in range(32)], dtype=np.int64)
+    raw = np.frombuffer(bytes(digests), dtype=np.uint8).reshape(m, num_models, 32).astype(np.int64)
+    choice = (raw @ weights) % k
+
+    counts = np.bincount((choice + k * np.arange(m)[:, None]).ravel(), minlength=m * k).reshape(m, k)
+    # first model index answering each choice (num_models if none did)
+    first = np.full((m, k), num_models, dtype=np.int64)
+    np.minimum.at(first, (np.repeat(np.arange(m), num_models), choice.ravel()), np.tile(np.arange(num_models), m))
+    order = np.argsort(first, axis=1, kind="stable")
+    hist = np.take_along_axis(counts, order, axis=1)  # first-seen order, unused choices (0) last
+
+    distinct, inverse = np.unique(hist, axis=0, return_inverse=True)
+    table = [_normalized_entropy([int(c) for c in row if c]) for row in distinct]
+    return [table[i] for i in inverse.reshape(-1)]
 
 
 if __name__ == "__main__":
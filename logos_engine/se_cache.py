@@ -0,0 +1,130 @@
+"""Content-addressed memoization for SE estimates.
+
+Opt-in: build an `SECache` and register it with `se.set_cache(cache)`.
+Entries are keyed on a canonical hash of the amendment's factoids (from
+`se.factoidize`), its parent ids and a rules-version token, so re-proposing
+an identical `content_delta` skips the adapter. Bump `rules_version`
+whenever the rule set changes in a way the adapter could observe.
+
+An in-memory LRU tier (bounded by `max_entries`, optional `ttl_s`) sits in
+front of an optional SQLite file (`db_path`) that survives restarts. The
+file is bounded too: expired rows are deleted when read, and past
+`max_disk_entries` the oldest-written rows are evicted (see `row_cap`).
+`prune()` applies both limits to the whole file at once.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+import hashlib, json, sqlite3, threading, time
+
+from .row_cap import RowCap
+from .se import factoidize
+
+
+class SECache:
+    def __init__(self, max_entries: int = 10000, ttl_s: Optional[float] = None,
+                 db_path: Optional[str] = None, rules_version: str = "0", max_disk_entries: int = 100000):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl_s = ttl_s
+        self.rules_version = rules_version
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._mem: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS se_cache (key TEXT PRIMARY KEY, value REAL NOT NULL, ts REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS se_cache_ts ON se_cache (ts)")
+            self._db.commit()
+            self._cap = RowCap(self._db, "se_cache", "key", "ts", max_disk_entries)
+
+    def key(self, amendment: Dict[str, Any]) -> str:
+        payload = {"facts": factoidize(amendment), "parents": list(amendment.get("parent_ids", [])),
+                   "rules": self.rules_version}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _fresh(self, ts: float) -> bool:
+        return self.ttl_s is None or time.time() - ts < self.ttl_s
+
+    def get(self, key: str) -> Optional[float]:
+        with self._lock:
+            hit = self._mem.get(key)
+            if hit is not None:
+                if self._fresh(hit[1]):
+                    self._mem.move_to_end(key)
+                    self.hits += 1
+                    return hit[0]
+                del self._mem[key]
+            if self._db is not None:
+                row = self._db.execute("SELECT value, ts FROM se_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None and self._fresh(row[1]):
+                    self._remember(key, row[0], row[1])
+                    self.disk_hits += 1
+                    return row[0]
+                if row is not None:
+                    self._db.execute("DELETE FROM se_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self._cap.count -= 1
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: float) -> None:
+        ts = time.time()
+        with self._lock:
+            self._remember(key, value, ts)
+            if self._db is not None:
+                self._cap.before_upsert(key)
+                self._db.execute("INSERT OR REPLACE INTO se_cache (key, value, ts) VALUES (?, ?, ?)", (key, value, ts))
+                self.disk_evictions += self._cap.trim()
+                self._db.commit()
+
+    def prune(self) -> int:
+        """Delete expired rows, and the oldest if over `max_disk_entries`, from the file; returns rows removed."""
+        if self._db is None:
+            return 0
+        with self._lock:
+            removed = 0
+            if self.ttl_s is not None:
+                removed = self._db.execute("DELETE FROM se_cache WHERE ts <= ?", (time.time() - self.ttl_s,)).rowcount
+            self._cap.recount()
+            evicted = self._cap.trim()
+            self.disk_evictions += evicted
+            self._db.commit()
+            return removed + evicted
+
+    def _remember(self, key: str, value: float, ts: float) -> None:
+        self._mem[key] = (value, ts)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, amendment: Dict[str, Any], compute: Callable[[], float]) -> float:
+        key = self.key(amendment)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM se_cache")
+                self._db.commit()
+                self._cap.count = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "evictions": self.evictions, "disk_evictions": self.disk_evictions, "size": len(self._mem)}
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -1,28 +1,698 @@
 from __future__ import annotations
-import json, os, time
-from typing import Dict, Any, Optional
-from .types import hash_record
+import gzip, json, os, shutil, struct, threading, time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .types import hash_canonical, canonical_json
+from .codec import CODECS, LEDGER_FORMATS, BinaryCodec, sniff_format
+
+# fsync policies: never, after every record, after every write batch, or at
+# most once per `fsync_interval_ms`: a batch arriving later than that syncs
+# at once, otherwise a timer syncs it when the interval is up.
+FSYNC_POLICIES = ("none", "record", "batch", "interval")
+
+
+def _open_segment(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _verify_range(path: str, start: int, end: int, fmt: str = "jsonl") -> Dict[str, Any]:
+    """Recompute hashes for the records in [start, end) of `path`.
+
+    Runs in a worker process. Checks each record's hash and the `prev` links
+    inside the range; links across ranges are checked by the caller.
+    """
+    out: Dict[str, Any] = {"segment": os.path.basename(path), "count": 0, "first_offset": None, "first_prev": None, "first_seq": None,
+                           "last_hash": None, "last_seq": None, "error": None}
+    codec = CODECS[fmt]
+    with _open_segment(path) as f:
+        f.seek(start)
+        offset = start
+        for chunk in codec.scan(f):
+            if offset >= end:
+                break
+            here, offset = offset, offset + len(chunk)
+            if chunk.isspace():
+                continue
+            try:
+                h, prev, seq, ok = codec.check(chunk)
+            except (ValueError, KeyError, TypeError):
+                out["error"] = {"segment": out["segment"], "offset": here, "seq": None, "reason": "unparseable record"}
+                break
+            if out["count"] == 0:
+                out["first_offset"], out["first_prev"], out["first_seq"] = here, prev, seq
+            elif prev != out["last_hash"]:
+                out["error"] = {"segment": out["segment"], "offset": here, "seq": seq, "reason": "prev link broken"}
+                break
+            elif seq is not None and out["last_seq"] is not None and seq != out["last_seq"] + 1:
+                out["error"] = {"segment": out["segment"], "offset": here, "seq": seq, "reason": "sequence gap"}
+                break
+            if not ok:
+                out["error"] = {"segment": out["segment"], "offset": here, "seq": seq, "reason": "hash mismatch"}
+                break
+            out["count"] += 1
+            out["last_hash"], out["last_seq"] = h, seq
+    return out
+
+
+def _binary_cuts(f, size: int, parts: int) -> List[int]:
+    # Frame starts at or after each target, found by hopping over the 4-byte
+    # length prefixes; a corrupt length ends the cutting and is left to the
+    # worker verifying the last range to report.
+    cuts, pos = [0], 0
+    for k in range(1, parts):
+        target = size * k // parts
+        while pos < target:
+            f.seek(pos)
+            head = f.read(4)
+            if len(head) < 4:
+                return cuts
+            pos += struct.unpack(">I", head)[0] + 8
+        if pos >= size:
+            break
+        if pos > cuts[-1]:
+            cuts.append(pos)
+    return cuts
+
+
+def _split_ranges(path: str, parts: int, fmt: str = "jsonl") -> List[Tuple[int, int]]:
+    """Split `path` into up to `parts` byte ranges aligned to record starts."""
+    size = os.path.getsize(path)
+    if path.endswith(".gz"):
+        # compressed segments cannot be seeked cheaply; verify them whole
+        return [(0, 1 << 62)] if size else []
+    cuts = [0]
+    with open(path, "rb") as f:
+        if fmt == "binary":
+            cuts = _binary_cuts(f, size, parts)
+        else:
+            for k in range(1, parts):
+                f.seek(max(cuts[-1], size * k // parts))
+                f.readline()
+                pos = f.tell()
+                if cuts[-1] < pos < size:
+                    cuts.append(pos)
+    cuts.append(size)
+    return [(a, b) for a, b in zip(cuts, cuts[1:]) if b > a]
+
+
+def _count_lines(path: str) -> int:
+    n = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                n += 1
+    return n
+
 
 class Ledger:
-    def __init__(self, path: str):
-        self.path = path
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+    """Hash-chained, append-only record log.
+
+    The chain head is kept in memory (and in a `<path>.head` sidecar) so
+    appends never rescan the file. `path` is the active segment; it can be
+    sealed into numbered segments listed in `<path>.manifest` (see `rotate`).
+    `fsync` picks a durability policy from FSYNC_POLICIES and `format` a
+    record encoding from `codec`. Optional side stores: a Merkle log for
+    `checkpoint`/`prove` and an audit index for `find`. Use as a context
+    manager, or call `close()` and `close_index()`.
+    """
+
+    def __init__(self, path: str, fsync: str = "none", fsync_interval_ms: float = 50.0,
+                 max_segment_bytes: Optional[int] = None, max_segment_records: Optional[int] = None,
+                 compress_sealed: bool = False, index: bool = False, format: Optional[str] = None,
+                 compress_payload: bool = False, checkpoint_every: Optional[int] = None):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        if format is not None and format not in LEDGER_FORMATS:
+            raise ValueError(f"Unknown ledger format: {format}")
+        self.path = str(path)
+        self.head_path = self.path + ".head"
+        self.manifest_path = self.path + ".manifest"
+        self.index_path = self.path + ".index"
+        self.merkle_path = self.path + ".merkle"
+        self.fsync = fsync
+        self.fsync_interval_ms = fsync_interval_ms
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_records = max_segment_records
+        self.compress_sealed = compress_sealed
+        self.maintain_index = index
+        self._index = None
+        self.checkpoint_every = checkpoint_every
+        self._merkle = None
+        self._fh = None
+        self._sidecar_stale = False
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+        self._sync_lock = threading.Lock()
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.segments: List[Dict[str, Any]] = self._read_manifest()
+        if self.segments and not os.path.exists(self._segment_path(self.segments[-1])):
+            # Crashed between writing the manifest and moving the active file.
+            self._finish_seal(self.segments[-1])
         if not os.path.exists(self.path):
             open(self.path, "w").close()
+        # An existing ledger keeps its format; `compress_payload` only affects binary writes.
+        found = next(filter(None, (sniff_format(p) for p in reversed(self.segment_paths()))), None)
+        if format is not None and found is not None and found != format:
+            raise ValueError(f"{self.path} is a {found} ledger, not {format}")
+        self.format = format or found or "jsonl"
+        self.codec = BinaryCodec(compress_payload) if self.format == "binary" else CODECS[self.format]
+        # A crash mid-write leaves a torn last record that was never acknowledged.
+        self.codec.repair_tail(self.path)
+        if self.segments and self._holds_sealed_records(self.segments[-1]):
+            # Crashed after the compressed copy was written but before the
+            # active file was truncated: its records are already sealed.
+            open(self.path, "w").close()
+        self._hash: Optional[str] = None
+        self._seq = -1
+        self._size = 0
+        self._load_head()
+
+    # -- head pointer -------------------------------------------------------
+
+    def _read_sidecar(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.head_path, "r") as f:
+                side = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(side, dict) or not {"hash", "seq", "size"} <= side.keys():
+            return None
+        return side
+
+    def _write_sidecar(self) -> None:
+        tmp = self.head_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"hash": self._hash, "seq": self._seq, "size": self._size}, f)
+        os.replace(tmp, self.head_path)
+        self._sidecar_stale = False
+
+    def _base(self) -> Tuple[Optional[str], int]:
+        """Head checkpoint of the last sealed segment, or (None, -1)."""
+        if not self.segments:
+            return None, -1
+        return self.segments[-1]["last_hash"], self.segments[-1]["last_seq"]
+
+    def _load_head(self) -> None:
+        size = os.path.getsize(self.path)
+        try:
+            tail = self.codec.read_last(self.path)
+        except ValueError as e:
+            raise ValueError(f"{self.path}: last record is corrupt ({e}); run verify() to locate damage") from None
+        side = self._read_sidecar()
+        if side is not None and side["size"] == size:
+            if tail is None and (side["hash"], side["seq"]) == self._base():
+                self._hash, self._seq, self._size = side["hash"], side["seq"], size
+                return
+            if tail is not None and side["hash"] == tail.get("hash") and side["seq"] == tail.get("seq", side["seq"]):
+                self._hash, self._seq, self._size = side["hash"], side["seq"], size
+                return
+        # Sidecar missing, corrupted or stale: rebuild it from the tail.
+        if tail is None:
+            self._hash, self._seq = self._base()
+        else:
+            self._hash = tail.get("hash")
+            # Records written before sequence numbers existed have no "seq".
+            self._seq = tail["seq"] if "seq" in tail else self._base()[1] + _count_lines(self.path)
+        self._size = size
+        self._write_sidecar()
+
+    def _refresh(self) -> None:
+        # Another writer may have appended since we loaded the head.
+        if os.path.getsize(self.path) != self._size:
+            self._load_head()
+
+    def head(self) -> Tuple[Optional[str], int]:
+        """Return (hash, seq) of the last record; (None, -1) when empty."""
+        self._refresh()
+        return self._hash, self._seq
 
     def last_hash(self) -> Optional[str]:
-        prev = None
-        with open(self.path, "r") as f:
-            for line in f:
-                if line.strip():
-                    rec = json.loads(line)
-                    prev = rec.get("hash")
-        return prev
+        return self.head()[0]
+
+    # -- segments -----------------------------------------------------------
+
+    def _read_manifest(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)["segments"]
+        except FileNotFoundError:
+            return []
+
+    def _write_manifest(self) -> None:
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"segments": self.segments}, f, indent=1)
+        os.replace(tmp, self.manifest_path)
+
+    def _segment_path(self, entry: Dict[str, Any]) -> str:
+        return os.path.join(os.path.dirname(self.path), entry["file"])
+
+    def segment_paths(self) -> List[str]:
+        """All segment files in chain order, ending with the active one."""
+        return [self._segment_path(e) for e in self.segments] + [self.path]
+
+    def _holds_sealed_records(self, entry: Dict[str, Any]) -> bool:
+        with open(self.path, "rb") as f:
+            chunk = next((c for c in self.codec.scan(f) if not c.isspace()), None)
+        if chunk is None:
+            return False
+        first = self.codec.header(chunk)
+        return first["hash"] == entry["first_hash"] or first.get("seq", entry["last_seq"] + 1) <= entry["last_seq"]
+
+    def _should_rotate(self) -> bool:
+        if self.max_segment_bytes is not None and self._size >= self.max_segment_bytes:
+            return True
+        records = self._seq - self._base()[1]
+        return self.max_segment_records is not None and records >= self.max_segment_records
+
+    def rotate(self) -> None:
+        """Seal the active segment (no-op when it is empty).
+
+        It becomes `<path>.NNNNNN` (`.NNNNNN.gz` with `compress_sealed`), and
+        its first/last hash and seq are appended to the manifest, whose last
+        entry then serves as the head checkpoint for the empty active file.
+        Called after a write batch once `max_segment_bytes` or
+        `max_segment_records` is reached.
+        """
+        if self._seq == self._base()[1]:
+            return
+        self.close()
+        with open(self.path, "rb") as f:
+            first = self.codec.header(next(c for c in self.codec.scan(f) if not c.isspace()))
+        name = f"{os.path.basename(self.path)}.{len(self.segments) + 1:06d}"
+        entry = {
+            "file": name + (".gz" if self.compress_sealed else ""),
+            "first_seq": first.get("seq", self._base()[1] + 1),
+            "last_seq": self._seq,
+            "first_prev": first["prev"],
+            "first_hash": first["hash"],
+            "last_hash": self._hash,
+            "records": self._seq - self._base()[1],
+            "bytes": self._size,
+            "compressed": self.compress_sealed,
+        }
+        # Manifest first: a crash before the move is finished on next open.
+        self.segments.append(entry)
+        self._write_manifest()
+        self._finish_seal(entry)
+        if self._index is not None:
+            # Fully indexed segments need not be reopened (gzip ones can't be seeked).
+            self._index.next_segment(len(self.segments) - 1, entry["bytes"])
+
+    def _finish_seal(self, entry: Dict[str, Any]) -> None:
+        dst = self._segment_path(entry)
+        if entry["compressed"]:
+            with open(self.path, "rb") as src, gzip.open(dst + ".tmp", "wb") as out:
+                shutil.copyfileobj(src, out)
+            os.replace(dst + ".tmp", dst)
+        else:
+            os.replace(self.path, dst)
+        open(self.path, "w").close()
+        self._hash, self._seq = self._base()
+        self._size = 0
+        self._write_sidecar()
+
+    def records(self, start_seq: int = 0) -> Iterator[Dict[str, Any]]:
+        """Yield records with seq >= start_seq, skipping sealed segments before it.
+
+        Records from before sequence numbers existed get their position as "seq".
+        """
+        if self._fh is not None:
+            self._fh.flush()
+        sources = [(self._segment_path(e), e["first_seq"]) for e in self.segments if e["last_seq"] >= start_seq]
+        sources.append((self.path, self._base()[1] + 1))
+        for path, pos in sources:
+            with _open_segment(path) as f:
+                for chunk in self.codec.scan(f):
+                    if chunk.isspace():
+                        continue
+                    rec = self.codec.decode(chunk)
+                    pos = rec.setdefault("seq", pos) + 1
+                    if pos > start_seq:
+                        yield rec
+
+    # -- audit index --------------------------------------------------------
+
+    def index(self):
+        """The side index (a `ledger_index.LedgerIndex`), opened on first use."""
+        if self._index is None:
+            from .ledger_index import LedgerIndex
+            self._index = LedgerIndex(self.index_path, self.codec)
+        return self._index
+
+    def rebuild_index(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+        self.index().rebuild(self.segment_paths())
+
+    def find(self, amendment_id: Optional[str] = None, rule_id: Optional[str] = None,
+             status_action: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Records matching every given criterion, in chain order.
+
+        `rule_id` matches records whose amendment lists it in `parent_ids`.
+        Values are compared as strings, as they are indexed.
+        With `index=True` the index is updated on every write; otherwise it
+        is brought up to date here. Each hit is then read with
+        one seek. Hits that no longer match (the ledger was rewritten under
+        the index) trigger one rebuild.
+        """
+        criteria = [(field, str(value)) for field, value in
+                    (("amendment", amendment_id), ("rule", rule_id), ("status_action", status_action))
+                    if value is not None]
+        from .ledger_index import index_keys
+        if self._fh is not None:
+            self._fh.flush()
+        idx = self.index()
+        for _ in range(2):
+            paths = self.segment_paths()
+            idx.catch_up(paths)
+            out: List[Dict[str, Any]] = []
+            stale = False
+            f, open_seg = None, None
+            try:
+                for seg, offset in idx.lookup(criteria):
+                    if seg != open_seg:
+                        if f is not None:
+                            f.close()
+                        f, open_seg = _open_segment(paths[seg]), seg
+                    f.seek(offset)
+                    try:
+                        rec = self.codec.decode(next(self.codec.scan(f)))
+                    except (ValueError, StopIteration):
+                        stale = True
+                        break
+                    if not set(criteria) <= set(index_keys(rec.get("obj"))):
+                        stale = True
+                        break
+                    out.append(rec)
+            finally:
+                if f is not None:
+                    f.close()
+            if not stale:
+                return out
+            idx.rebuild(paths)
+        raise RuntimeError("ledger index is inconsistent after rebuild")
+
+    # -- merkle checkpoints -------------------------------------------------
+
+    def merkle(self):
+        """The Merkle log (a `merkle.MerkleLog`), opened on first use."""
+        if self._merkle is None:
+            from .merkle import MerkleLog
+            self._merkle = MerkleLog(self.merkle_path)
+        return self._merkle
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """Bring the Merkle tree up to the head and record a checkpoint {size, root, ts}.
+
+        With `checkpoint_every`, leaves are added on every write and a
+        checkpoint is recorded at least every that many records.
+        """
+        if self._fh is not None:
+            self._fh.flush()
+        m = self.merkle()
+        m.catch_up(self)
+        return m.checkpoint()
+
+    def prove(self, seq: int, checkpoint: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Inclusion proof of record `seq` against `checkpoint` (default: the latest one).
+
+        Returns {seq, record_hash, size, root, path}. Auditors recompute
+        record_hash from the record itself with `hash_record` and check
+        `merkle.verify_inclusion(record_hash, seq, size, path, root)` against
+        a root they trust.
+        """
+        m = self.merkle()
+        m.catch_up(self)
+        cp = checkpoint or m.latest_checkpoint()
+        if cp is None or seq >= cp["size"]:
+            raise ValueError(f"record {seq} is not covered by a checkpoint yet; call checkpoint()")
+        return {"seq": seq, "record_hash": m.record_hash(seq), "size": cp["size"], "root": cp["root"],
+                "path": m.proof(seq, cp["size"])}
+
+    # -- verification -------------------------------------------------------
+
+    def verify(self, workers: Optional[int] = None, min_range_bytes: int = 4 << 20) -> Tuple[bool, Dict[str, Any]]:
+        """Recompute the whole hash chain, split across a process pool.
+
+        The file is cut into line-aligned byte ranges (at least
+        `min_range_bytes` each, so small ledgers stay in-process); each range
+        is rehashed in a worker and the `prev` links at range boundaries are
+        checked here; sealed segments are covered too (gzip ones as a single
+        range each). Returns (ok, metrics) where metrics carries record and
+        byte counts, throughput and `first_error` ({segment, offset, seq,
+        reason} of the earliest broken record, or None).
+        """
+        if self._fh is not None:
+            self._fh.flush()
+        t0 = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        size = 0
+        ranges: List[Tuple[str, int, int]] = []
+        for path in self.segment_paths():
+            seg_size = os.path.getsize(path)
+            size += seg_size
+            parts = max(1, min(workers * 4, seg_size // max(1, min_range_bytes)))
+            ranges.extend((path, a, b, self.format) for a, b in _split_ranges(path, parts, self.format))
+        if workers > 1 and len(ranges) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_verify_range, *zip(*ranges)))
+        else:
+            results = [_verify_range(*r) for r in ranges]
+
+        errors = [r["error"] for r in results if r["error"]]
+        prev_hash: Optional[str] = None
+        prev_seq: Optional[int] = None
+        for r in results:
+            if r["count"] == 0 and r["error"] is None:
+                continue
+            if r["first_offset"] is not None:
+                where = {"segment": r["segment"], "offset": r["first_offset"], "seq": r["first_seq"]}
+                if r["first_prev"] != prev_hash:
+                    errors.append(dict(where, reason="prev link broken"))
+                elif None not in (r["first_seq"], prev_seq) and r["first_seq"] != prev_seq + 1:
+                    errors.append(dict(where, reason="sequence gap"))
+            if r["error"] is not None:
+                break
+            prev_hash, prev_seq = r["last_hash"], r["last_seq"]
+
+        seconds = time.perf_counter() - t0
+        records = sum(r["count"] for r in results)
+        order = {os.path.basename(p): i for i, p in enumerate(self.segment_paths())}
+        first_error = min(errors, key=lambda e: (order[e["segment"]], e["offset"])) if errors else None
+        return first_error is None, {
+            "records": records,
+            "bytes": size,
+            "ranges": len(ranges),
+            "seconds": seconds,
+            "records_per_sec": records / seconds if seconds > 0 else 0.0,
+            "mb_per_sec": size / (1 << 20) / seconds if seconds > 0 else 0.0,
+            "first_error": first_error,
+        }
+
+    # -- writes -------------------------------------------------------------
+
+    def _encode(self, obj: Dict[str, Any], prev: Optional[str], seq: int) -> Tuple[str, bytes]:
+        # Serialize obj once: the canonical text is hashed and embedded in the line as-is.
+        obj_json = canonical_json(obj)
+        h = hash_canonical(obj_json, prev)
+        return h, self.codec.encode(time.time(), seq, h, prev, obj_json)
+
+    def _handle(self):
+        if self._fh is None or self._fh.closed:
+            self._fh = open(self.path, "ab")
+        return self._fh
+
+    def _fsync(self, f) -> None:
+        os.fsync(f.fileno())
+        self._last_sync = time.monotonic()
+
+    def _schedule_sync(self, wait_s: float) -> None:
+        with self._sync_lock:
+            if self._sync_timer is None:
+                self._sync_timer = threading.Timer(wait_s, self._timed_sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def _timed_sync(self) -> None:
+        with self._sync_lock:
+            self._sync_timer = None
+            if self._fh is not None and not self._fh.closed:
+                self._fsync(self._fh)
+
+    def _write(self, lines: List[bytes], head: Optional[str], seq: int, hashes: Sequence[str]) -> None:
+        """Write encoded lines (with record `hashes`) in one go and apply the fsync policy."""
+        f = self._handle()
+        start, segment = f.tell(), len(self.segments)
+        if self.fsync == "record":
+            for line in lines:
+                f.write(line)
+                f.flush()
+                self._fsync(f)
+        else:
+            f.write(b"".join(lines))
+            f.flush()
+            if self.fsync == "batch":
+                self._fsync(f)
+            elif self.fsync == "interval":
+                wait_s = self.fsync_interval_ms / 1000.0 - (time.monotonic() - self._last_sync)
+                if wait_s <= 0:
+                    self._fsync(f)
+                else:
+                    self._schedule_sync(wait_s)
+        self._hash, self._seq, self._size = head, seq, f.tell()
+        self._sidecar_stale = True
+        if self.maintain_index and not self.index().add_lines(segment, start, lines):
+            self.index().catch_up(self.segment_paths())
+        if self.checkpoint_every:
+            m = self.merkle()
+            if not m.add(seq - len(hashes) + 1, hashes):
+                m.catch_up(self)
+            latest = m.latest_checkpoint()
+            if m.size - (latest["size"] if latest else 0) >= self.checkpoint_every:
+                m.checkpoint()
+        if self._should_rotate():
+            self.rotate()
 
     def append(self, obj: Dict[str, Any]) -> str:
-        prev = self.last_hash()
-        h = hash_record(obj, prev)
-        rec = {"ts": time.time(), "hash": h, "prev": prev, "obj": obj}
-        with open(self.path, "a") as f:
-            f.write(json.dumps(rec) + "\n")
-        return h
+        return self.append_many([obj])[0]
+
+    def append_many(self, objs: Iterable[Dict[str, Any]]) -> List[str]:
+        """Chain a batch of records in memory and commit them with one write."""
+        prev, seq = self.head()
+        hashes: List[str] = []
+        lines: List[bytes] = []
+        for obj in objs:
+            seq += 1
+            prev, line = self._encode(obj, prev, seq)
+            hashes.append(prev)
+            lines.append(line)
+        if lines:
+            self._write(lines, prev, seq, hashes)
+        return hashes
+
+    def transaction(self, group_size: Optional[int] = None) -> "LedgerTransaction":
+        """Group-commit context manager; see `LedgerTransaction`."""
+        return LedgerTransaction(self, group_size)
+
+    def sync(self) -> None:
+        if self._fh is not None and not self._fh.closed:
+            self._fh.flush()
+            self._fsync(self._fh)
+
+    def close(self) -> None:
+        with self._sync_lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._fh is not None and not self._fh.closed:
+                if self.fsync != "none":
+                    self.sync()
+                self._fh.close()
+            self._fh = None
+        if self._sidecar_stale:
+            self._write_sidecar()
+
+    def close_index(self) -> None:
+        """Close the side-index and Merkle databases (reopened on next use)."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._merkle is not None:
+            self._merkle.close()
+            self._merkle = None
+
+    def __enter__(self) -> "Ledger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+        self.close_index()
+
+
+class LedgerTransaction:
+    """Buffer appends and commit them as one batch.
+
+    Exposes the same `append(obj) -> hash` method as `Ledger`, so it can be
+    passed to `nomics.propose` in place of a ledger. Hashes are chained in
+    memory from the head at the start of the transaction. With `group_size`
+    the pending records are committed every `group_size` appends, which keeps
+    memory bounded for long runs. Leaving the `with` block commits; an
+    exception discards whatever has not been committed yet.
+    """
+
+    def __init__(self, ledger: Ledger, group_size: Optional[int] = None):
+        self.ledger = ledger
+        self.group_size = group_size
+        self._start = ledger.head()
+        self._prev, self._seq = self._start
+        self._lines: List[bytes] = []
+        self._hashes: List[str] = []
+
+    def append(self, obj: Dict[str, Any]) -> str:
+        self._seq += 1
+        self._prev, line = self.ledger._encode(obj, self._prev, self._seq)
+        self._lines.append(line)
+        self._hashes.append(self._prev)
+        if self.group_size and len(self._lines) >= self.group_size:
+            self.commit()
+        return self._prev
+
+    def commit(self) -> None:
+        if not self._lines:
+            return
+        if self.ledger.head() != self._start:
+            raise RuntimeError("ledger head moved during transaction")
+        self.ledger._write(self._lines, self._prev, self._seq, self._hashes)
+        self._start = (self._prev, self._seq)
+        self._lines = []
+        self._hashes = []
+
+    def rollback(self) -> None:
+        self._prev, self._seq = self._start
+        self._lines = []
+        self._hashes = []
+
+    def __enter__(self) -> "LedgerTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+def convert_ledger(src: str, dst: str, format: str, compress_payload: bool = False) -> Dict[str, Any]:
+    """Copy the ledger at `src` (all segments, any format) into a new single-file ledger at `dst`.
+
+    Records keep their ts, seq, hash and prev. Each object is re-encoded
+    with `canonical_json` and its hash is checked against `hash_record`
+    semantics on the way, so a converted ledger verifies exactly like the
+    original. Records from before sequence numbers existed are numbered by
+    position. Returns record and byte counts.
+    """
+    if format not in LEDGER_FORMATS:
+        raise ValueError(f"Unknown ledger format: {format}")
+    if os.path.exists(dst) and os.path.getsize(dst):
+        raise ValueError(f"{dst} already exists and is not empty")
+    if not os.path.exists(src):
+        raise FileNotFoundError(src)
+    codec = BinaryCodec(compress_payload) if format == "binary" else CODECS[format]
+    tmp = dst + ".tmp"
+    with Ledger(src) as source, open(tmp, "wb") as out:
+        n, bytes_in = 0, sum(os.path.getsize(p) for p in source.segment_paths())
+        for rec in source.records():
+            obj_json = canonical_json(rec["obj"])
+            if hash_canonical(obj_json, rec["prev"]) != rec["hash"]:
+                raise ValueError(f"hash mismatch at record {n} of {src}")
+            out.write(codec.encode(float(rec.get("ts", 0.0)), rec["seq"], rec["hash"], rec["prev"], obj_json))
+            n += 1
+    os.replace(tmp, dst)
+    # side stores describe whatever was at dst before; drop them
+    for side in (dst + ".head", dst + ".manifest", dst + ".index", dst + ".merkle"):
+        if os.path.exists(side):
+            os.remove(side)
+    return {"records": n, "bytes_in": bytes_in, "bytes_out": os.path.getsize(dst)}
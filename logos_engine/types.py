@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
-import hashlib, json
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import hashlib, json, os
 
 @dataclass
 class Rule:
@@ -26,14 +29,30 @@ class Constitution:
     thresholds: Dict[str, float]
     procedures: List[Dict[str, Any]]
 
-def hash_record(obj: Dict[str, Any], prev_hash: Optional[str]) -> str:
-    payload = json.dumps({"obj": obj, "prev": prev_hash}, sort_keys=True).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+# Same settings json.dumps(..., sort_keys=True) uses, built once instead of per call.
+_canonical = json.JSONEncoder(sort_keys=True).encode
 
-def process_batch(batch: List[Dict[str, Any]], model: str = "mock", batch_size: int = 2, interpretation: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-    """
-    Process a batch of records using the specified model and batch size.
+
+def canonical_json(obj: Any) -> str:
+    """Sorted-key JSON with default separators: the encoding record hashes are taken over."""
+    return _canonical(obj)
+
+
+def hash_canonical(obj_json: str, prev_hash: Optional[str]) -> str:
+    """`hash_record` for an object already encoded with `canonical_json`.
+
+    "obj" sorts before "prev", so the hashed payload is spliced together
+    directly and the object is serialized only once.
     """
+    payload = '{"obj": ' + obj_json + ', "prev": ' + _canonical(prev_hash) + '}'
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_record(obj: Dict[str, Any], prev_hash: Optional[str]) -> str:
+    # == sha256(json.dumps({"obj": obj, "prev": prev_hash}, sort_keys=True))
+    return hash_canonical(_canonical(obj), prev_hash)
+
+def _check_interpretation(interpretation: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     if interpretation is not None:
         if "intent" not in interpretation:
             raise ValueError("The 'intent' field is required in the interpretation dictionary.")
@@ -47,8 +66,15 @@ def process_batch(batch: List[Dict[str, Any]], model: str = "mock", batch_size:
             raise ValueError("The 'hashes' field is required in the arguments dictionary.")
         if "confidence" not in interpretation:
             raise ValueError("The 'confidence' field is required in the interpretation dictionary.")
-    else:
-        interpretation = {"intent": "summarize", "arguments": {"tokens_min": 0, "tokens_max": 100, "hashes": []}, "confidence": 0.9}
+        return interpretation
+    return {"intent": "summarize", "arguments": {"tokens_min": 0, "tokens_max": 100, "hashes": []}, "confidence": 0.9}
+
+
+def process_batch(batch: List[Dict[str, Any]], model: str = "mock", batch_size: int = 2, interpretation: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    """
+    Process a batch of records using the specified model and batch size.
+    """
+    interpretation = _check_interpretation(interpretation)
 
     results = []
     for i in range(0, len(batch), batch_size):
@@ -56,3 +82,70 @@ def process_batch(batch: List[Dict[str, Any]], model: str = "mock", batch_size:
         batch_hash = [hash_record(item, None) for item in batch_slice]
         results.append({"batch": batch_slice, "hashes": batch_hash})
     return results
+
+
+def _hash_slices(slices: List[List[Dict[str, Any]]]) -> List[List[str]]:
+    # Worker side of iter_process_batch: hashes only, the records stay with the caller.
+    return [[hash_record(item, None) for item in batch_slice] for batch_slice in slices]
+
+
+def iter_process_batch(records: Iterable[Dict[str, Any]], model: str = "mock", batch_size: int = 2,
+                       interpretation: Dict[str, Any] = None, workers: Optional[int] = None,
+                       chunk_slices: int = 256, max_pending: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Streaming, parallel form of `process_batch`.
+
+    Yields the same {"batch", "hashes"} dicts in input order, reading
+    `records` lazily from any iterable. Slices are grouped `chunk_slices`
+    at a time and hashed in a pool of `workers` processes (default: one per
+    CPU). At most `max_pending` chunks (default: 2 per worker) are in flight,
+    so memory stays bounded however long the input is. With `workers=1`
+    everything runs in this process. Arguments are validated on the call,
+    before any record is read.
+    """
+    _check_interpretation(interpretation)
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return _stream_batches(iter(records), batch_size, workers, chunk_slices, max_pending)
+
+
+def _stream_batches(it: Iterator[Dict[str, Any]], batch_size: int, workers: Optional[int],
+                    chunk_slices: int, max_pending: Optional[int]) -> Iterator[Dict[str, Any]]:
+
+    def chunks() -> Iterator[List[List[Dict[str, Any]]]]:
+        while True:
+            chunk = []
+            while len(chunk) < chunk_slices:
+                batch_slice = list(islice(it, batch_size))
+                if not batch_slice:
+                    break
+                chunk.append(batch_slice)
+            if not chunk:
+                return
+            yield chunk
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in chunks():
+            for batch_slice, batch_hash in zip(chunk, _hash_slices(chunk)):
+                yield {"batch": batch_slice, "hashes": batch_hash}
+        return
+
+    window = max(1, max_pending or 2 * workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        source = chunks()
+        try:
+            for chunk in source:
+                pending.append((chunk, pool.submit(_hash_slices, chunk)))
+                if len(pending) < window:
+                    continue
+                chunk, fut = pending.popleft()
+                for batch_slice, batch_hash in zip(chunk, fut.result()):
+                    yield {"batch": batch_slice, "hashes": batch_hash}
+            while pending:
+                chunk, fut = pending.popleft()
+                for batch_slice, batch_hash in zip(chunk, fut.result()):
+                    yield {"batch": batch_slice, "hashes": batch_hash}
+        finally:
+            for _, fut in pending:
+                fut.cancel()
@@ -1,26 +1,36 @@
 import os, json, yaml
 from pathlib import Path
 from logos_engine.store import Ledger
-from logos_engine.nomics import propose
+from logos_engine.nomics import propose_many
+from logos_engine.replay import ReplayEngine
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 constitution = yaml.safe_load(open(PROJECT_ROOT / "examples" / "constitution.yaml"))
 policies = yaml.safe_load(open(PROJECT_ROOT / "examples" / "policies.yaml"))
 amendments = yaml.safe_load(open(PROJECT_ROOT / "examples" / "amendments.yaml"))
 
-rules = policies["rules"]
 thresholds = constitution["thresholds"]
 procedures = constitution["procedures"]
-ledger = Ledger(path=PROJECT_ROOT / "engine" / "python" / "state" / "ledger.jsonl")
+STATE_DIR = PROJECT_ROOT / "engine" / "python" / "state"
+ledger = Ledger(path=STATE_DIR / "ledger.jsonl")
 
 def run_all():
-    for a in amendments["amendments"]:
-        ok, metrics = propose(a, rules, thresholds, procedures, ledger)
+    # Restore rule state from the ledger (latest snapshot + tail) instead of starting over.
+    replayer = ReplayEngine(ledger, policies["rules"], snapshot_dir=str(STATE_DIR / "snapshots"))
+    report = replayer.run()
+    print(f"Replayed {report['replayed']} ledger records (from seq {report['from_seq']})")
+    rules = replayer.rules
+    pending = [a for a in amendments["amendments"] if not ledger.find(amendment_id=a["id"])]
+
+    for aid, ok, metrics in propose_many(pending, rules, thresholds, procedures, ledger):
         status = "ACCEPT" if ok else "REJECT"
-        print(f"[{status}] {a['id']} metrics={metrics}")
+        print(f"[{status}] {aid} metrics={metrics}")
 
     print("\nFinal rules:")
     print(json.dumps(rules, indent=2))
+    # Catch the replayer up to the new head (deltas are idempotent) and snapshot it.
+    replayer.run()
+    replayer.snapshot()
 
 if __name__ == "__main__":
     run_all()
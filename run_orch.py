@@ -3,6 +3,7 @@ import os, sys, json, argparse
 from typing import Dict
 from llm_adapter.orchestrator import Orchestrator
 from llm_adapter.clients import make_default_clients
+from llm_adapter.cache import cached_clients
 from llm_adapter.types import ModelPrompt, ModelClient
 
 class MockClient:
@@ -24,10 +25,14 @@ def main():
     ap.add_argument("--temperature", type=float, default=0.0)
     ap.add_argument("--top_p", type=float, default=1.0)
     ap.add_argument("--max_tokens", type=int, default=256)
+    ap.add_argument("--cache", default=None, help="SQLite file for the completion cache (deterministic prompts only)")
+    ap.add_argument("--cache-bypass", action="store_true", help="Query the model even on cache hits and refresh the entries")
     ap.add_argument("prompts", nargs="+", help="One or more prompts")
     args = ap.parse_args()
 
     clients = build_clients()
+    if args.cache:
+        clients = cached_clients(clients, db_path=args.cache, bypass=args.cache_bypass)
     chosen = args.model or ("openai" if os.getenv("OPENAI_API_KEY") else "mock")
     if chosen not in clients:
         print(f'No client for model "{chosen}". Available: {list(clients.keys())}', file=sys.stderr)
@@ -0,0 +1,19 @@
+"""Rules, procedures and amendments shared by the propose / rulebook tests."""
+
+RULES = [
+    {"id": "R-1", "status": "statutory", "effect": "old"},
+    {"id": "R-2", "status": "statutory", "effect": "old"},
+    {"id": "R-3", "status": "constitutional", "effect": "old"},
+]
+PROCEDURES = [{"id": "P-1", "transmutation_allowed": True}, {"id": "P-2"}]
+# accepts everything that passes screening
+THRESHOLDS = {"coherence": 0.0, "traceability": 0.0, "blast_radius": 1.0}
+# a gate that low-entropy, single-parent amendments still pass
+STRICT_THRESHOLDS = {"coherence": 0.5, "traceability": 0.5, "blast_radius": 0.5}
+AMENDMENT = {"id": "A-1", "parent_ids": ["R-2"], "status_action": "transmute_to_constitutional",
+             "content_delta": {"effect": "new"}, "procedure_id": "P-1", "evidence": ["e"]}
+
+
+def amendment(i):
+    return {"id": f"A-{i}", "parent_ids": [f"R-{1 + i % 3}"], "status_action": "none",
+            "content_delta": {"effect": "x" * i}, "procedure_id": "P-1", "evidence": ["e"]}
@@ -18,3 +18,98 @@ def test_simple_adapter():
     a = {"content_delta": {"intent": "Preserve"}, "parent_ids": []}
     s = simple_adapter(a, [])
     assert s in (0.5, 0.2)
+
+
+def test_concurrent_fanout_matches_sequential_and_overlaps():
+    import time
+
+    def slow(tag):
+        def model(prompt):
+            time.sleep(0.1)
+            return tag
+        return model
+
+    members = [slow("a"), slow("a"), slow("b"), slow("c")]
+    a = {"content_delta": {"effect": "X"}, "parent_ids": ["R-1"]}
+    t0 = time.perf_counter()
+    concurrent = simple_adapter_factory(members, concurrent=True)(a, [])
+    assert time.perf_counter() - t0 < 0.3
+    assert concurrent == simple_adapter_factory(members)(a, [])
+
+
+def test_member_timeout_maps_to_error():
+    import threading, time
+    release = threading.Event()
+
+    def hung(prompt):
+        release.wait(5)
+        return "late"
+
+    def boom(prompt):
+        raise RuntimeError("down")
+
+    a = {"content_delta": {"effect": "X"}, "parent_ids": []}
+    try:
+        t0 = time.perf_counter()
+        with_timeout = simple_adapter_factory([fake_model, hung, boom], member_timeout_s=0.1)(a, [])
+        assert time.perf_counter() - t0 < 1.0
+        overall = simple_adapter_factory([fake_model, hung], overall_timeout_s=0.1, max_in_flight=1)(a, [])
+    finally:
+        release.set()
+    # hung and boom both count as "error": 2 of 3 agree
+    assert with_timeout == simple_adapter_factory([fake_model, boom, boom])(a, [])
+    assert overall == simple_adapter_factory([fake_model, boom])(a, [])
+
+
+def test_hung_member_does_not_block_exit():
+    import subprocess, sys, time
+    code = ("import time\n"
+            "from llm_adapter.adapters import simple_adapter_factory\n"
+            "hung = lambda p: time.sleep(30) or 'late'\n"
+            "simple_adapter_factory([hung], member_timeout_s=0.1)({'content_delta': {'effect': 'X'}}, [])\n")
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=20)
+    assert time.perf_counter() - t0 < 10
+
+
+def test_max_in_flight_spans_adapter_calls():
+    import threading, time
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def member(prompt):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return "x"
+
+    adapter = simple_adapter_factory([member] * 3, max_in_flight=2, concurrent=True)
+    a = {"content_delta": {"effect": "X"}, "parent_ids": []}
+    calls = [threading.Thread(target=adapter, args=(a, [])) for _ in range(4)]
+    for t in calls:
+        t.start()
+    for t in calls:
+        t.join()
+    assert peak[0] == 2
+
+
+def test_repeated_calls_with_a_hung_member_keep_returning():
+    import threading, time
+    release = threading.Event()
+
+    def hung(prompt):
+        release.wait(10)
+        return "late"
+
+    adapter = simple_adapter_factory([hung, fake_model, fake_model], member_timeout_s=0.1)
+    a = {"content_delta": {"effect": "X"}, "parent_ids": []}
+    try:
+        for _ in range(5):
+            t0 = time.perf_counter()
+            assert adapter(a, []) == simple_adapter_factory([lambda p: "error", fake_model, fake_model])(a, [])
+            assert time.perf_counter() - t0 < 1.0
+    finally:
+        release.set()
@@ -0,0 +1,78 @@
+from llm_adapter.cache import CachingClient, cached_clients
+from llm_adapter.orchestrator import Orchestrator
+from llm_adapter.types import ModelPrompt
+
+
+class MockClient:
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, model: str, prompt: str, **kwargs):
+        self.calls += 1
+        return f"summarize {prompt}", {"mock": True}
+
+
+def test_cache_persists_across_instances(tmp_path):
+    db = str(tmp_path / "completions.sqlite")
+    upstream = MockClient()
+    first = CachingClient(upstream, db_path=db)
+    assert first.complete("m", "p", temperature=0) == ("summarize p", {"mock": True})
+    first.close()
+    second = CachingClient(upstream, db_path=db)
+    # 0 and 0.0 normalize to the same key
+    assert second.complete("m", "p", temperature=0.0) == ("summarize p", {"mock": True, "cached": True})
+    assert upstream.calls == 1
+    second.complete("m", "p", temperature=0.0, cache_bypass=True)
+    second.complete("m", "p", temperature=0.9)
+    assert upstream.calls == 3
+    assert second.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_lru_eviction_and_ttl():
+    upstream = MockClient()
+    client = CachingClient(upstream, max_entries=2)
+    for p in ("a", "b", "a", "c", "a", "b"):
+        client.complete("m", p)
+    # "b" was least recently used when "c" arrived, so it was evicted
+    assert upstream.calls == 4
+    expiring = CachingClient(upstream, ttl_s=0)
+    expiring.complete("m", "x")
+    expiring.complete("m", "x")
+    assert upstream.calls == 6
+
+
+def test_batched_eviction_keeps_recently_hit_entries(tmp_path):
+    db = str(tmp_path / "completions.sqlite")
+    upstream = MockClient()
+    client = CachingClient(upstream, db_path=db, max_entries=128)
+    for i in range(128):
+        client.complete("m", f"p{i}")
+    client.complete("m", "p0")  # hit: recency is buffered, not written yet
+    client.complete("m", "new")
+    # over the limit: evict down to 128 - 128 // 64, least recently used first
+    assert client.stats()["size"] == 126
+    client.complete("m", "p0")
+    assert upstream.calls == 129
+    client.close()
+    reopened = CachingClient(upstream, db_path=db, max_entries=128)
+    reopened.complete("m", "p1")
+    assert upstream.calls == 130  # p1..p3 were the evicted ones
+
+
+def test_orchestrator_rerun_is_served_from_cache(tmp_path):
+    upstream = MockClient()
+    clients = cached_clients({"mock": upstream}, db_path=str(tmp_path / "c.sqlite"))
+    batch = [ModelPrompt(model="mock", prompt=f"p{i}", params={"temperature": 0.0}) for i in range(5)]
+    first = Orchestrator(clients).run(batch)
+    assert Orchestrator(clients).run(batch) == first
+    assert upstream.calls == 5
+
+
+def test_cached_clients_share_one_store():
+    a, b = MockClient(), MockClient()
+    clients = cached_clients({"a": a, "b": b})  # in-memory, still one store
+    clients["a"].complete("m", "p")
+    assert clients["b"].complete("m", "p")[1].get("cached") is True
+    assert clients["b"].complete("n", "p")[1].get("cached") is None  # the model is part of the key
+    assert (a.calls, b.calls) == (1, 1)
+    assert clients["a"].stats()["size"] == clients["b"].stats()["size"] == 2
@@ -0,0 +1,60 @@
+import random
+
+from llm_adapter.cluster import NearDuplicateClusterer, cluster_labels, jaccard, lsh_bands, shingles
+from llm_adapter.postprocess import interpretations_to_entropy, adaptive_interpretations_entropy
+from llm_adapter.adapters import simple_adapter_factory
+
+
+def test_whitespace_and_case_variants_share_a_cluster():
+    labels = cluster_labels(["Keep the rule", "keep  the rule ", "KEEP THE\nRULE", "Drop the rule entirely"])
+    assert labels[:3] == [0, 0, 0]
+    assert labels[3] == 1
+
+
+def test_near_duplicates_cluster_and_distinct_texts_do_not():
+    a = "the amendment preserves the original intent of rule R-1"
+    b = "the amendment preserves the original intent of rule R-1."
+    c = "reject: this change removes the audit requirement"
+    assert jaccard(shingles(a), shingles(b)) >= 0.8
+    assert cluster_labels([a, b, c], threshold=0.8) == [0, 0, 1]
+
+
+def test_labels_are_deterministic_and_stream_consistent():
+    rnd = random.Random(3)
+    base = ["alpha beta gamma delta", "one two three four five", "lorem ipsum dolor sit amet"]
+    texts = [rnd.choice(base) + rnd.choice(["", " ", ".", "!"]) for _ in range(50)]
+    labels = cluster_labels(texts)
+    assert labels == cluster_labels(texts)
+    clusterer = NearDuplicateClusterer()
+    assert [clusterer.add(t) for t in texts] == labels
+    assert clusterer.clusters == 3
+
+
+def test_lsh_bands_cover_signature():
+    bands, rows = lsh_bands(64, 0.8)
+    assert bands * rows == 64
+    assert abs((1 / bands) ** (1 / rows) - 0.8) < 0.1
+
+
+def test_entropy_over_clusters():
+    answers = ["Accept the change", "accept the change.", "ACCEPT  the change", "accept the change"]
+    assert interpretations_to_entropy(answers) > 0.0
+    assert interpretations_to_entropy(answers, similarity_threshold=0.8) == 0.0
+    # exact-equality behaviour is unchanged without a threshold
+    assert interpretations_to_entropy(["a", "b"]) == interpretations_to_entropy(["a", "b"], None)
+
+
+def test_adaptive_entropy_clusters_streamed_answers():
+    answers = ["yes, accept", "Yes, accept", "yes,  accept", "yes, accept!", "yes, accept."]
+    score, report = adaptive_interpretations_entropy(lambda idx: [answers[i] for i in idx], len(answers),
+                                                     similarity_threshold=0.6)
+    assert score == 0.0
+    assert report["calls"] == len(answers)
+
+
+def test_factory_similarity_threshold():
+    members = [lambda p, s=s: "interpretation: " + p + s for s in ("", " ", ".", "  .")]
+    a = {"content_delta": {"effect": "Keep the audit trail"}, "parent_ids": ["R-1"]}
+    assert simple_adapter_factory(members)(a, []) > 0.0
+    assert simple_adapter_factory(members, similarity_threshold=0.8)(a, []) == 0.0
+    assert simple_adapter_factory(members, adaptive=True, similarity_threshold=0.8)(a, []) == 0.0
@@ -0,0 +1,54 @@
+import threading, time
+from llm_adapter.coalesce import CoalescingClient
+from llm_adapter.orchestrator import Orchestrator
+from llm_adapter.types import ModelPrompt
+
+
+class CountingClient:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def complete(self, model: str, prompt: str, **kwargs):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return f"summarize {prompt}", {"n": self.calls}
+
+
+def test_identical_prompts_in_one_run_share_an_upstream_call():
+    upstream = CountingClient()
+    client = CoalescingClient(upstream)
+    batch = [ModelPrompt(model="gpt", prompt=p, params={"temperature": 0.0}) for p in ["a", "a", "b", "a", "b"]]
+    inter = Orchestrator({"gpt": client}).run(batch)
+    assert inter == Orchestrator({"gpt": CountingClient()}, max_concurrency=1).run(batch)
+    assert upstream.calls == 2
+    assert client.stats() == {"upstream_calls": 2, "coalesced_calls": 3}
+
+
+def test_sampled_requests_are_not_coalesced_and_errors_fan_out():
+    upstream = CountingClient()
+    client = CoalescingClient(upstream)
+    Orchestrator({"gpt": client}).run([ModelPrompt(model="gpt", prompt="a", params={"temperature": 0.7})] * 3)
+    assert upstream.calls == 3
+
+    class Failing:
+        def complete(self, model, prompt, **kwargs):
+            time.sleep(0.05)
+            raise RuntimeError("down")
+
+    client = CoalescingClient(Failing())
+    errors = []
+
+    def call():
+        try:
+            client.complete("gpt", "a")
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(errors) == 3 and client.stats()["upstream_calls"] == 1
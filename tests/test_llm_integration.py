@@ -33,3 +33,52 @@ def test_orchestrator_runs_and_fuses():
     inter = orch.run([ModelPrompt(model="gpt", prompt="p1"), ModelPrompt(model="gpt", prompt="p2")])
     assert inter.intent in {"summarize", "classify"}
     assert 0.0 <= inter.confidence <= 1.0
+
+
+class SlowClient:
+    def __init__(self, delay=0.05, fail_on=None):
+        import threading
+        self.delay, self.fail_on = delay, fail_on
+        self.active = self.peak = self.calls = 0
+        self.lock = threading.Lock()
+
+    def complete(self, model: str, prompt: str, **kwargs):
+        import time
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if prompt == self.fail_on:
+                raise RuntimeError("upstream failed")
+            return f"{prompt} summarize" if int(prompt[1:]) % 3 else f"{prompt} classify", {}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_concurrent_run_matches_serial_and_respects_client_limit():
+    import asyncio, time
+    batch = [ModelPrompt(model="gpt", prompt=f"p{i}") for i in range(12)]
+    serial = Orchestrator({"gpt": SlowClient(0.0)}, max_concurrency=1).run(batch)
+    client = SlowClient()
+    t0 = time.perf_counter()
+    inter = Orchestrator({"gpt": client}, max_concurrency=8, client_limits={"gpt": 4}).run(batch)
+    assert time.perf_counter() - t0 < 12 * 0.05
+    assert inter == serial
+    assert client.peak == 4
+    assert asyncio.run(Orchestrator({"gpt": SlowClient()}, client_limits={"gpt": 3}).arun(batch)) == serial
+
+
+def test_failed_completion_raises_and_cancels_queued_work():
+    import asyncio, pytest
+    batch = [ModelPrompt(model="gpt", prompt=f"p{i}") for i in range(20)]
+    client = SlowClient(fail_on="p0")
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        Orchestrator({"gpt": client}, max_concurrency=2).run(batch)
+    assert client.calls < 20 and client.active == 0
+    client = SlowClient(fail_on="p0")
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        asyncio.run(Orchestrator({"gpt": client}, max_concurrency=2).arun(batch))
+    assert client.calls < 20
@@ -0,0 +1,46 @@
+import itertools
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from logos_engine import m_gate
+from logos_engine.m_gate_batch import accept_batch, gate_amendments, metrics_batch
+from logos_engine.se import estimate_se, normalize_se
+
+RULES = [{"id": f"R-{i}"} for i in range(4)]
+
+
+def amendments():
+    keys = [("parent_ids", ["R-1", "R-2"]), ("procedure_id", "P-1"), ("evidence", ["e"])]
+    out = []
+    for mask in itertools.product([False, True], repeat=3):
+        a = {"id": f"A-{len(out)}", "content_delta": {"effect": "x" * len(out)}}
+        a.update({k: v for (k, v), on in zip(keys, mask) if on})
+        out.append(a)
+    return out
+
+
+def test_metrics_match_scalar_functions():
+    batch = amendments()
+    m = metrics_batch(batch, RULES)
+    assert m["TR"].tolist() == [m_gate.traceability_score(a, RULES) for a in batch]
+    assert m["BR"].tolist() == [m_gate.blast_radius(a, RULES) for a in batch]
+    assert m["C"].tolist() == [1.0 - normalize_se(estimate_se(a, RULES)) for a in batch]
+
+
+def test_accept_matrix_matches_scalar_accept():
+    batch = amendments()
+    sweep = [(c, t, b) for c in (0.3, 0.5, 0.7) for t in (0.7, 0.9) for b in (0.4, 0.5)]
+    ok, metrics = gate_amendments(batch, RULES, sweep)
+    assert ok.shape == (len(sweep), len(batch))
+    for k, (tc, tt, tb) in enumerate(sweep):
+        for j, a in enumerate(batch):
+            expected, _ = m_gate.accept(metrics["C"][j], metrics["TR"][j], metrics["BR"][j], tc, tt, tb)
+            assert ok[k, j] == expected
+
+
+def test_single_threshold_dict_returns_vector():
+    ok, metrics = accept_batch([0.9, 0.1], [0.9, 0.9], [0.1, 0.1],
+                               {"coherence": 0.5, "traceability": 0.5, "blast_radius": 0.5})
+    assert ok.tolist() == [True, False]
+    assert metrics["θC"].tolist() == [0.5]
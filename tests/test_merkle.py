@@ -0,0 +1,92 @@
+import hashlib
+
+import pytest
+
+from logos_engine.merkle import MerkleLog, merkle_root, verify_inclusion
+from logos_engine.store import Ledger
+from logos_engine.types import hash_record
+
+
+def digests(n):
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+
+
+def test_stored_tree_matches_reference_and_proofs_verify(tmp_path):
+    hs = digests(70)
+    log = MerkleLog(str(tmp_path / "m.db"))
+    assert log.add(0, hs[:13]) and log.add(13, hs[13:])
+    assert not log.add(5, hs[:1])  # must continue the tree
+    for size in (1, 2, 3, 7, 8, 9, 33, 64, 70):
+        root = log.root(size)
+        assert root == merkle_root(hs[:size])
+        for i in range(size):
+            path = log.proof(i, size)
+            assert len(path) <= size.bit_length()
+            assert verify_inclusion(hs[i], i, size, path, root)
+            assert not verify_inclusion(hs[(i + 1) % 70], i, size, path, root)
+            if path:
+                assert not verify_inclusion(hs[i], i, size, path[:-1] + ["00" * 32], root)
+
+
+def test_tree_survives_reopen(tmp_path):
+    hs = digests(11)
+    log = MerkleLog(str(tmp_path / "m.db"))
+    log.add(0, hs[:6])
+    log.close()
+    log = MerkleLog(str(tmp_path / "m.db"))
+    assert log.size == 6
+    log.add(6, hs[6:])
+    assert log.root() == merkle_root(hs)
+
+
+def test_ledger_checkpoints_and_inclusion_proof(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    with Ledger(path, checkpoint_every=4) as L:
+        for i in range(10):
+            L.append({"n": i})
+        with L.transaction() as tx:
+            tx.append({"n": 10})
+            tx.append({"n": 11})
+        cps = L.merkle().checkpoints()
+        assert [cp["size"] for cp in cps] == [4, 8, 12]
+        proof = L.prove(5)
+        assert proof["size"] == 12
+        records = list(L.records())
+        # an auditor holding only the record, the proof and the published root
+        rec = records[5]
+        assert verify_inclusion(hash_record(rec["obj"], rec["prev"]), 5, proof["size"], proof["path"], cps[-1]["root"])
+        assert cps[-1]["root"] == merkle_root([r["hash"] for r in records])
+        L.append({"n": 12})
+        with pytest.raises(ValueError):
+            L.prove(12)
+        assert L.checkpoint()["size"] == 13
+        assert verify_inclusion(records[5]["hash"], 5, 13, L.prove(5)["path"], L.merkle().root())
+
+
+def test_merkle_catches_up_on_existing_ledger(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    with Ledger(path, max_segment_records=3) as L:
+        hashes = L.append_many([{"n": i} for i in range(8)])
+    L = Ledger(path)
+    cp = L.checkpoint()
+    assert cp["size"] == 8 and cp["root"] == merkle_root(hashes)
+    proof = L.prove(2)
+    assert verify_inclusion(hashes[2], 2, 8, proof["path"], cp["root"])
+
+
+def test_merkle_over_legacy_records_without_seq(tmp_path):
+    import json
+    path = tmp_path / "ledger.jsonl"
+    prev, hashes = None, []
+    with open(path, "w") as f:
+        for i in range(3):
+            prev = hash_record({"n": i}, prev)
+            hashes.append(prev)
+            f.write(json.dumps({"ts": 0, "hash": prev, "prev": hashes[i - 1] if i else None, "obj": {"n": i}}) + "\n")
+    L = Ledger(str(path))
+    assert L.checkpoint()["size"] == 3
+    hashes += L.append_many([{"n": 3}, {"n": 4}])
+    cp = L.checkpoint()
+    assert cp["size"] == 5 and cp["root"] == merkle_root(hashes)
+    assert verify_inclusion(hashes[1], 1, 5, L.prove(1)["path"], cp["root"])
+    assert [r["seq"] for r in L.records(start_seq=2)] == [2, 3, 4]
@@ -22,3 +22,64 @@ def test_tie_breaker_is_lexicographic():
     # Ensure 'intent' exists before accessing
     assert hasattr(r, "intent")
     assert r.intent == sorted(["classify","plan"])[0]
+
+
+def test_fuser_matches_batch_fusion_at_every_prefix():
+    from llm_adapter.postprocess import Fuser
+    raws = [rc("summarize a"), rc("plan it"), rc("classify b c"), rc("summary"), rc("plan x y")]
+    fuser = Fuser()
+    for i, r in enumerate(raws, 1):
+        fuser.add(r)
+        assert fuser.result() == normalize_and_fuse(raws[:i])
+
+
+def test_fuser_reports_settled_majority():
+    from llm_adapter.postprocess import Fuser
+    fuser = Fuser(expected=5)
+    for txt in ("summarize", "summary", "plan"):
+        fuser.add(rc(txt))
+        assert not fuser.settled()
+    fuser.add(rc("summarize again"))
+    # 3 summarize vs at most 2 for anything else
+    assert fuser.settled()
+
+    # a tie would go to "classify" < "summarize", so not settled yet
+    fuser = Fuser(expected=4)
+    for txt in ("summarize", "summarize", "classify"):
+        fuser.add(rc(txt))
+    assert not fuser.settled()
+
+
+def test_lexicon_matches_original_extractor():
+    import hashlib
+    from llm_adapter.postprocess import _extract_naive_intent
+
+    def original(text):
+        t = text.strip().lower()
+        if "summarize" in t or "summary" in t:
+            intent = "summarize"
+        elif "classify" in t or "label" in t:
+            intent = "classify"
+        elif "extract" in t or "pull out" in t:
+            intent = "extract"
+        elif "plan" in t or "roadmap" in t:
+            intent = "plan"
+        else:
+            intent = "unknown"
+        return {"intent": intent, "arguments": {"tokens": len(t.split()),
+                                                "hash": hashlib.sha256(t.encode("utf-8")).hexdigest()[:12]}}
+
+    texts = ["", "   ", "Please SUMMARIZE and label this", "pull\tout the roadmap", "a plan\x1cwith\x1fodd\vspaces",
+             "  Extract: résumé  ", "ünïcode label text", "nothing to see here\n", "plan " * 2000]
+    for text in texts:
+        assert _extract_naive_intent(text) == original(text)
+
+
+def test_custom_lexicon_priority_and_default():
+    from llm_adapter.postprocess import IntentLexicon
+    lex = IntentLexicon([("refund", ("refund", "money back")), ("complaint", ("refund me", "angry"))], default="other")
+    assert lex.match("please refund me") == "refund"
+    assert lex.match("i am angry") == "complaint"
+    assert lex.match("hello") == "other"
+    out = normalize_and_fuse([rc("I am ANGRY"), rc("money back now"), rc("angry again")], lexicon=lex)
+    assert out.intent == "complaint"
@@ -0,0 +1,41 @@
+import pytest
+from openai import APIStatusError
+from llm_adapter.openai_client import OpenAIClient
+from llm_adapter.stub_server import StubServer
+
+
+def make_client(stub, **kwargs):
+    return OpenAIClient(api_key="stub-key", base_url=stub.base_url, backoff_base_s=0.01, **kwargs)
+
+
+def test_completion_round_trip_reuses_one_connection():
+    with StubServer() as stub:
+        client = make_client(stub)
+        outputs = [client.complete("gpt-4o-mini", f"summarize {i}")[0] for i in range(5)]
+        assert outputs == [f"summarize {i}" for i in range(5)]
+        assert stub.requests == 5 and stub.connections == 1
+
+
+def test_retries_honour_retry_after_then_succeed():
+    with StubServer(fail_first=2, fail_status=429, retry_after="0") as stub:
+        text, meta = make_client(stub).complete("m", "plan this")
+        assert text == "plan this" and meta["attempts"] == 3
+        assert stub.requests == 3
+
+
+def test_gives_up_after_max_retries_and_skips_non_retryable():
+    with StubServer(fail_first=10, fail_status=503) as stub:
+        with pytest.raises(APIStatusError):
+            make_client(stub, max_retries=2).complete("m", "p")
+        assert stub.requests == 3
+    with StubServer(fail_first=10, fail_status=400) as stub:
+        with pytest.raises(APIStatusError):
+            make_client(stub).complete("m", "p")
+        assert stub.requests == 1
+
+
+def test_transport_is_shared_between_instances():
+    with StubServer() as stub:
+        a, b = make_client(stub), make_client(stub)
+        assert a.http_client is b.http_client
+        assert make_client(stub, share_transport=False).http_client is not a.http_client
@@ -0,0 +1,83 @@
+import copy
+from logos_engine import se
+from logos_engine.nomics import propose, propose_many
+from logos_engine.store import Ledger
+
+from nomics_fixtures import RULES, PROCEDURES, THRESHOLDS, AMENDMENT
+
+
+def _amendments(n):
+    for i in range(n):
+        yield {"id": f"A-{i}", "parent_ids": [f"R-{1 + i % 3}"] if i % 5 else [], "status_action": "none",
+               "content_delta": {"effect": "e" * (i % 7)}, "procedure_id": "P-1" if i % 11 else "P-9",
+               "evidence": ["e"]}
+
+
+def test_propose_many_matches_sequential_propose(tmp_path):
+    thresholds = {"coherence": 0.6, "traceability": 0.5, "blast_radius": 0.5}
+    seq_rules = copy.deepcopy(RULES)
+    seq_ledger = Ledger(str(tmp_path / "seq.jsonl"))
+    expected = []
+    for a in _amendments(40):
+        ok, metrics = propose(a, seq_rules, thresholds, PROCEDURES, seq_ledger)
+        expected.append((a["id"], ok, metrics))
+
+    rules = copy.deepcopy(RULES)
+    ledger = Ledger(str(tmp_path / "batch.jsonl"))
+    got = list(propose_many(_amendments(40), rules, thresholds, PROCEDURES, ledger, chunk_size=7))
+    assert got == expected
+    assert rules == seq_rules
+    assert [r["obj"]["amendment"]["id"] for r in ledger.records()] == \
+        [r["obj"]["amendment"]["id"] for r in seq_ledger.records()]
+    assert ledger.head()[1] == seq_ledger.head()[1]
+
+
+def test_propose_many_uses_batch_adapter_and_reestimates_touched(tmp_path):
+    calls = {"batch": 0, "single": 0}
+
+    def single(a, r):
+        calls["single"] += 1
+        return 0.1
+
+    def batch(amendments, r):
+        calls["batch"] += 1
+        return [0.1] * len(amendments)
+
+    se.set_adapter(single)
+    se.set_batch_adapter(batch)
+    try:
+        same_parent = [dict(AMENDMENT, id=f"A-{i}", status_action="none") for i in range(3)]
+        out = list(propose_many(same_parent, copy.deepcopy(RULES), THRESHOLDS, PROCEDURES,
+                                Ledger(str(tmp_path / "l.jsonl"))))
+    finally:
+        se.set_adapter(se.demo_estimate_se)
+    assert [ok for _, ok, _ in out] == [True, True, True]
+    assert calls == {"batch": 1, "single": 2}
+
+
+def test_propose_many_commits_decisions_made_before_an_error(tmp_path):
+    import pytest
+    calls = [0]
+
+    def flaky(a, r):
+        calls[0] += 1
+        if calls[0] == 6:
+            raise RuntimeError("adapter down")
+        return 0.1
+
+    amendments = [dict(AMENDMENT, id=f"A-{i}", parent_ids=["R-1"], status_action="none",
+                       content_delta={"effect": f"v{i}"}) for i in range(4)]
+    rules = copy.deepcopy(RULES)
+    ledger = Ledger(str(tmp_path / "l.jsonl"))
+    se.set_adapter(flaky)
+    got = []
+    try:
+        with pytest.raises(RuntimeError):
+            for result in propose_many(amendments, rules, THRESHOLDS, PROCEDURES, ledger):
+                got.append(result)
+    finally:
+        se.set_adapter(se.demo_estimate_se)
+    # calls 1-4 are the chunk estimate; A-1 and A-2 touch R-1 again, and re-estimating A-2 fails
+    assert [(aid, ok) for aid, ok, _ in got] == [("A-0", True), ("A-1", True)]
+    assert rules[0]["effect"] == "v1"
+    assert [r["obj"]["amendment"]["id"] for r in ledger.records()] == ["A-0", "A-1"]
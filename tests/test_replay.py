@@ -0,0 +1,72 @@
+import os
+from logos_engine.nomics import apply_amendment
+from logos_engine.replay import ReplayEngine, replay_rules
+from logos_engine.store import Ledger
+
+
+BASE = [{"id": "R-1", "status": "statutory", "effect": "a"}, {"id": "R-2", "status": "statutory", "effect": "b"}]
+
+
+def amendment(i):
+    return {"id": f"A-{i}", "parent_ids": [f"R-{1 + i % 2}"], "content_delta": {"effect": f"e{i}"},
+            "status_action": "transmute_to_constitutional" if i == 3 else "none"}
+
+
+def fill(ledger, start, stop):
+    for i in range(start, stop):
+        ledger.append({"amendment": amendment(i), "metrics": {"C": 1.0}})
+
+
+def expected(n):
+    rules = [dict(r) for r in BASE]
+    for i in range(n):
+        apply_amendment(amendment(i), rules)
+    return rules
+
+
+def test_replay_matches_live_application(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    fill(ledger, 0, 10)
+    assert replay_rules(ledger, BASE) == expected(10)
+    assert BASE[0]["effect"] == "a"  # base rules are not mutated
+
+
+def test_restart_replays_only_the_tail(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    snaps = str(tmp_path / "snapshots")
+    fill(ledger, 0, 25)
+    report = ReplayEngine(ledger, BASE, snaps, snapshot_every=10).run()
+    assert report["replayed"] == 25 and report["snapshots"] == 2
+    assert len(os.listdir(snaps)) == 2
+
+    fill(ledger, 25, 30)
+    engine = ReplayEngine(ledger, BASE, snaps, snapshot_every=10)
+    report = engine.run()
+    assert report["from_seq"] == 19 and report["replayed"] == 10
+    assert engine.rules == expected(30)
+
+    fill(ledger, 30, 32)
+    assert engine.run()["replayed"] == 2
+    assert engine.rules == expected(32)
+
+
+def test_mismatched_snapshots_are_ignored(tmp_path):
+    snaps = str(tmp_path / "snapshots")
+    ledger = Ledger(str(tmp_path / "a.jsonl"))
+    fill(ledger, 0, 12)
+    ReplayEngine(ledger, BASE, snaps, snapshot_every=5).run()
+
+    # Different base rules: snapshots are not used.
+    other = [dict(r, effect="z") for r in BASE]
+    assert ReplayEngine(ledger, other, snaps).run()["from_seq"] == -1
+
+    # A different ledger: hash at the snapshot seq does not match.
+    forked = Ledger(str(tmp_path / "b.jsonl"))
+    forked.append({"amendment": amendment(99), "metrics": {}})
+    fill(forked, 1, 12)
+    engine = ReplayEngine(forked, BASE, snaps)
+    engine.run()
+    rules = [dict(r) for r in BASE]
+    for a in [amendment(99)] + [amendment(i) for i in range(1, 12)]:
+        apply_amendment(a, rules)
+    assert engine.rules == rules
@@ -0,0 +1,35 @@
+import copy
+from logos_engine.nomics import propose, validate_juridical
+from logos_engine.rulebook import RuleBook, ProcedureTable
+from logos_engine.m_gate import blast_radius
+from logos_engine.store import Ledger
+
+from nomics_fixtures import RULES, PROCEDURES, THRESHOLDS, AMENDMENT
+
+
+def test_rulebook_updates_callers_dicts_in_place():
+    rules = copy.deepcopy(RULES)
+    book = RuleBook(rules)
+    assert len(book) == 3 and "R-2" in book
+    assert book.update("R-2", {"effect": "x"}) and rules[1]["effect"] == "x"
+    assert not book.update("R-9", {"effect": "x"})
+    assert RuleBook.of(book) is book
+    assert [r["id"] for r in book] == ["R-1", "R-2", "R-3"]
+
+
+def test_propose_accepts_rulebook_and_list_alike(tmp_path):
+    as_list = copy.deepcopy(RULES)
+    book = RuleBook(copy.deepcopy(RULES))
+    r1 = propose(dict(AMENDMENT), as_list, THRESHOLDS, PROCEDURES, Ledger(str(tmp_path / "a.jsonl")))
+    r2 = propose(dict(AMENDMENT), book, THRESHOLDS, ProcedureTable(PROCEDURES), Ledger(str(tmp_path / "b.jsonl")))
+    assert r1 == r2 and r1[0]
+    assert as_list == book.to_list()
+    assert book["R-2"] == {"id": "R-2", "status": "constitutional", "effect": "new"}
+    assert blast_radius(AMENDMENT, book) == blast_radius(AMENDMENT, as_list)
+
+
+def test_validate_juridical_uses_procedure_table():
+    table = ProcedureTable(PROCEDURES)
+    assert validate_juridical(AMENDMENT, table, RULES)
+    assert not validate_juridical(dict(AMENDMENT, procedure_id="P-2"), table, RULES)
+    assert not validate_juridical(dict(AMENDMENT, procedure_id="P-9"), PROCEDURES, RULES)
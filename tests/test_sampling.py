@@ -0,0 +1,73 @@
+import itertools
+from logos_engine.sampling import completion_bounds
+from logos_engine.se_adapter_example import ensemble_estimate_se, ensemble_estimate_se_adaptive, _normalized_entropy
+from llm_adapter.adapters import simple_adapter_factory
+from llm_adapter.postprocess import interpretations_to_entropy, _entropy_from_counts
+
+
+def brute_force_bounds(answers, remaining, entropy):
+    values = []
+    labels = sorted(set(answers)) + [f"new{i}" for i in range(remaining)]
+    for rest in itertools.product(labels, repeat=remaining):
+        freq = {}
+        for a in list(answers) + list(rest):
+            freq[a] = freq.get(a, 0) + 1
+        values.append(entropy(list(freq.values())))
+    return min(values), max(values)
+
+
+def test_completion_bounds_match_brute_force():
+    for answers in (["a"], ["a", "a", "b"], ["a", "b", "c"], ["a", "a", "b", "b"]):
+        for remaining in range(4):
+            freq = {}
+            for a in answers:
+                freq[a] = freq.get(a, 0) + 1
+            for fn in (_normalized_entropy, _entropy_from_counts):
+                got = completion_bounds(list(freq.values()), remaining, fn)
+                assert got == brute_force_bounds(answers, remaining, fn)
+
+
+def test_adaptive_ensemble_keeps_decision_and_skips_calls():
+    skipped = 0
+    for i in range(60):
+        a = {"id": f"A-{i}", "content_delta": {"effect": f"change {i}"}, "parent_ids": ["R-1"]}
+        full = ensemble_estimate_se(a, [], num_models=9)
+        se, report = ensemble_estimate_se_adaptive(a, [], num_models=9, coherence_threshold=0.6)
+        assert (1.0 - se >= 0.6) == (1.0 - full >= 0.6)
+        assert report["bounds"][0] <= full <= report["bounds"][1]
+        if report["stopped"] == "exhausted":
+            assert se == full
+        skipped += report["skipped"]
+    assert skipped > 0
+
+
+def test_adaptive_factory_stops_early_on_unanimous_members():
+    calls = []
+
+    def member(prompt):
+        calls.append(prompt)
+        return "same"
+
+    adapter = simple_adapter_factory([member] * 7, adaptive=True, coherence_threshold=0.3, wave_size=1)
+    assert adapter({"content_delta": {"effect": "X"}}, []) == 0.0
+    # with 5 of 7 agreeing two dissenters could still push entropy to 0.86 (C < 0.3);
+    # after 6 the worst case is 0.59, so the accept bucket is settled
+    assert len(calls) == 6
+    assert adapter.stats == {"calls": 6, "skipped": 1}
+
+    exhaustive = simple_adapter_factory([member] * 3 + [lambda p: "other"] * 4, adaptive=True)
+    assert exhaustive({"content_delta": {"effect": "X"}}, []) == interpretations_to_entropy(["same"] * 3 + ["other"] * 4)
+
+
+def test_adaptive_waves_share_one_overall_deadline():
+    import threading, time
+    release = threading.Event()
+    hung = lambda p: release.wait(5) and "late"
+    adapter = simple_adapter_factory([hung] * 4, adaptive=True, min_samples=1, wave_size=1, overall_timeout_s=0.2)
+    try:
+        t0 = time.perf_counter()
+        assert adapter({"content_delta": {"effect": "X"}}, []) == 0.0
+        assert time.perf_counter() - t0 < 0.5
+        assert adapter.stats["calls"] == 4
+    finally:
+        release.set()
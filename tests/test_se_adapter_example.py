@@ -0,0 +1,13 @@
+import pytest
+from logos_engine.se_adapter_example import ensemble_estimate_se
+
+
+def test_batch_ensemble_matches_scalar():
+    pytest.importorskip("numpy")
+    from logos_engine.se_adapter_example import ensemble_estimate_se_batch
+    amendments = [{"id": f"A-{i}", "content_delta": {"effect": "x" * (i % 4), "intent": i % 3} if i % 5 else {}}
+                  for i in range(300)]
+    for num_models in (0, 1, 2, 3, 7, 11):
+        want = [ensemble_estimate_se(a, [], num_models) for a in amendments]
+        assert ensemble_estimate_se_batch(amendments, [], num_models) == want
+    assert ensemble_estimate_se_batch([], []) == []
@@ -0,0 +1,47 @@
+import asyncio, copy, threading, time
+from logos_engine import se
+from logos_engine.nomics import propose, propose_async
+from logos_engine.store import Ledger
+
+from nomics_fixtures import RULES, PROCEDURES, STRICT_THRESHOLDS as THRESHOLDS, amendment
+
+
+def test_async_adapter_runs_concurrently(tmp_path):
+    async def slow_adapter(a, rules):
+        await asyncio.sleep(0.05)
+        return 0.2
+
+    async def run():
+        ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+        return await asyncio.gather(*(propose_async(amendment(i), RULES, THRESHOLDS, PROCEDURES, ledger)
+                                      for i in range(20))), ledger
+
+    se.set_async_adapter(slow_adapter)
+    try:
+        t0 = time.perf_counter()
+        results, ledger = asyncio.run(run())
+        elapsed = time.perf_counter() - t0
+    finally:
+        se.set_adapter(se.demo_estimate_se)
+    assert elapsed < 0.5
+    assert all(ok for ok, _ in results)
+    assert ledger.head()[1] == 19 and ledger.verify(workers=1)[0]
+
+
+def test_sync_adapter_bridged_through_executor(tmp_path):
+    threads = set()
+
+    def adapter(a, rules):
+        threads.add(threading.get_ident())
+        return se.demo_estimate_se(a, rules)
+
+    se.set_adapter(adapter)
+    try:
+        got = asyncio.run(propose_async(amendment(3), copy.deepcopy(RULES), THRESHOLDS, PROCEDURES,
+                                        Ledger(str(tmp_path / "a.jsonl"))))
+        expected = propose(amendment(3), copy.deepcopy(RULES), THRESHOLDS, PROCEDURES,
+                           Ledger(str(tmp_path / "b.jsonl")))
+    finally:
+        se.set_adapter(se.demo_estimate_se)
+    assert got == expected
+    assert threading.get_ident() in threads and len(threads) == 2
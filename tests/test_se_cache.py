@@ -0,0 +1,72 @@
+from logos_engine import se
+from logos_engine.se_cache import SECache
+
+A = {"id": "A-1", "parent_ids": ["R-1"], "content_delta": {"effect": "Change X"}}
+
+
+def counting_adapter(calls):
+    def adapter(amendment, rules):
+        calls.append(amendment["id"])
+        return 0.25
+    return adapter
+
+
+def test_cache_hits_identical_delta_and_respects_rules_version():
+    calls = []
+    cache = SECache()
+    se.set_adapter(counting_adapter(calls))
+    se.set_cache(cache)
+    try:
+        assert se.estimate_se(A, []) == 0.25
+        assert se.estimate_se(dict(A, id="A-2"), []) == 0.25  # same factoids + parents
+        assert calls == ["A-1"]
+        cache.rules_version = "1"
+        se.estimate_se(A, [])
+        assert calls == ["A-1", "A-1"]
+        assert se.estimate_se_many([A, dict(A, content_delta={"intent": "y"})], []) == [0.25, 0.25]
+        assert len(calls) == 3
+    finally:
+        se.set_cache(None)
+        se.set_adapter(se.demo_estimate_se)
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 3
+
+
+def test_lru_eviction_and_ttl():
+    cache = SECache(max_entries=2, ttl_s=60)
+    for k in ("a", "b", "c"):
+        cache.put(k, 0.1)
+    assert cache.get("a") is None and cache.get("c") == 0.1
+    assert cache.evictions == 1
+    expired = SECache(ttl_s=0)
+    expired.put("a", 0.1)
+    assert expired.get("a") is None
+
+
+def test_sqlite_tier_persists(tmp_path):
+    db = str(tmp_path / "se.sqlite")
+    first = SECache(db_path=db)
+    first.put(first.key(A), 0.4)
+    first.close()
+    second = SECache(db_path=db)
+    assert second.get(second.key(A)) == 0.4
+    assert second.stats()["disk_hits"] == 1
+    assert second.get(second.key(A)) == 0.4
+    assert second.stats()["hits"] == 1
+
+
+def test_sqlite_tier_is_bounded(tmp_path):
+    import sqlite3
+    db = str(tmp_path / "se.sqlite")
+    cache = SECache(max_entries=4, db_path=db, max_disk_entries=64)
+    for i in range(65):
+        cache.put(f"k{i}", 0.1)
+    # one over the limit: evict the oldest 1 + 64 // 64
+    assert cache.stats()["disk_evictions"] == 2
+    assert cache.get("k0") is None and cache.get("k2") == 0.1
+    cache.close()
+    rows = lambda: sqlite3.connect(db).execute("SELECT COUNT(*) FROM se_cache").fetchone()[0]
+    assert rows() == 63
+
+    expiring = SECache(db_path=db, ttl_s=0)
+    assert expiring.get("k5") is None and rows() == 62  # expired rows are deleted on read
+    assert expiring.prune() == 62 and rows() == 0
@@ -0,0 +1,390 @@
+import json
+import os
+import pytest
+from logos_engine.store import Ledger
+from logos_engine.types import hash_record
+
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_append_chains_hashes(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    assert ledger.head() == (None, -1)
+    h1 = ledger.append({"n": 1})
+    h2 = ledger.append({"n": 2})
+    recs = read_records(ledger.path)
+    assert [r["seq"] for r in recs] == [0, 1]
+    assert recs[1]["prev"] == h1
+    assert h2 == hash_record({"n": 2}, h1)
+    assert ledger.head() == (h2, 1)
+
+
+def test_head_recovered_on_reopen(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(path)
+    for i in range(5):
+        h = ledger.append({"n": i})
+    assert Ledger(path).head() == (h, 4)
+
+
+def test_sidecar_is_written_on_close(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    for i in range(3):
+        h = ledger.append({"n": i})
+    with open(ledger.head_path) as f:
+        assert json.load(f)["seq"] == -1  # not rewritten per append
+    assert Ledger(ledger.path).head() == (h, 2)  # recovered from the tail
+    ledger.close()
+    with open(ledger.head_path) as f:
+        side = json.load(f)
+    assert (side["hash"], side["seq"], side["size"]) == (h, 2, os.path.getsize(ledger.path))
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "binary"])
+def test_torn_last_record_is_cut_on_open(tmp_path, fmt):
+    path = str(tmp_path / "ledger")
+    with Ledger(path, format=fmt) as ledger:
+        hashes = ledger.append_many({"n": i} for i in range(3))
+        torn = ledger._encode({"n": 3}, hashes[-1], 3)[1]
+    with open(path, "ab") as f:  # crash halfway through the next write
+        f.write(torn[:len(torn) // 2])
+    reopened = Ledger(path)
+    assert reopened.head() == (hashes[-1], 2)
+    h = reopened.append({"n": 3})
+    assert [r["hash"] for r in reopened.records()] == hashes + [h]
+    assert reopened.verify(workers=1)[0]
+
+
+def test_last_line_without_newline_is_kept(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with Ledger(str(path)) as ledger:
+        h = ledger.append({"n": 0})
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+    ledger = Ledger(str(path))
+    assert ledger.head() == (h, 0)
+    ledger.append({"n": 1})
+    assert [r["seq"] for r in read_records(path)] == [0, 1]
+
+
+def test_corrupted_or_stale_sidecar_is_rebuilt(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(path)
+    ledger.append({"n": 0})
+    h = ledger.append({"n": 1})
+    with open(ledger.head_path, "w") as f:
+        f.write("{not json")
+    assert Ledger(path).head() == (h, 1)
+    with open(ledger.head_path, "w") as f:
+        json.dump({"hash": "stale", "seq": 0, "size": 1}, f)
+    assert Ledger(path).head() == (h, 1)
+
+
+def test_legacy_records_without_seq(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    prev = None
+    with open(path, "w") as f:
+        for i in range(3):
+            h = hash_record({"n": i}, prev)
+            f.write(json.dumps({"ts": 0, "hash": h, "prev": prev, "obj": {"n": i}}) + "\n")
+            prev = h
+    ledger = Ledger(str(path))
+    assert ledger.head() == (prev, 2)
+    ledger.append({"n": 3})
+    assert read_records(path)[-1]["seq"] == 3
+
+
+def test_external_append_is_noticed(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    a, b = Ledger(path), Ledger(path)
+    a.append({"n": 0})
+    h = b.append({"n": 1})
+    recs = read_records(path)
+    assert recs[1]["prev"] == recs[0]["hash"]
+    assert a.head() == (h, 1)
+
+
+def test_append_many_matches_sequential_appends(tmp_path):
+    objs = [{"n": i} for i in range(10)]
+    seq_ledger = Ledger(str(tmp_path / "a.jsonl"))
+    expected = [seq_ledger.append(o) for o in objs]
+    for policy in ("none", "record", "batch", "interval"):
+        with Ledger(str(tmp_path / f"{policy}.jsonl"), fsync=policy) as ledger:
+            assert ledger.append_many(objs) == expected
+            assert ledger.head() == (expected[-1], 9)
+
+
+def test_interval_policy_syncs_a_burst_after_the_interval(tmp_path):
+    import time
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"), fsync="interval", fsync_interval_ms=50)
+    synced = []
+    real = ledger._fsync
+    ledger._fsync = lambda f: (synced.append(time.monotonic()), real(f))
+    ledger._last_sync = time.monotonic()
+    ledger.append_many([{"n": 0}, {"n": 1}])
+    ledger.append({"n": 2})
+    assert synced == []  # inside the interval: deferred, not skipped
+    time.sleep(0.3)
+    assert len(synced) == 1  # the idle burst was synced by the timer
+    ledger.close()
+
+
+def test_transaction_commits_in_groups_and_rolls_back(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    with ledger.transaction(group_size=3) as tx:
+        hashes = [tx.append({"n": i}) for i in range(7)]
+        assert ledger.head()[1] == 5
+    assert ledger.head() == (hashes[-1], 6)
+    try:
+        with ledger.transaction() as tx:
+            tx.append({"n": "lost"})
+            raise KeyError("boom")
+    except KeyError:
+        pass
+    assert ledger.head() == (hashes[-1], 6)
+    assert len(read_records(ledger.path)) == 7
+
+
+def test_verify_parallel_and_reports_first_broken_record(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    ledger.append_many({"n": i, "pad": "x" * 50} for i in range(200))
+    ok, metrics = ledger.verify(workers=2, min_range_bytes=1024)
+    assert ok and metrics["records"] == 200 and metrics["ranges"] > 1
+    assert metrics["first_error"] is None
+
+    with open(ledger.path, "rb") as f:
+        lines = f.readlines()
+    offset = sum(len(line) for line in lines[:150])
+    lines[150] = lines[150].replace(b'"n": 150', b'"n": 999')
+    with open(ledger.path, "wb") as f:
+        f.writelines(lines)
+    ok, metrics = ledger.verify(workers=2, min_range_bytes=1024)
+    assert not ok
+    assert metrics["first_error"] == {"segment": "ledger.jsonl", "offset": offset, "seq": 150, "reason": "hash mismatch"}
+
+
+def test_verify_detects_removed_record(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.jsonl"))
+    ledger.append_many({"n": i} for i in range(5))
+    with open(ledger.path, "rb") as f:
+        lines = f.readlines()
+    with open(ledger.path, "wb") as f:
+        f.writelines(lines[:2] + lines[3:])
+    ok, metrics = Ledger(ledger.path).verify(workers=1)
+    assert not ok and metrics["first_error"]["seq"] == 3
+    assert metrics["first_error"]["reason"] == "prev link broken"
+
+
+def test_rotation_by_record_count_with_manifest(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(path, max_segment_records=4)
+    hashes = [ledger.append({"n": i}) for i in range(10)]
+    assert [(e["first_seq"], e["last_seq"]) for e in ledger.segments] == [(0, 3), (4, 7)]
+    assert ledger.segments[1]["first_prev"] == ledger.segments[0]["last_hash"] == hashes[3]
+    assert len(read_records(path)) == 2
+    assert [r["seq"] for r in ledger.records(start_seq=6)] == [6, 7, 8, 9]
+    ok, metrics = ledger.verify(workers=1)
+    assert ok and metrics["records"] == 10
+
+
+def test_rotation_by_size_compressed_and_reopen(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(path, max_segment_bytes=300, compress_sealed=True)
+    hashes = ledger.append_many({"n": i, "pad": "x" * 100} for i in range(3))
+    assert ledger.segments[0]["file"] == "ledger.jsonl.000001.gz"
+    assert (tmp_path / "ledger.jsonl").stat().st_size == 0
+    reopened = Ledger(path)
+    assert reopened.head() == (hashes[-1], 2)
+    h = reopened.append({"n": 3})
+    assert [r["hash"] for r in reopened.records()] == hashes + [h]
+    assert reopened.verify(workers=1)[0]
+
+
+def test_interrupted_seal_is_finished_on_open(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(path)
+    h = ledger.append({"n": 0})
+    # simulate a crash after the manifest was written but before the move
+    ledger.segments.append({"file": "ledger.jsonl.000001", "first_seq": 0, "last_seq": 0, "first_prev": None,
+                            "first_hash": h, "last_hash": h, "records": 1, "bytes": 0, "compressed": False})
+    ledger._write_manifest()
+    reopened = Ledger(path)
+    assert (tmp_path / "ledger.jsonl.000001").exists()
+    assert reopened.head() == (h, 0)
+    assert reopened.verify(workers=1)[0]
+
+
+def test_interrupted_compressed_seal_truncates_active_file(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(path, compress_sealed=True)
+    hashes = ledger.append_many({"n": i} for i in range(4))
+    with open(path, "rb") as f:
+        active = f.read()
+    ledger.rotate()
+    # simulate a crash after the .gz was moved into place but before truncation
+    with open(path, "wb") as f:
+        f.write(active)
+    reopened = Ledger(path, compress_sealed=True)
+    assert os.path.getsize(path) == 0
+    assert reopened.head() == (hashes[-1], 3)
+    assert [r["seq"] for r in reopened.records()] == [0, 1, 2, 3]
+    h = reopened.append({"n": 4})
+    assert reopened.verify(workers=1)[0] and reopened.head() == (h, 4)
+
+
+def test_ledger_line_embeds_canonical_obj(tmp_path):
+    from logos_engine.types import canonical_json
+    L = Ledger(str(tmp_path / "ledger.jsonl"))
+    obj = {"b": {"y": 2, "x": 1}, "a": "é"}
+    L.append(obj)
+    L.close()
+    line = (tmp_path / "ledger.jsonl").read_text().strip()
+    rec = json.loads(line)
+    assert rec["obj"] == obj
+    assert line.endswith('"obj": ' + canonical_json(obj) + "}")
+    assert L.verify()[0]
+
+
+def audit_obj(i):
+    return {"amendment": {"id": f"A-{i}", "parent_ids": [f"R-{i % 3}"],
+                          "status_action": "transmute_to_constitutional" if i % 4 == 0 else "none"},
+            "metrics": {"C": 0.9}}
+
+
+def test_find_by_amendment_rule_and_status(tmp_path):
+    L = Ledger(str(tmp_path / "ledger.jsonl"), index=True)
+    L.append_many([audit_obj(i) for i in range(20)])
+    assert [r["seq"] for r in L.find(amendment_id="A-7")] == [7]
+    assert [r["seq"] for r in L.find(rule_id="R-1")] == [i for i in range(20) if i % 3 == 1]
+    both = L.find(rule_id="R-0", status_action="transmute_to_constitutional")
+    assert [r["seq"] for r in both] == [0, 12]
+    assert L.find(amendment_id="A-99") == []
+    with pytest.raises(ValueError):
+        L.find()
+
+
+def test_find_across_rotated_segments_and_rebuilt_index(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    with Ledger(path, index=True, max_segment_records=5, compress_sealed=True) as L:
+        for i in range(23):
+            L.append(audit_obj(i))
+        assert [r["seq"] for r in L.find(rule_id="R-2")] == [i for i in range(23) if i % 3 == 2]
+    os.remove(path + ".index")
+    # a ledger opened without index=True catches up on the first query
+    L = Ledger(path, max_segment_records=5)
+    L.append(audit_obj(23))
+    assert [r["seq"] for r in L.find(amendment_id="A-23")] == [23]
+    assert [r["seq"] for r in L.find(amendment_id="A-3")] == [3]
+
+
+def test_find_rebuilds_stale_index(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+    L = Ledger(path)
+    L.append_many([audit_obj(i) for i in range(6)])
+    assert len(L.find(rule_id="R-0")) == 2
+    L.close()
+    lines = open(path, "rb").readlines()
+    with open(path, "wb") as f:  # rewrite the file under the index, same length
+        f.writelines(lines[3:] + lines[:3])
+    assert [r["obj"]["amendment"]["id"] for r in L.find(rule_id="R-0")] == ["A-3", "A-0"]
+
+
+def test_find_with_non_string_ids(tmp_path):
+    L = Ledger(str(tmp_path / "ledger.jsonl"))
+    L.append_many([{"amendment": {"id": 42, "parent_ids": [7]}}, {"amendment": {"id": "42"}}])
+    assert [r["seq"] for r in L.find(amendment_id=42)] == [0, 1]
+    assert [r["seq"] for r in L.find(rule_id=7)] == [0]
+
+
+def test_binary_ledger_roundtrip_and_hashes(tmp_path):
+    path = str(tmp_path / "ledger.bin")
+    with Ledger(path, format="binary", compress_payload=True) as L:
+        h0 = L.append({"n": 0})
+        hashes = L.append_many([audit_obj(i) for i in range(1, 6)])
+    assert h0 == hash_record({"n": 0}, None)
+    assert hashes[0] == hash_record(audit_obj(1), h0)
+    L = Ledger(path)  # format detected
+    assert L.format == "binary"
+    assert L.head() == (hashes[-1], 5)
+    recs = list(L.records())
+    assert [r["obj"] for r in recs] == [{"n": 0}] + [audit_obj(i) for i in range(1, 6)]
+    assert recs[2]["prev"] == hashes[0]
+    assert L.verify()[0]
+    assert [r["seq"] for r in L.find(rule_id="R-1")] == [1, 4]
+    with pytest.raises(ValueError):
+        Ledger(path, format="jsonl")
+
+
+def test_binary_verify_detects_tampering(tmp_path):
+    path = str(tmp_path / "ledger.bin")
+    with Ledger(path, format="binary") as L:
+        L.append_many([{"n": i, "pad": "abcdef"} for i in range(4)])
+    data = bytearray(open(path, "rb").read())
+    data[data.rindex(b"abcdef")] = ord("X")
+    open(path, "wb").write(bytes(data))
+    ok, m = Ledger(path).verify()
+    assert not ok and m["first_error"]["reason"] == "hash mismatch" and m["first_error"]["seq"] == 3
+
+
+def test_binary_verify_splits_into_frame_aligned_ranges(tmp_path):
+    path = str(tmp_path / "ledger.bin")
+    with Ledger(path, format="binary") as L:
+        L.append_many({"n": i, "pad": "abcdef" * (i % 7)} for i in range(300))
+    ok, m = Ledger(path).verify(workers=2, min_range_bytes=1024)
+    assert ok and m["records"] == 300 and m["ranges"] > 1
+    data = bytearray(open(path, "rb").read())
+    data[data.index(b'"n": 200') + 6] = ord("9")
+    open(path, "wb").write(bytes(data))
+    ok, m = Ledger(path).verify(workers=2, min_range_bytes=1024)
+    assert not ok and m["first_error"]["reason"] == "hash mismatch" and m["first_error"]["seq"] == 200
+
+
+def test_binary_segments(tmp_path):
+    path = str(tmp_path / "ledger.bin")
+    with Ledger(path, format="binary", max_segment_records=4, compress_sealed=True) as L:
+        for i in range(10):
+            L.append(audit_obj(i))
+        assert [r["seq"] for r in L.records(start_seq=6)] == [6, 7, 8, 9]
+        assert L.verify()[0]
+        assert [r["seq"] for r in L.find(amendment_id="A-5")] == [5]
+
+
+def test_convert_ledger_preserves_hashes(tmp_path):
+    from logos_engine.store import convert_ledger
+    src = str(tmp_path / "ledger.jsonl")
+    with Ledger(src, max_segment_records=3) as L:
+        L.append_many([audit_obj(i) for i in range(8)])
+    binary = str(tmp_path / "ledger.bin")
+    stats = convert_ledger(src, binary, "binary")
+    assert stats["records"] == 8 and stats["bytes_out"] < stats["bytes_in"]
+    B = Ledger(binary)
+    assert B.format == "binary" and B.head() == Ledger(src).head() and B.verify()[0]
+    back = str(tmp_path / "back.jsonl")
+    convert_ledger(binary, back, "jsonl")
+    assert list(Ledger(back).records()) == list(Ledger(src).records())
+    with pytest.raises(ValueError):
+        convert_ledger(src, back, "jsonl")
+
+
+def test_convert_ledger_rejects_missing_source_and_drops_stale_side_stores(tmp_path):
+    from logos_engine.store import convert_ledger
+    missing = str(tmp_path / "missing.jsonl")
+    with pytest.raises(FileNotFoundError):
+        convert_ledger(missing, str(tmp_path / "out.jsonl"), "jsonl")
+    assert not os.path.exists(missing) and not os.path.exists(missing + ".head")
+
+    dst = str(tmp_path / "out.bin")
+    with Ledger(dst) as old:  # a previous ledger at dst left a Merkle log behind
+        old.append({"stale": True})
+        old.checkpoint()
+    os.remove(dst)
+    src = str(tmp_path / "ledger.jsonl")
+    with Ledger(src) as L:
+        hashes = L.append_many([audit_obj(i) for i in range(3)])
+    convert_ledger(src, dst, "binary")
+    assert not os.path.exists(dst + ".merkle")
+    with Ledger(dst) as B:
+        from logos_engine.merkle import merkle_root
+        assert B.checkpoint()["root"] == merkle_root(hashes)
@@ -0,0 +1,47 @@
+import hashlib
+import json
+
+import pytest
+
+from logos_engine.types import hash_record, process_batch, iter_process_batch
+
+
+def records(n):
+    return ({"id": f"A-{i}", "content_delta": {"effect": "x" * (i % 7)}} for i in range(n))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_process_batch_matches_process_batch(workers):
+    for n, batch_size in ((0, 2), (1, 2), (9, 2), (50, 7)):
+        want = process_batch(list(records(n)), batch_size=batch_size)
+        got = list(iter_process_batch(records(n), batch_size=batch_size, workers=workers, chunk_slices=3, max_pending=2))
+        assert got == want
+
+
+def test_iter_process_batch_is_lazy():
+    seen = []
+
+    def source():
+        for i in range(1000):
+            seen.append(i)
+            yield {"n": i}
+
+    first = next(iter_process_batch(source(), batch_size=2, workers=1, chunk_slices=4))
+    assert first["batch"] == [{"n": 0}, {"n": 1}]
+    assert len(seen) <= 9
+
+
+def test_iter_process_batch_validates_interpretation_up_front():
+    with pytest.raises(ValueError, match="intent"):
+        iter_process_batch(records(3), interpretation={"arguments": {}})
+    with pytest.raises(ValueError):
+        iter_process_batch(records(3), batch_size=0)
+
+
+def test_hash_record_matches_original_encoding():
+    objs = [{}, {"b": 1, "a": [3, {"z": None, "y": 1.5}]}, {"é": "✓\n\"q\"", "n": -0.0, "big": 10**30},
+            {"content_delta": {"effect": "x" * 1000, "nested": {"k%d" % i: i for i in range(50)}}}]
+    for obj in objs:
+        for prev in (None, "ab" * 32, "prév"):
+            want = hashlib.sha256(json.dumps({"obj": obj, "prev": prev}, sort_keys=True).encode("utf-8")).hexdigest()
+            assert hash_record(obj, prev) == want